@@ -166,7 +166,9 @@ class ModalCategory(BasePlugin):
         mode_result[counts < minimum_significant_count] = (
             self.code_max - self.unset_code_indicator
         )
-        return self.code_max - np.squeeze(mode_result)
+        # Reshape rather than squeeze, so that any other length one
+        # dimensions (e.g. a single row of a grid) are kept.
+        return self.code_max - mode_result.reshape(data.shape[1:])
 
     @staticmethod
     def _set_blended_times(cube: Cube) -> None:
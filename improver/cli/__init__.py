@@ -155,6 +155,34 @@ def inputcube_nolazy(to_convert):
     return maybe_coerce_with(load_cube, to_convert, no_lazy_load=True)
 
 
+@value_converter
+def inputcube_async(to_convert):
+    """Starts loading a cube from file in a background thread or returns
+    passed object.
+    Where a load is performed, it will not have lazy data, so that all of
+    the file access happens in the background thread. This allows the load
+    to overlap with other work, with the caller waiting on the returned
+    future only when the cube is needed.
+    Args:
+        to_convert (string or iris.cube.Cube):
+            File name or Cube object.
+    Returns:
+        Future of the loaded cube or passed object.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from improver.utilities.load import load_cube
+
+    obj = getattr(to_convert, "original_object", to_convert)
+    if not isinstance(obj, str):
+        return obj
+
+    executor = ThreadPoolExecutor(max_workers=1)
+    future = executor.submit(maybe_coerce_with, load_cube, obj, no_lazy_load=True)
+    executor.shutdown(wait=False)
+    return future
+
+
 @value_converter
 def inputcubelist(to_convert):
     """Loads a cubelist from file or returns passed object.
@@ -408,7 +436,8 @@ def _cli_items():
     yield ("help", improver_help)
     for minfo in pkgutil.iter_modules(improver_cli_pkg_path):
         mod_name = minfo.name
-        if mod_name != "__main__":
+        # Skip __main__ and private modules, which are not CLIs.
+        if not mod_name.startswith("_"):
             mcli = importlib.import_module("improver.cli." + mod_name)
             yield (mod_name, clizefy(mcli.process))
 
@@ -0,0 +1,134 @@
+# (C) Crown copyright, Met Office. All rights reserved.
+#
+# This file is part of IMPROVER and is released under a BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Server to run IMPROVER CLIs from a persistent interpreter.
+
+Starting Python and importing the IMPROVER dependencies can take a
+significant fraction of the run time of short CLI invocations. The server
+pays this cost once and then runs each job in a process forked from the
+warm interpreter, so jobs are isolated from each other and can run
+concurrently.
+
+Run the server with::
+
+    python -m improver.cli._server SOCKET_PATH
+
+Each connection to the Unix socket sends a single line containing a JSON job
+specification, such as::
+
+    {"cli": "generate-realizations", "args": ["in.nc", "--output", "out.nc"]}
+
+and receives a single line containing a JSON response, either
+``{"status": "ok", "result": ...}`` or ``{"status": "error", "error": ...}``.
+The args are the same as would be given on the command line, including any
+bracketed nested commands.
+"""
+
+import json
+import os
+import socketserver
+import stat
+from typing import Any, Dict
+
+
+def run_job(job: Dict[str, Any]) -> Dict[str, Any]:
+    """Run a single CLI job.
+
+    Args:
+        job:
+            Job specification, containing the name of the CLI under "cli"
+            and, optionally, a list of its command line arguments under
+            "args".
+
+    Returns:
+        Response containing the status of the job, and either the string
+        representation of the result of the CLI (None if the result was
+        written to file) or the error raised. Exits such as SystemExit and
+        KeyboardInterrupt are also returned as errors, so that the client
+        always receives a response from the process running the job.
+    """
+    from improver.cli import SUBCOMMANDS_DISPATCHER, execute_command, unbracket
+
+    try:
+        args = unbracket(job.get("args", []))
+        result = execute_command(SUBCOMMANDS_DISPATCHER, "improver", job["cli"], *args)
+    except BaseException as err:
+        return {"status": "error", "error": f"{type(err).__name__}: {err}"}
+    return {"status": "ok", "result": None if result is None else str(result)}
+
+
+class JobHandler(socketserver.StreamRequestHandler):
+    """Read a job specification from the connection, run it and write the
+    response back."""
+
+    def handle(self):
+        """Handle a single job."""
+        try:
+            job = json.loads(self.rfile.readline())
+        except ValueError as err:
+            response = {"status": "error", "error": f"Invalid job: {err}"}
+        else:
+            response = run_job(job)
+        self.wfile.write(json.dumps(response).encode() + b"\n")
+
+
+def _remove_stale_socket(socket_path: str) -> None:
+    """Remove a socket left at socket_path by a previous server.
+
+    Args:
+        socket_path:
+            Path of the Unix socket.
+
+    Raises:
+        FileExistsError: If a file other than a socket exists at socket_path.
+    """
+    try:
+        mode = os.lstat(socket_path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise FileExistsError(
+            f"Cannot create socket at {socket_path}, as a file that is not a "
+            "socket already exists there."
+        )
+    os.unlink(socket_path)
+
+
+class ForkingUnixStreamServer(socketserver.ForkingMixIn, socketserver.UnixStreamServer):
+    """Unix socket server that handles each connection in a forked process."""
+
+
+def serve(socket_path: str) -> None:
+    """Serve CLI jobs on a Unix socket until interrupted.
+
+    Args:
+        socket_path:
+            Path of the Unix socket to create. An existing socket at this
+            path is replaced.
+
+    Raises:
+        FileExistsError: If a file other than a socket exists at socket_path.
+    """
+    # Import the heavy dependencies once, so that the forked processes
+    # running each job inherit them.
+    import iris  # noqa: F401
+    import numpy  # noqa: F401
+
+    import improver.utilities.load  # noqa: F401
+    import improver.utilities.save  # noqa: F401
+
+    _remove_stale_socket(socket_path)
+    with ForkingUnixStreamServer(socket_path, JobHandler) as server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            os.unlink(socket_path)
+
+
+if __name__ == "__main__":
+    import sys
+
+    serve(sys.argv[1])
@@ -5,8 +5,97 @@
 # See LICENSE in the root of the repository for full licensing details.
 """CLI to generate modal categories over periods."""
 
+import os
+from itertools import repeat
+
 from improver import cli
 
+# Number of grid points above which the modal calculation is split into slabs
+# along the y-axis, which are processed in parallel if the IMPROVER_N_JOBS
+# environment variable is greater than 1.
+PARALLEL_GRID_POINTS = 100000
+
+
+def _modal_category(cubes, decision_tree, model_id_attr, record_run_attr):
+    """Calculate the modal category of a list of cubes. Defined at module
+    level so that it can be run in a worker process."""
+    from iris.cube import CubeList
+
+    from improver.categorical.modal_code import ModalCategory
+
+    return ModalCategory(
+        decision_tree, model_id_attr=model_id_attr, record_run_attr=record_run_attr,
+    )(CubeList(cubes))
+
+
+def _init_worker():
+    """Use the synchronous dask scheduler in worker processes. Each worker
+    processes a single slab, and the default threaded scheduler inherited
+    from the parent process can deadlock after a fork."""
+    import dask
+
+    dask.config.set(scheduler="synchronous")
+
+
+def _n_jobs():
+    """Read the number of parallel jobs from the IMPROVER_N_JOBS environment
+    variable, defaulting to 1.
+
+    Returns:
+        int:
+            The number of jobs.
+
+    Raises:
+        ValueError: If IMPROVER_N_JOBS is not a positive integer.
+    """
+    value = os.environ.get("IMPROVER_N_JOBS", "1")
+    try:
+        n_jobs = int(value)
+    except ValueError:
+        n_jobs = 0
+    if n_jobs < 1:
+        raise ValueError(f"IMPROVER_N_JOBS must be a positive integer, not {value!r}.")
+    return n_jobs
+
+
+def _y_slabs(cubes, n_slabs):
+    """Split each of the cubes into n_slabs contiguous slabs along its y-axis.
+
+    Args:
+        cubes (iris.cube.CubeList):
+            Gridded cubes with the same horizontal grid.
+        n_slabs (int):
+            The number of slabs to split each cube into.
+
+    Returns:
+        list or None:
+            A list containing, for each slab, the list of cubes sliced to
+            cover that slab. None is returned if the cubes have no y-axis
+            (e.g. spot data) or the grid has no more than
+            PARALLEL_GRID_POINTS points.
+    """
+    from iris.exceptions import CoordinateNotFoundError
+
+    try:
+        y_dims = [c.coord_dims(c.coord(axis="y", dim_coords=True))[0] for c in cubes]
+        x_coord = cubes[0].coord(axis="x", dim_coords=True)
+    except CoordinateNotFoundError:
+        return None
+    n_rows = cubes[0].shape[y_dims[0]]
+    if n_rows * len(x_coord.points) <= PARALLEL_GRID_POINTS:
+        return None
+
+    rows_per_slab = -(-n_rows // n_slabs)
+    slabs = []
+    for start in range(0, n_rows, rows_per_slab):
+        slab = []
+        for cube, y_dim in zip(cubes, y_dims):
+            index = [slice(None)] * cube.ndim
+            index[y_dim] = slice(start, start + rows_per_slab)
+            slab.append(cube[tuple(index)])
+        slabs.append(slab)
+    return slabs
+
 
 @cli.clizefy
 @cli.with_output
@@ -22,6 +111,10 @@ def process(
     of the times covered by the input files.
     Designed for use with weather symbol data.
 
+    If the IMPROVER_N_JOBS environment variable is set to more than 1 and the
+    input grid has more than 100000 points, the grid is split into slabs
+    along the y-axis which are processed in parallel.
+
     Args:
         cubes (iris.cube.CubeList):
             A cubelist containing categorical cubes that cover the period
@@ -40,11 +133,24 @@ def process(
         iris.cube.Cube:
             A cube of modal categories over a period.
     """
-    from improver.categorical.modal_code import ModalCategory
-
     if not cubes:
         raise RuntimeError("Not enough input arguments. See help for more information.")
 
-    return ModalCategory(
-        decision_tree, model_id_attr=model_id_attr, record_run_attr=record_run_attr,
-    )(cubes)
+    n_jobs = _n_jobs()
+    slabs = _y_slabs(cubes, n_jobs) if n_jobs > 1 else None
+    if slabs is None:
+        return _modal_category(cubes, decision_tree, model_id_attr, record_run_attr)
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    from iris.cube import CubeList
+
+    with ProcessPoolExecutor(max_workers=n_jobs, initializer=_init_worker) as executor:
+        results = executor.map(
+            _modal_category,
+            slabs,
+            repeat(decision_tree),
+            repeat(model_id_attr),
+            repeat(record_run_attr),
+        )
+        return CubeList(results).concatenate_cube()
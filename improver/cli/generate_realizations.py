@@ -4,14 +4,51 @@
 # See LICENSE in the root of the repository for full licensing details.
 """Convert NetCDF files to realizations."""
 
+from concurrent.futures import Future
+from functools import lru_cache
+
 from improver import cli
 
 
+@lru_cache(maxsize=None)
+def _get_impls():
+    """Import the plugins used by process. The imports are deferred until
+    first use to keep CLI startup fast, and memoized so that repeated calls
+    to process within the same interpreter do not repeat them.
+
+    Returns:
+        tuple:
+            ConvertProbabilitiesToPercentiles, EnsembleReordering,
+            RebadgePercentilesAsRealizations, ResamplePercentiles and
+            is_probability.
+    """
+    from improver.ensemble_copula_coupling.ensemble_copula_coupling import (
+        ConvertProbabilitiesToPercentiles,
+        EnsembleReordering,
+        RebadgePercentilesAsRealizations,
+        ResamplePercentiles,
+    )
+    from improver.metadata.probabilistic import is_probability
+
+    return (
+        ConvertProbabilitiesToPercentiles,
+        EnsembleReordering,
+        RebadgePercentilesAsRealizations,
+        ResamplePercentiles,
+        is_probability,
+    )
+
+
+def _result(obj):
+    """Wait for obj to load if it is a Future, otherwise return it."""
+    return obj.result() if isinstance(obj, Future) else obj
+
+
 @cli.clizefy
 @cli.with_output
 def process(
-    cube: cli.inputcube,
-    raw_cube: cli.inputcube = None,
+    cube: cli.inputcube_nolazy,
+    raw_cube: cli.inputcube_async = None,
     *,
     realizations_count: int = None,
     random_seed: int = None,
@@ -22,13 +59,17 @@ def process(
 
     Args:
         cube (iris.cube.Cube):
-            A cube to be processed.
+            A cube to be processed. The cube is loaded in full before the
+            background load of the raw cube starts, as netCDF reads are not
+            thread-safe.
         raw_cube (iris.cube.Cube):
             Cube of raw (not post processed) weather data.
             If this argument is given ensemble realizations will be created
             from percentiles by reshuffling them in correspondence to the rank
             order of the raw ensemble. Otherwise, the percentiles are rebadged
             as realizations.
+            The raw cube is loaded in the background while the percentiles
+            are generated.
         realizations_count (int):
             The number of ensemble realizations in the output.
         random_seed (int):
@@ -54,21 +95,34 @@ def process(
         iris.cube.Cube:
             The processed cube.
     """
-    from improver.ensemble_copula_coupling.ensemble_copula_coupling import (
+    (
         ConvertProbabilitiesToPercentiles,
         EnsembleReordering,
         RebadgePercentilesAsRealizations,
         ResamplePercentiles,
-    )
-    from improver.metadata.probabilistic import is_probability
+        is_probability,
+    ) = _get_impls()
 
-    if cube.coords("realization"):
+    coord_names = {coord.name() for coord in cube.coords()}
+    if "realization" in coord_names:
+        # Wait for any background load, so that its errors are raised and its
+        # thread does not outlive the call.
+        _result(raw_cube)
         return cube
 
-    if not cube.coords("percentile") and not is_probability(cube):
+    # Plugins used to generate percentiles, keyed on whether the cube has a
+    # percentile coordinate and whether it is a probability cube.
+    percentile_plugins = {
+        (True, False): ResamplePercentiles,
+        (True, True): ResamplePercentiles,
+        (False, True): ConvertProbabilitiesToPercentiles,
+    }
+    key = ("percentile" in coord_names, is_probability(cube))
+    if key not in percentile_plugins:
         raise ValueError("Unable to convert to realizations:\n" + str(cube))
 
     if realizations_count is None:
+        raw_cube = _result(raw_cube)
         try:
             realizations_count = len(raw_cube.coord("realization").points)
         except AttributeError:
@@ -76,17 +130,12 @@ def process(
             msg = "Either realizations_count or raw_cube must be provided"
             raise ValueError(msg)
 
-    if cube.coords("percentile"):
-        percentiles = ResamplePercentiles(
-            ecc_bounds_warning=ignore_ecc_bounds_exceedance,
-            skip_ecc_bounds=skip_ecc_bounds,
-        )(cube, no_of_percentiles=realizations_count)
-    else:
-        percentiles = ConvertProbabilitiesToPercentiles(
-            ecc_bounds_warning=ignore_ecc_bounds_exceedance,
-            skip_ecc_bounds=skip_ecc_bounds,
-        )(cube, no_of_percentiles=realizations_count)
+    percentiles = percentile_plugins[key](
+        ecc_bounds_warning=ignore_ecc_bounds_exceedance,
+        skip_ecc_bounds=skip_ecc_bounds,
+    )(cube, no_of_percentiles=realizations_count)
 
+    raw_cube = _result(raw_cube)
     if raw_cube:
         result = EnsembleReordering()(percentiles, raw_cube, random_seed=random_seed)
     else:
@@ -6,8 +6,10 @@
 This module defines the plugins required for Ensemble Copula Coupling.
 
 """
+import hashlib
 import warnings
-from typing import List, Optional, Tuple
+from collections import OrderedDict
+from typing import Hashable, List, Optional, Tuple
 
 import iris
 import numpy as np
@@ -1285,6 +1287,82 @@ class ConvertLocationAndScaleParametersToProbabilities(
         return probability_cube
 
 
+# Rankings of raw ensembles recently used by EnsembleReordering, keyed on the
+# raw data and random seed. Only rankings that do not depend on the random
+# data used to split ties are cached. The least recently used rankings are
+# evicted to keep the total size of the cache within _RANKING_CACHE_MAX_BYTES,
+# and raw data with a ranking larger than this is neither hashed nor cached.
+_RANKING_CACHE_MAX_BYTES = 32 * 2**20
+_RANKING_CACHE = OrderedDict()
+
+
+def _ranking_cacheable(raw_data: ndarray) -> bool:
+    """Check whether the ranking of the raw data is small enough to cache.
+
+    Args:
+        raw_data:
+            Raw forecast data, with the realizations as the leading dimension.
+
+    Returns:
+        True if the ranking fits within the ranking cache.
+    """
+    return raw_data.size * np.dtype(np.intp).itemsize <= _RANKING_CACHE_MAX_BYTES
+
+
+def _cache_ranking(cache_key: Hashable, ranking: ndarray) -> None:
+    """Add a ranking to the ranking cache, evicting the least recently used
+    rankings until the cache is within _RANKING_CACHE_MAX_BYTES.
+
+    Args:
+        cache_key:
+            Key identifying the raw data and random seed of the ranking.
+        ranking:
+            The ranking of the raw data, which is made read-only.
+    """
+    ranking.setflags(write=False)
+    _RANKING_CACHE[cache_key] = ranking
+    total_bytes = sum(cached.nbytes for cached in _RANKING_CACHE.values())
+    while total_bytes > _RANKING_CACHE_MAX_BYTES:
+        _, evicted = _RANKING_CACHE.popitem(last=False)
+        total_bytes -= evicted.nbytes
+
+
+def _ranking_cache_key(raw_data: ndarray, random_seed: Optional[int]) -> Hashable:
+    """Create a key identifying the ranking of the raw data for a given
+    random seed.
+
+    Args:
+        raw_data:
+            Raw forecast data, with the realizations as the leading dimension.
+        random_seed:
+            The random seed used to split tied values.
+
+    Returns:
+        A key for the ranking cache.
+    """
+    digest = hashlib.blake2b(np.ascontiguousarray(np.ma.getdata(raw_data)))
+    mask = np.ma.getmask(raw_data)
+    if mask is not np.ma.nomask:
+        digest.update(np.ascontiguousarray(mask))
+    return (raw_data.shape, raw_data.dtype.str, random_seed, digest.hexdigest())
+
+
+def _has_ties(raw_data: ndarray, sorting_index: ndarray) -> bool:
+    """Check whether any point has tied values within the raw ensemble.
+
+    Args:
+        raw_data:
+            Raw forecast data, with the realizations as the leading dimension.
+        sorting_index:
+            Indices that sort the raw data along the leading dimension.
+
+    Returns:
+        True if any realizations have the same value at the same point.
+    """
+    sorted_data = np.take_along_axis(np.ma.getdata(raw_data), sorting_index, axis=0)
+    return bool(np.any(sorted_data[1:] == sorted_data[:-1]))
+
+
 class EnsembleReordering(BasePlugin):
     """
     Plugin for applying the reordering step of Ensemble Copula Coupling,
@@ -1399,28 +1477,46 @@ class EnsembleReordering(BasePlugin):
             point, the ranking of the values within the ensemble matches
             the ranking from the raw ensemble.
         """
+        # Rankings are reused for repeated raw forecast data if they do not
+        # depend on random data, i.e. if a random seed is set or the raw
+        # forecast has no tied values.
+        cache_seed = None if random_seed is None else int(random_seed)
         results = iris.cube.CubeList([])
         for rawfc, calfc in zip(
             raw_forecast_realizations.slices_over("time"),
             post_processed_forecast_percentiles.slices_over("time"),
         ):
-            if random_seed is not None:
-                random_seed = int(random_seed)
-            random_seed = np.random.RandomState(random_seed)
-            random_data = random_seed.rand(*rawfc.data.shape)
-            if random_ordering:
-                # Returns the indices that would sort the array.
-                # As these indices are from a random dataset, only an argsort
-                # is used.
-                ranking = np.argsort(random_data, axis=0)
+            ranking = None
+            cacheable = not random_ordering and _ranking_cacheable(rawfc.data)
+            if cacheable:
+                cache_key = _ranking_cache_key(rawfc.data, cache_seed)
+                ranking = _RANKING_CACHE.get(cache_key)
+            if ranking is not None:
+                _RANKING_CACHE.move_to_end(cache_key)
             else:
-                # Lexsort returns the indices sorted firstly by the
-                # primary key, the raw forecast data (unless random_ordering
-                # is enabled), and secondly by the secondary key, an array of
-                # random data, in order to split tied values randomly.
-                sorting_index = np.lexsort((random_data, rawfc.data), axis=0)
-                # Returns the indices that would sort the array.
-                ranking = np.argsort(sorting_index, axis=0)
+                if random_seed is not None:
+                    random_seed = int(random_seed)
+                random_seed = np.random.RandomState(random_seed)
+                random_data = random_seed.rand(*rawfc.data.shape)
+                if random_ordering:
+                    # Returns the indices that would sort the array.
+                    # As these indices are from a random dataset, only an
+                    # argsort is used.
+                    ranking = np.argsort(random_data, axis=0)
+                else:
+                    # Lexsort returns the indices sorted firstly by the
+                    # primary key, the raw forecast data (unless
+                    # random_ordering is enabled), and secondly by the
+                    # secondary key, an array of random data, in order to
+                    # split tied values randomly.
+                    sorting_index = np.lexsort((random_data, rawfc.data), axis=0)
+                    # Returns the indices that would sort the array.
+                    ranking = np.argsort(sorting_index, axis=0)
+                    if cacheable and (
+                        cache_seed is not None
+                        or not _has_ties(rawfc.data, sorting_index)
+                    ):
+                        _cache_ranking(cache_key, ranking)
             # Index the post-processed forecast data using the ranking array.
             # The following uses a custom choose function that reproduces the
             # required elements of the np.choose method without the limitation
@@ -275,11 +275,32 @@ def slow_interp_same_x(x: np.ndarray, xp: np.ndarray, fp: np.ndarray) -> np.ndar
         2-D array with shape (len(fp), len(x)), with each row i equal to
             np.interp(x, xp, fp[i, :])
     """
-
-    result = np.empty((fp.shape[0], len(x)), np.float32)
-    for i in range(fp.shape[0]):
-        result[i, :] = np.interp(x, xp, fp[i, :])
-    return result
+    # As xp is shared by all rows, the interpolation indices are calculated
+    # once and applied to every row together. This follows the arithmetic of
+    # np.interp: the lower index is the last for which xp <= x, x on a knot or
+    # beyond the ends of xp takes the value of fp there, and NaN x gives NaN.
+    x = np.asarray(x, dtype=np.float64)
+    xp = np.asarray(xp, dtype=np.float64)
+    index = np.searchsorted(xp, x, side="right")
+    lower = np.clip(index - 1, 0, len(xp) - 1)
+    upper = np.clip(index, 0, len(xp) - 1)
+    on_knot = (x == xp[lower]) | (lower == upper)
+
+    fp_lower = fp[:, lower].astype(np.float64)
+    fp_upper = fp[:, upper].astype(np.float64)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        slope = (fp_upper - fp_lower) / (xp[upper] - xp[lower])
+        result = slope * (x - xp[lower]) + fp_lower
+        # As in np.interp, retry from the upper knot where the result from
+        # the lower knot is NaN, e.g. where fp_lower is infinite.
+        retry = np.isnan(result)
+        if retry.any():
+            result[retry] = (slope * (x - xp[upper]) + fp_upper)[retry]
+            equal = np.isnan(result) & (fp_lower == fp_upper)
+            result[equal] = fp_lower[equal]
+    result = np.where(on_knot, fp_lower, result)
+    result[:, np.isnan(x)] = np.nan
+    return result.astype(np.float32)
 
 
 def interpolate_multiple_rows_same_x(*args):
@@ -4,8 +4,9 @@
 # See LICENSE in the root of the repository for full licensing details.
 """Module for generating the weights for topographic zones."""
 
+import functools
 import warnings
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import iris
 import numpy as np
@@ -15,10 +16,45 @@ from iris.exceptions import InvalidCubeError
 from numpy import ndarray
 
 from improver import BasePlugin
-from improver.generate_ancillaries.generate_ancillary import (
-    GenerateOrographyBandAncils,
-    _make_mask_cube,
-)
+
+
+@functools.lru_cache(maxsize=32)
+def _parsed_bands(
+    bounds: Tuple[Tuple[float, float], ...], units: str, orography_units: str
+) -> Tuple[ndarray, ndarray]:
+    """Parse the bounds of the topographic bands into arrays of the lower and
+    upper bounds of each band, converted to the units of the orography.
+    The lru_cache decorator caches the parsed bands, so that the unit
+    conversion is not repeated if the same bands are used multiple times.
+
+    Args:
+        bounds:
+            The bounds of each band e.g. ((0, 50), (50, 200)).
+        units:
+            The units of the bounds.
+        orography_units:
+            The units of the orography.
+
+    Returns:
+        - Read-only array of the lower bound of each band.
+        - Read-only array of the upper bound of each band.
+
+    Raises:
+        TypeError: If the bounds of each band are not an upper and lower limit.
+    """
+    bands = np.array(bounds, dtype=np.float32)
+    if bands.ndim != 2 or bands.shape[1] != 2:
+        msg = (
+            "The bounds of each topographic band should have only an "
+            "upper and lower limit: "
+            "Your bounds are {}"
+        )
+        raise TypeError(msg.format(bounds))
+    bands = Unit(units).convert(bands, Unit(orography_units))
+    band_los, band_his = np.ascontiguousarray(bands.T, dtype=np.float32)
+    band_los.setflags(write=False)
+    band_his.setflags(write=False)
+    return band_los, band_his
 
 
 class GenerateTopographicZoneWeights(BasePlugin):
@@ -26,6 +62,55 @@ class GenerateTopographicZoneWeights(BasePlugin):
     """Generate weights generated by determining where the orography lies
     within the topographic zones."""
 
+    @staticmethod
+    def calculate_triangle_weights(
+        orography: ndarray, band_los: ndarray, band_his: ndarray, band_number: int
+    ) -> ndarray:
+        """Calculate the weights of a single band for points within that band
+        or an adjacent band, combining the weight of the points within the
+        band with the 1-weight added from the adjacent bands.
+
+        The weight is a piecewise linear function of the orography, which is
+        1 at the midpoint of the band, 0.5 at the edges of the band and 0 at
+        the midpoints of the adjacent bands. Points below the midpoint of the
+        lowest band or above the midpoint of the uppermost band are given a
+        weight of 1 within that band. Weights are not set to zero for points
+        outside all of the bands, which are handled by the caller.
+
+        Args:
+            orography:
+                Array of orography.
+            band_los:
+                The lower bound of each band, in the same units as the
+                orography.
+            band_his:
+                The upper bound of each band, in the same units as the
+                orography.
+            band_number:
+                The index of the band for which to calculate the weights.
+
+        Returns:
+            The weights of the band, with the same shape as the orography.
+        """
+        lo, hi = band_los[band_number], band_his[band_number]
+        knots = [lo, 0.5 * (lo + hi), hi]
+        values = [0.5, 1.0, 0.5]
+        if band_number == 0:
+            values[0] = 1.0
+        else:
+            below_lo = band_los[band_number - 1]
+            below_hi = band_his[band_number - 1]
+            knots = [0.5 * (below_lo + below_hi), below_hi] + knots
+            values = [0.0, 0.5] + values
+        if band_number == len(band_los) - 1:
+            values[-1] = 1.0
+        else:
+            above_lo = band_los[band_number + 1]
+            above_hi = band_his[band_number + 1]
+            knots = knots + [above_lo, 0.5 * (above_lo + above_hi)]
+            values = values + [0.5, 0.0]
+        return np.interp(orography, knots, values)
+
     @staticmethod
     def add_weight_to_upper_adjacent_band(
         topographic_zone_weights: ndarray,
@@ -38,6 +123,10 @@ class GenerateTopographicZoneWeights(BasePlugin):
         we need to add 1-weight to the band above for points that are above
         the midpoint, unless the band being processed is the uppermost band.
 
+        Deprecated: use :meth:`calculate_triangle_weights` or
+        :meth:`compute_band_weights`, which calculate the weights of each band
+        including the contributions from the adjacent bands.
+
         Args:
             topographic_zone_weights:
                 Weights that we have already calculated for the points
@@ -57,6 +146,12 @@ class GenerateTopographicZoneWeights(BasePlugin):
             the orography band that has been updated to account for the
             upper adjacent band.
         """
+        warnings.warn(
+            "add_weight_to_upper_adjacent_band is deprecated, use "
+            "calculate_triangle_weights or compute_band_weights instead.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
         weights = topographic_zone_weights[band_number]
 
         # For points above the midpoint.
@@ -83,6 +178,10 @@ class GenerateTopographicZoneWeights(BasePlugin):
         we need to add 1-weight to the band below for points that are below
         the midpoint, unless the band being processed is the lowest band.
 
+        Deprecated: use :meth:`calculate_triangle_weights` or
+        :meth:`compute_band_weights`, which calculate the weights of each band
+        including the contributions from the adjacent bands.
+
         Args:
             topographic_zone_weights:
                 Weights that we have already calculated for the points
@@ -100,6 +199,12 @@ class GenerateTopographicZoneWeights(BasePlugin):
             already calculated for the points within the orography band
             that has been updated to account for the lower adjacent band.
         """
+        warnings.warn(
+            "add_weight_to_lower_adjacent_band is deprecated, use "
+            "calculate_triangle_weights or compute_band_weights instead.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
         weights = topographic_zone_weights[band_number]
 
         # For points below the midpoint.
@@ -121,6 +226,9 @@ class GenerateTopographicZoneWeights(BasePlugin):
         and the weights at the edge of the band is 0.5. The midpoint is
         assumed to be in the middle of the band.
 
+        Deprecated: use :meth:`calculate_triangle_weights`, which also
+        includes the contributions from the adjacent bands.
+
         Args:
             points:
                 The points at which to find the weights.
@@ -134,6 +242,12 @@ class GenerateTopographicZoneWeights(BasePlugin):
             The weights generated to indicate the contribution of each
             point to a band.
         """
+        warnings.warn(
+            "calculate_weights is deprecated, use calculate_triangle_weights "
+            "instead.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
         weights = np.array([0.5, 1.0, 0.5], np.float32)
         midpoint = np.mean(band)
         band_points = np.array([band[0], midpoint, band[1]], np.float32)
@@ -142,11 +256,98 @@ class GenerateTopographicZoneWeights(BasePlugin):
         )
         return interpolated_weights
 
+    def slow_compute_band_weights(
+        self, orography: ndarray, band_los: ndarray, band_his: ndarray, out: ndarray
+    ) -> None:
+        """Calculate the weights for each band using NumPy, processing all
+        bands together with the band as the leading dimension. The weights
+        are written into out.
+
+        Args:
+            orography:
+                2-D array of orography.
+            band_los:
+                The lower bound of each band, in the same units as the
+                orography.
+            band_his:
+                The upper bound of each band, in the same units as the
+                orography.
+            out:
+                Array with shape (number of bands, *orography.shape), into
+                which the weights are written.
+        """
+        # Each band is written once, with the weights of points within the
+        # band and the contribution to the adjacent bands calculated
+        # together. Points that are not within any band, including NaN
+        # orography, are given a weight of 0 in all bands.
+        in_any_band = np.zeros(orography.shape, dtype=bool)
+        with np.errstate(invalid="ignore"):
+            for band_lo, band_hi in zip(band_los, band_his):
+                in_any_band |= (orography > band_lo) & (orography <= band_hi)
+        for band_number in range(len(band_los)):
+            out[band_number] = self.calculate_triangle_weights(
+                orography, band_los, band_his, band_number
+            )
+        np.copyto(out, 0, where=~in_any_band)
+
+    def compute_band_weights(
+        self,
+        orography: ndarray,
+        band_los: ndarray,
+        band_his: ndarray,
+        order: str = "C",
+    ) -> ndarray:
+        """Calculate the weights for each band.
+
+        Calls a fast numba implementation where numba is available (see
+        `improver.generate_ancillaries.numba_utilities.fast_compute_band_weights`)
+        and calls the NumPy implementation otherwise (see
+        :meth:`slow_compute_band_weights`).
+
+        Args:
+            orography:
+                2-D array of orography.
+            band_los:
+                The lower bound of each band, in the same units as the
+                orography.
+            band_his:
+                The upper bound of each band, in the same units as the
+                orography.
+            order:
+                Memory layout of the returned weights, either "C" (row-major)
+                or "F" (column-major, in which the band dimension varies
+                fastest).
+
+        Returns:
+            The weights for each band with shape
+            (number of bands, *orography.shape).
+        """
+        orography = np.asarray(orography, dtype=np.float32)
+        weights = np.empty(
+            (len(band_los),) + orography.shape, dtype=np.float32, order=order
+        )
+        try:
+            import numba  # noqa: F401
+
+            from improver.generate_ancillaries.numba_utilities import (
+                fast_compute_band_weights,
+            )
+
+            fast_compute_band_weights(orography, band_los, band_his, weights, order)
+        except ImportError:
+            warnings.warn(
+                "Module numba unavailable. GenerateTopographicZoneWeights will be "
+                "slower."
+            )
+            self.slow_compute_band_weights(orography, band_los, band_his, weights)
+        return weights
+
     def process(
         self,
         orography: Cube,
         thresholds_dict: Dict[str, List[float]],
         landmask: Optional[Cube] = None,
+        output_order: str = "C",
     ) -> Cube:
         """Calculate the weights depending upon where the orography point is
         within the topographic zones.
@@ -162,11 +363,24 @@ class GenerateTopographicZoneWeights(BasePlugin):
                 Land mask on standard grid, with land points set to one and
                 sea points set to zero. If provided sea points are masked
                 out in the output array.
+            output_order:
+                Memory layout of the output weights, either "C" (row-major)
+                or "F" (column-major). "F" places the weights of all bands
+                for a grid point next to each other, which suits consumers
+                that iterate over the bands innermost.
 
         Returns:
             Cube containing the weights depending upon where the orography
             point is within the topographic zones.
+
+        Raises:
+            ValueError: If output_order is not "C" or "F".
         """
+        if output_order not in ("C", "F"):
+            raise ValueError(
+                'output_order must be "C" or "F", not "{}"'.format(output_order)
+            )
+
         # Check that orography is a 2d cube.
         if len(orography.shape) != 2:
             msg = (
@@ -177,42 +391,26 @@ class GenerateTopographicZoneWeights(BasePlugin):
             )
             raise InvalidCubeError(msg)
 
-        # Find bands and midpoints from bounds.
-        bands = np.array(thresholds_dict["bounds"], dtype=np.float32)
-        threshold_units = thresholds_dict["units"]
-
-        # Create topographic_zone_cube first, so that a cube is created for
-        # each band. This will allow the data for neighbouring bands to be
-        # put into the cube.
-        mask_data = np.zeros(orography.shape, dtype=np.float32)
-        topographic_zone_cubes = iris.cube.CubeList([])
-        for band in bands:
-            sea_points_included = not landmask
-            topographic_zone_cube = _make_mask_cube(
-                mask_data,
-                orography.coords(),
-                band,
-                threshold_units,
-                sea_points_included=sea_points_included,
-            )
-            topographic_zone_cubes.append(topographic_zone_cube)
-        topographic_zone_weights = topographic_zone_cubes.concatenate_cube()
-        topographic_zone_weights.data = topographic_zone_weights.data.astype(np.float32)
-
-        # Ensure topographic_zone coordinate units is equal to orography units.
-        topographic_zone_weights.coord("topographic_zone").convert_units(
-            orography.units
+        # Parse the bounds into arrays of the lower and upper bounds of the
+        # bands, in the same units as the orography.
+        band_los, band_his = _parsed_bands(
+            tuple(tuple(band) for band in thresholds_dict["bounds"]),
+            thresholds_dict["units"],
+            str(orography.units),
+        )
+        topographic_zone_coord = iris.coords.DimCoord(
+            np.float32(0.5) * (band_los + band_his),
+            bounds=np.stack((band_los, band_his), axis=-1),
+            long_name="topographic_zone",
+            units=orography.units,
         )
-
-        # Read bands from cube, now that they can be guaranteed to be in the
-        # same units as the orography. The bands are converted to a list, so
-        # that they can be iterated through.
-        bands = list(topographic_zone_weights.coord("topographic_zone").bounds)
-        midpoints = topographic_zone_weights.coord("topographic_zone").points
 
         # Raise a warning, if orography extremes are outside the extremes of
-        # the bands.
-        if np.max(orography.data) > np.max(bands):
+        # the bands. The orography data is extracted from the cube once and
+        # reused for the weights calculation.
+        orography_data = orography.data
+        orography_min, orography_max = np.min(orography_data), np.max(orography_data)
+        if orography_max > band_his.max():
             msg = (
                 "The maximum orography is greater than the uppermost band. "
                 "This will potentially cause the topographic zone weights "
@@ -220,7 +418,7 @@ class GenerateTopographicZoneWeights(BasePlugin):
             )
             warnings.warn(msg)
 
-        if np.min(orography.data) < np.min(bands):
+        if orography_min < band_los.min():
             msg = (
                 "The minimum orography is lower than the lowest band. "
                 "This will potentially cause the topographic zone weights "
@@ -228,57 +426,41 @@ class GenerateTopographicZoneWeights(BasePlugin):
             )
             warnings.warn(msg)
 
-        # Insert the appropriate weights into the topographic zone cube. This
-        # includes the weights from the band that a point is in, as well as
-        # the contribution from an adjacent band.
-        for band_number, band in enumerate(bands):
-            # Determine the points that are within the specified band.
-            mask_y, mask_x = np.where(
-                (orography.data > band[0]) & (orography.data <= band[1])
-            )
-            orography_band = np.full(orography.shape, np.nan, dtype=np.float32)
-            orography_band[mask_y, mask_x] = orography.data[mask_y, mask_x]
-
-            # Calculate the weights. This involves calculating the
-            # weights for all the orography but only inserting weights
-            # that are within the band into the topographic_zone_weights cube.
-            weights = self.calculate_weights(orography_band, band)
-            topographic_zone_weights.data[band_number, mask_y, mask_x] = weights[
-                mask_y, mask_x
-            ]
-
-            # Calculate the contribution to the weights from the adjacent
-            # lower band.
-            topographic_zone_weights.data = self.add_weight_to_lower_adjacent_band(
-                topographic_zone_weights.data,
-                orography_band,
-                midpoints[band_number],
-                band_number,
-            )
-
-            # Calculate the contribution to the weights from the adjacent
-            # upper band.
-            topographic_zone_weights.data = self.add_weight_to_upper_adjacent_band(
-                topographic_zone_weights.data,
-                orography_band,
-                midpoints[band_number],
-                band_number,
-                len(bands) - 1,
-            )
+        # Calculate the weights for all bands at once. This includes the
+        # weights from the band that a point is in, as well as the
+        # contribution from an adjacent band.
+        weights = self.compute_band_weights(
+            orography_data, band_los, band_his, order=output_order
+        )
 
-        # Metadata updates
-        topographic_zone_weights.rename("topographic_zone_weights")
-        topographic_zone_weights.units = Unit("1")
-
-        # Mask output weights using a land-sea mask.
-        topographic_zone_masked_weights = iris.cube.CubeList([])
-        for topographic_zone_slice in topographic_zone_weights.slices_over(
-            "topographic_zone"
-        ):
-            if landmask:
-                topographic_zone_slice.data = GenerateOrographyBandAncils().sea_mask(
-                    landmask.data, topographic_zone_slice.data
-                )
-            topographic_zone_masked_weights.append(topographic_zone_slice)
-        topographic_zone_weights = topographic_zone_masked_weights.merge_cube()
+        # Mask output weights using a land-sea mask. The sea points are set
+        # to the fill value in place, rather than masking a copy of the
+        # weights. The mask is broadcast from the single land-sea mask into
+        # an array with the same memory layout as the weights, so that the
+        # masked array remains writeable.
+        if landmask:
+            sea_points = np.logical_not(landmask.data)
+            np.copyto(weights, np.ma.default_fill_value(weights), where=sea_points)
+            mask = np.empty_like(weights, dtype=bool)
+            mask[...] = sea_points
+            weights = np.ma.masked_array(weights, mask=mask)
+
+        # We can't save attributes with boolean values so convert to string.
+        topographic_zone_weights = iris.cube.Cube(
+            weights,
+            long_name="topographic_zone_weights",
+            units=Unit("1"),
+            attributes={"topographic_zones_include_seapoints": str(not landmask)},
+            dim_coords_and_dims=[(topographic_zone_coord, 0)],
+        )
+        for coord in orography.coords(dim_coords=True):
+            (dim,) = orography.coord_dims(coord)
+            topographic_zone_weights.add_dim_coord(coord.copy(), dim + 1)
+        for coord in orography.coords(dim_coords=False):
+            dims = [dim + 1 for dim in orography.coord_dims(coord)]
+            topographic_zone_weights.add_aux_coord(coord.copy(), dims)
+
+        # A single band is returned with a scalar topographic_zone coordinate.
+        if len(band_los) == 1:
+            topographic_zone_weights = topographic_zone_weights[0]
         return topographic_zone_weights
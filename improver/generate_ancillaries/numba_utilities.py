@@ -0,0 +1,92 @@
+# (C) Crown copyright, Met Office. All rights reserved.
+#
+# This file is part of IMPROVER and is released under a BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""
+This module defines the optional numba utilities for generating ancillaries.
+"""
+
+import os
+
+import numpy as np
+from numba import config, njit, prange, set_num_threads
+
+config.THREADING_LAYER = "omp"
+if "OMP_NUM_THREADS" in os.environ:
+    set_num_threads(int(os.environ["OMP_NUM_THREADS"]))
+
+
+@njit
+def _set_point_band_weights(
+    value: np.float32,
+    band_los: np.ndarray,
+    band_his: np.ndarray,
+    out: np.ndarray,
+    i: int,
+    j: int,
+) -> None:
+    """Write the weight of each band for the orography value at point (i, j)
+    into out, which must already be zero at that point."""
+    n_bands = len(band_los)
+    half = np.float32(0.5)
+    one = np.float32(1.0)
+    for band in range(n_bands):
+        if not (band_los[band] < value <= band_his[band]):
+            continue
+        midpoint = half * (band_los[band] + band_his[band])
+        weight = one - abs(value - midpoint) / (band_his[band] - band_los[band])
+        weight = min(max(weight, half), one)
+        if value < midpoint:
+            if band == 0:
+                weight = one
+            else:
+                out[band - 1, i, j] = one - weight
+        elif value > midpoint:
+            if band == n_bands - 1:
+                weight = one
+            else:
+                out[band + 1, i, j] = one - weight
+        out[band, i, j] = weight
+        break
+
+
+@njit(parallel=True)
+def fast_compute_band_weights(
+    orography: np.ndarray,
+    band_los: np.ndarray,
+    band_his: np.ndarray,
+    out: np.ndarray,
+    order: str = "C",
+) -> None:
+    """For each point of the orography, calculate the weight of each of the
+    topographic bands, writing the weights into out. The weight at the
+    midpoint of a band is 1.0 and reduces linearly to 0.5 at the edges of the
+    band, with the remainder (1 - weight) given to the adjacent band nearest
+    to the point. Points below the midpoint of the lowest band or above the
+    midpoint of the uppermost band are given a weight of 1.0 within that band.
+
+    Args:
+        orography: 2-D float32 array of orography
+        band_los: 1-D float32 array of the lower bound of each band
+        band_his: 1-D float32 array of the upper bound of each band, in the
+            same units as band_los
+        out: 3-D float32 array with shape (len(band_los), *orography.shape),
+            into which the weights are written
+        order: memory layout of out, either "C" or "F". The loops are
+            nested so that the innermost loop runs over the dimension of out
+            with unit stride, i.e. the columns for "C" and the bands for "F".
+    """
+    n_bands = len(band_los)
+    if order == "F":
+        for j in prange(orography.shape[1]):
+            for i in range(orography.shape[0]):
+                for band in range(n_bands):
+                    out[band, i, j] = 0
+                _set_point_band_weights(orography[i, j], band_los, band_his, out, i, j)
+    else:
+        for i in prange(orography.shape[0]):
+            for band in range(n_bands):
+                for j in range(orography.shape[1]):
+                    out[band, i, j] = 0
+            for j in range(orography.shape[1]):
+                _set_point_band_weights(orography[i, j], band_los, band_his, out, i, j)
@@ -14,6 +14,7 @@ from cf_units import Unit
 from iris.coords import AuxCoord, Coord, DimCoord
 from iris.cube import Cube, CubeList
 from iris.exceptions import CoordinateNotFoundError
+from numpy import ndarray
 
 from improver.metadata.check_datatypes import check_mandatory_standards
 from improver.metadata.constants import FLOAT_TYPES
@@ -88,6 +89,28 @@ def forecast_period_coord(
     return result_coord
 
 
+def _convert_to_units(values: ndarray, units: Unit, target_units: Unit) -> ndarray:
+    """
+    Convert time values to float64 in the target units, skipping the unit
+    conversion if the values are already in those units.
+
+    Args:
+        values:
+            Time points or bounds
+        units:
+            Units of the values
+        target_units:
+            Units to which the values are converted
+
+    Returns:
+        The values as float64 in the target units
+    """
+    values = values.astype(np.float64)
+    if units == target_units:
+        return values
+    return units.convert(values, target_units)
+
+
 def _calculate_forecast_period(
     time_coord: Coord,
     frt_coord: Coord,
@@ -117,18 +140,21 @@ def _calculate_forecast_period(
     Warns:
         UserWarning: If any calculated forecast periods are negative
     """
-    # use cell() access method to get datetime.datetime instances
-    time_points = np.array([c.point for c in time_coord.cells()])
-    forecast_reference_time_points = np.array([c.point for c in frt_coord.cells()])
+    # Convert the points to seconds since the epoch, so that the lead times
+    # can be calculated by array arithmetic rather than from the datetime of
+    # each cell
+    epoch_units = TIME_COORDS["time"].units
+    time_units = Unit(epoch_units, calendar=time_coord.units.calendar)
+    frt_units = Unit(epoch_units, calendar=frt_coord.units.calendar)
+    forecast_reference_time_points = _convert_to_units(
+        frt_coord.points, frt_coord.units, frt_units
+    )
+    time_points = _convert_to_units(time_coord.points, time_coord.units, time_units)
     required_lead_times = time_points - forecast_reference_time_points
-    required_lead_times = np.array([x.total_seconds() for x in required_lead_times])
 
     if time_coord.bounds is not None:
-        time_bounds = np.array([c.bound for c in time_coord.cells()])
+        time_bounds = _convert_to_units(time_coord.bounds, time_coord.units, time_units)
         required_lead_time_bounds = time_bounds - forecast_reference_time_points
-        required_lead_time_bounds = np.array(
-            [[b.total_seconds() for b in x] for x in required_lead_time_bounds]
-        )
     else:
         required_lead_time_bounds = None
 
@@ -140,7 +166,8 @@ def _calculate_forecast_period(
         units="seconds",
     )
 
-    result_coord.convert_units(coord_spec.units)
+    if result_coord.units != coord_spec.units:
+        result_coord.convert_units(coord_spec.units)
 
     if coord_spec.dtype not in FLOAT_TYPES:
         result_coord.points = round_close(result_coord.points)
@@ -301,7 +328,8 @@ def _find_latest_cycletime(cubelist: Union[CubeList, List[Cube]]) -> datetime:
     frt_coord = cubelist[0].coord("forecast_reference_time").copy()
     for cube in cubelist:
         next_coord = cube.coord("forecast_reference_time").copy()
-        next_coord.convert_units(frt_coord.units)
+        if next_coord.units != frt_coord.units:
+            next_coord.convert_units(frt_coord.units)
         if next_coord.points[0] > frt_coord.points[0]:
             frt_coord = next_coord
     (cycletime,) = frt_coord.units.num2date(frt_coord.points)
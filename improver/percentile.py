@@ -42,6 +42,12 @@ class PercentileConverter(BasePlugin):
             percentiles:
                 Percentile values at which to calculate; if not provided uses
                 DEFAULT_PERCENTILES. (optional)
+            fast_percentile_method:
+                If True, the percentiles are calculated with numpy.percentile,
+                which selects the required values by partitioning the data
+                rather than fully sorting it. This does not handle masked
+                data, for which this should be False to use the slower
+                scipy.stats.mstats.mquantiles method instead.
 
         Raises:
             TypeError: If collapse_coord is not a string.
@@ -114,7 +120,11 @@ class PercentileConverter(BasePlugin):
                 fast_percentile_method=self.fast_percentile_method,
             )
 
-            result.data = result.data.astype(data_type)
+            # With the fast percentile method, iris calculates all of the
+            # percentiles in a single call to np.percentile over the
+            # flattened collapse axes, so only the data type needs
+            # restoring here, which avoids a copy if it is unchanged.
+            result.data = result.data.astype(data_type, copy=False)
             for coord in self.collapse_coord:
                 result.remove_coord(coord)
             percentile_coord = find_percentile_coordinate(result)
@@ -8,6 +8,7 @@ cubes for unit tests.  Standardises time units and spatial coordinates,
 including coordinate order expected by IMPROVER plugins.
 """
 
+import functools
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple, Type, Union
 
@@ -725,11 +726,94 @@ def _percentile_cube(
     Returns:
         Cube containing percentiles
     """
+    # The template can only be reused for unmasked array data and hashable
+    # keyword arguments, which excludes e.g. lists of coords.
+    kwargs_items = tuple(sorted(kwargs.items()))
+    if (
+        isinstance(data, np.ndarray)
+        and not isinstance(data, MaskedArray)
+        and _is_hashable(kwargs_items)
+    ):
+        percentiles_array = np.asarray(percentiles)
+        template = _template_percentile_cube(
+            function,
+            data.shape,
+            data.dtype.str,
+            percentiles_array.dtype.str,
+            tuple(percentiles_array.tolist()),
+            kwargs_items,
+        )
+        cube = template.copy(data=data)
+    else:
+        cube = _construct_percentile_cube(function, data, percentiles, **kwargs)
+    if len(percentiles) == 1:
+        cube = next(cube.slices_over("percentile"))
+    return cube
+
+
+def _is_hashable(value: Any) -> bool:
+    """Check whether a value can be used as part of a cache key."""
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+@functools.lru_cache(maxsize=64)
+def _template_percentile_cube(
+    function,
+    shape: Tuple[int, ...],
+    dtype: str,
+    percentiles_dtype: str,
+    percentiles: Tuple[float, ...],
+    kwargs_items: Tuple[Tuple[str, Any], ...],
+) -> Cube:
+    """
+    Set up a percentile cube with the metadata for the given data shape, data
+    type, percentiles and keyword arguments. The result is cached, so that
+    tests setting up many cubes with the same metadata only construct the
+    coordinates once; it must only be copied, not modified, by the caller.
+    The data of the template is a read-only view of a single zero, so that
+    the cached templates do not hold full size arrays.
+
+    Args:
+        function:
+            Function used to set up the variable cube
+        shape:
+            Shape of the data to put into the cube
+        dtype:
+            String representation of the data type of the data
+        percentiles_dtype:
+            String representation of the data type of the percentiles
+        percentiles:
+            Percentile values whose length must match the first dimension
+            of the data
+        kwargs_items:
+            Sorted (name, value) pairs of the additional keyword arguments
+            passed to the function
+
+    Returns:
+        Template cube containing percentiles
+    """
+    return _construct_percentile_cube(
+        function,
+        np.broadcast_to(np.zeros((), dtype=dtype), shape),
+        np.array(percentiles, dtype=percentiles_dtype),
+        **dict(kwargs_items),
+    )
+
+
+def _construct_percentile_cube(
+    function, data: ndarray, percentiles: Union[List[float], ndarray], **kwargs: Any,
+) -> Cube:
+    """
+    Set up a cube with a leading percentile dimension, before any single
+    percentile dimension is demoted to a scalar coordinate.
+    """
     cube = function(data, realizations=percentiles, **kwargs,)
     cube.coord("realization").rename("percentile")
     cube.coord("percentile").units = Unit("%")
-    if len(percentiles) == 1:
-        cube = next(cube.slices_over("percentile"))
     return cube
 
 
@@ -227,6 +227,10 @@ def normalise_to_reference(
     reference based upon the fraction that each cube contributes to the sum total of
     data in cubes.
 
+    If any of the cubes contain masked data, the data in all of the returned cubes
+    are masked wherever any of the input cubes are masked, as the total is not known
+    at those points. This applies whichever of the input cubes is masked.
+
     Args:
         cubes: Cubelist containing the cubes to be updated. Must contain at least 2
             cubes.
@@ -299,10 +303,18 @@ def normalise_to_reference(
         )
         raise ValueError(msg)
 
-    total = cubes[0].data.copy()
-    if len(cubes) > 1:
-        for cube in cubes[1:]:
-            total += cube.data
+    # stack the data so that the total and the normalised data can each be
+    # calculated for all of the cubes at once
+    data = [cube.data for cube in cubes]
+    if any(np.ma.isMaskedArray(cube_data) for cube_data in data):
+        stacked_data = np.ma.stack(data)
+        # mask the total wherever any of the input cubes is masked
+        total = np.ma.masked_where(
+            np.ma.getmaskarray(stacked_data).any(axis=0), stacked_data.sum(axis=0)
+        )
+    else:
+        stacked_data = np.stack(data)
+        total = stacked_data.sum(axis=0)
 
     # check for zeroes in total when reference is non-zero
     total_zeroes = total == 0.0
@@ -321,10 +333,11 @@ def normalise_to_reference(
     # update total where zero to avoid dividing by zero later.
     total[total_zeroes] = 1.0
 
+    normalised_data = reference.data * stacked_data / total
+
     output = iris.cube.CubeList()
-    for index, cube in enumerate(cubes):
-        output_cube = cube.copy(data=reference.data * cube.data / total)
-        output.append(output_cube)
+    for cube, cube_data in zip(cubes, normalised_data):
+        output.append(cube.copy(data=cube_data))
 
     return output
 
@@ -4,6 +4,8 @@
 # See LICENSE in the root of the repository for full licensing details.
 """General utilities for parsing and extracting cubes at times"""
 
+import functools
+import re
 import warnings
 from datetime import datetime, timezone
 from typing import List, Optional, Union
@@ -20,12 +22,17 @@ from numpy import int64
 
 from improver.metadata.constants.time_types import DT_FORMAT, TIME_COORDS
 
+# Cycletimes in DT_FORMAT, i.e. YYYYMMDDTHHMMZ with ASCII digits only.
+_DT_FORMAT_PATTERN = re.compile(r"[0-9]{8}T[0-9]{4}Z")
 
+
+@functools.lru_cache(maxsize=1024)
 def cycletime_to_datetime(
     cycletime: str, cycletime_format: str = DT_FORMAT
 ) -> datetime:
     """Convert a string representating the cycletime of the
-    format YYYYMMDDTHHMMZ into a datetime object.
+    format YYYYMMDDTHHMMZ into a datetime object. The lru_cache decorator
+    caches the result, so that the same cycletime is not parsed repeatedly.
 
     Args:
         cycletime:
@@ -37,6 +44,16 @@ def cycletime_to_datetime(
     Returns:
         A correctly formatted datetime object.
     """
+    # Slice the fields directly for the default format, which is much
+    # quicker than the general strptime parser.
+    if cycletime_format == DT_FORMAT and _DT_FORMAT_PATTERN.fullmatch(cycletime):
+        return datetime(
+            int(cycletime[0:4]),
+            int(cycletime[4:6]),
+            int(cycletime[6:8]),
+            int(cycletime[9:11]),
+            int(cycletime[11:13]),
+        )
     return datetime.strptime(cycletime, cycletime_format)
 
 
@@ -59,6 +76,7 @@ def datetime_to_cycletime(
     return datetime.strftime(adatetime, cycletime_format)
 
 
+@functools.lru_cache(maxsize=1024)
 def cycletime_to_number(
     cycletime: str,
     cycletime_format: str = DT_FORMAT,
@@ -66,7 +84,8 @@ def cycletime_to_number(
     calendar: str = "gregorian",
 ) -> float:
     """Convert a cycletime of the format YYYYMMDDTHHMMZ into a numeric
-    time value.
+    time value. The lru_cache decorator caches the result, so that the same
+    cycletime is not parsed and converted repeatedly.
 
     Args:
         cycletime:
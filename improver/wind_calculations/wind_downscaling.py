@@ -84,12 +84,16 @@ class FrictionVelocity(BasePlugin):
         Returns:
             A 2D array of float32 friction velocities
         """
-        ustar = np.full(self.u_href.shape, RMDI, dtype=np.float32)
-        numerator = self.u_href[self.mask]
-        with np.errstate(invalid="ignore"):
-            denominator = np.log(self.h_ref[self.mask] / self.z_0[self.mask])
-        ustar[self.mask] = VONKARMAN * (numerator / denominator)
-        return ustar
+        if not self.mask.any():
+            return np.full(self.u_href.shape, RMDI, dtype=np.float32)
+        # Calculate over the whole array, rather than gathering and
+        # scattering the masked points, and then fill the points outside of
+        # the mask. Zero heights or roughness lengths give NaN or zero.
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ustar = VONKARMAN * (self.u_href / np.log(self.h_ref / self.z_0))
+        if not self.mask.all():
+            ustar = np.where(self.mask, ustar, RMDI)
+        return ustar.astype(np.float32, copy=False)
 
 
 class RoughnessCorrectionUtilities:
@@ -2,8 +2,10 @@
 #
 # This file is part of IMPROVER and is released under a BSD 3-Clause license.
 # See LICENSE in the root of the repository for full licensing details.
-"""Extends IrisTest class with additional useful tests."""
+"""Extends IrisTest class with additional useful tests, and provides cube
+comparison helpers for pytest-style tests."""
 
+import numpy as np
 from iris.cube import Cube, CubeList
 from iris.tests import IrisTest
 
@@ -26,3 +28,29 @@ class ImproverTest(IrisTest):
             cubelist_a.xml(checksum=True, order=False, byteorder=False),
             cubelist_b.xml(checksum=True, order=False, byteorder=False),
         )
+
+
+def assert_cubelist_equal(actual: CubeList, expected: CubeList):
+    """Assert that two cubelists are equal, in the same way as iris compares
+    cubes. The metadata, coordinates, cell measures and ancillary variables
+    of each pair of cubes are compared first, so that a mismatch fails
+    without comparing the data. The data are then compared with the same
+    tolerance as iris, but without dask and with a message describing the
+    differing points."""
+    assert len(actual) == len(expected)
+    for actual_cube, expected_cube in zip(actual, expected):
+        assert actual_cube.metadata == expected_cube.metadata
+        assert actual_cube.shape == expected_cube.shape
+        for get_items, get_dims in (
+            (Cube.coords, Cube.coord_dims),
+            (Cube.cell_measures, Cube.cell_measure_dims),
+            (Cube.ancillary_variables, Cube.ancillary_variable_dims),
+        ):
+            actual_items = get_items(actual_cube)
+            assert actual_items == get_items(expected_cube)
+            assert [get_dims(actual_cube, item) for item in actual_items] == [
+                get_dims(expected_cube, item) for item in actual_items
+            ]
+        np.testing.assert_allclose(
+            actual_cube.data, expected_cube.data, rtol=1e-05, atol=1e-08
+        )
@@ -229,8 +229,10 @@ def kgo_recreate():
     return RECREATE_DIR_ENVVAR in os.environ
 
 
+@functools.lru_cache()
 def kgo_root():
-    """Path to the root of the KGO directories"""
+    """Path to the root of the KGO directories. This is cached so that the
+    environment is only read once per test process (or pytest-xdist worker)."""
     try:
         test_dir = os.environ[ACC_TEST_DIR_ENVVAR]
     except KeyError:
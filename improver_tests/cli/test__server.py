@@ -0,0 +1,96 @@
+# (C) Crown copyright, Met Office. All rights reserved.
+#
+# This file is part of IMPROVER and is released under a BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Unit tests for cli._server"""
+
+import json
+import os
+import socket
+import socketserver
+import threading
+from unittest.mock import patch
+
+import pytest
+
+import improver.cli
+from improver.cli._server import JobHandler, _remove_stale_socket, run_job
+
+
+@patch("improver.cli.execute_command", return_value=None)
+def test_run_job(execute_command):
+    """Test that a job is dispatched to the CLI with its arguments, with
+    bracketed nested commands unbracketed."""
+    job = {"cli": "threshold", "args": ["[", "nbhood", "in.nc", "]", "-o", "x"]}
+    result = run_job(job)
+    assert result == {"status": "ok", "result": None}
+    execute_command.assert_called_once_with(
+        improver.cli.SUBCOMMANDS_DISPATCHER,
+        "improver",
+        "threshold",
+        ["nbhood", "in.nc"],
+        "-o",
+        "x",
+    )
+
+
+@patch("improver.cli.execute_command", side_effect=ValueError("bad input"))
+def test_run_job_error(_):
+    """Test that an error raised by the CLI is returned in the response."""
+    result = run_job({"cli": "threshold"})
+    assert result == {"status": "error", "error": "ValueError: bad input"}
+
+
+@pytest.mark.parametrize(
+    "error, expected",
+    ((SystemExit(2), "SystemExit: 2"), (KeyboardInterrupt(), "KeyboardInterrupt: ")),
+)
+def test_run_job_exit(error, expected):
+    """Test that an exit raised by the CLI is returned in the response, rather
+    than ending the job without a response."""
+    with patch("improver.cli.execute_command", side_effect=error):
+        result = run_job({"cli": "threshold"})
+    assert result == {"status": "error", "error": expected}
+
+
+def test_remove_stale_socket(tmp_path):
+    """Test that an existing socket is removed, and that a missing socket is
+    ignored."""
+    socket_path = str(tmp_path / "improver.sock")
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.bind(socket_path)
+    _remove_stale_socket(socket_path)
+    assert not os.path.exists(socket_path)
+    _remove_stale_socket(socket_path)
+
+
+def test_remove_stale_socket_not_socket(tmp_path):
+    """Test that an error is raised, and the file is kept, if the path is a
+    file other than a socket."""
+    socket_path = tmp_path / "improver.sock"
+    socket_path.write_text("data")
+    with pytest.raises(FileExistsError, match="not a socket"):
+        _remove_stale_socket(str(socket_path))
+    assert socket_path.read_text() == "data"
+
+
+@pytest.mark.parametrize(
+    "request_line, expected",
+    (
+        (b'{"cli": "threshold"}\n', {"status": "ok", "result": "result"}),
+        (b"not json\n", {"status": "error"}),
+    ),
+)
+@patch("improver.cli.execute_command", return_value="result")
+def test_job_handler(_, tmp_path, request_line, expected):
+    """Test a round trip of a job through a Unix socket server."""
+    socket_path = str(tmp_path / "improver.sock")
+    with socketserver.UnixStreamServer(socket_path, JobHandler) as server:
+        thread = threading.Thread(target=server.handle_request)
+        thread.start()
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(socket_path)
+            client.sendall(request_line)
+            response = json.loads(client.makefile().readline())
+        thread.join()
+    assert expected.items() <= response.items()
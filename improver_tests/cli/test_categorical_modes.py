@@ -0,0 +1,101 @@
+# (C) Crown copyright, Met Office. All rights reserved.
+#
+# This file is part of IMPROVER and is released under a BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Unit tests for the parallel processing in the categorical-modes CLI"""
+
+from datetime import datetime as dt
+from datetime import timedelta
+
+import numpy as np
+import pytest
+from iris.cube import CubeList
+
+from improver.cli import categorical_modes
+from improver.synthetic_data.set_up_test_cubes import set_up_spot_variable_cube
+from improver_tests.categorical.decision_tree import set_up_wxcube, wxcode_decision_tree
+
+TARGET_TIME = dt(2020, 6, 15, 18)
+
+
+def _wxcubes(shape, ntimes=3):
+    """Set up a series of hourly weather code cubes with random codes on a
+    grid of the given shape."""
+    rng = np.random.default_rng(0)
+    cubes = CubeList()
+    for i in range(ntimes):
+        time = TARGET_TIME - timedelta(hours=i)
+        cube = set_up_wxcube(
+            data=rng.integers(1, 10, shape).astype(np.int8),
+            time=time,
+            time_bounds=[time - timedelta(hours=1), time],
+            frt=TARGET_TIME - timedelta(hours=42),
+        )
+        blend_time = cube.coord("forecast_reference_time").copy()
+        blend_time.rename("blend_time")
+        cube.add_aux_coord(blend_time)
+        cubes.append(cube)
+    return cubes
+
+
+@pytest.mark.parametrize(
+    "n_rows, n_slabs, expected_rows",
+    ((6, 3, [2, 2, 2]), (7, 3, [3, 3, 1]), (6, 4, [2, 2, 2]), (5, 1, [5])),
+)
+def test_y_slabs(monkeypatch, n_rows, n_slabs, expected_rows):
+    """Test that the cubes are split into contiguous slabs along the y-axis,
+    with any partial slab last, which together cover the whole grid."""
+    monkeypatch.setattr(categorical_modes, "PARALLEL_GRID_POINTS", 10)
+    cubes = _wxcubes((n_rows, 5))
+    slabs = categorical_modes._y_slabs(cubes, n_slabs)
+    assert [slab[0].shape[0] for slab in slabs] == expected_rows
+    for index, cube in enumerate(cubes):
+        assert all(slab[index].shape[1] == 5 for slab in slabs)
+        np.testing.assert_array_equal(
+            np.concatenate([slab[index].data for slab in slabs]), cube.data
+        )
+
+
+def test_y_slabs_size_threshold(monkeypatch):
+    """Test that None is returned for a grid with no more than
+    PARALLEL_GRID_POINTS points, and slabs for a larger grid."""
+    cubes = _wxcubes((6, 5))
+    monkeypatch.setattr(categorical_modes, "PARALLEL_GRID_POINTS", 30)
+    assert categorical_modes._y_slabs(cubes, 2) is None
+    monkeypatch.setattr(categorical_modes, "PARALLEL_GRID_POINTS", 29)
+    assert len(categorical_modes._y_slabs(cubes, 2)) == 2
+
+
+def test_y_slabs_spot_data(monkeypatch):
+    """Test that None is returned for spot data, which has no y-axis."""
+    monkeypatch.setattr(categorical_modes, "PARALLEL_GRID_POINTS", 0)
+    cube = set_up_spot_variable_cube(np.ones(20, dtype=np.float32))
+    assert categorical_modes._y_slabs(CubeList([cube]), 2) is None
+
+
+def test_parallel_matches_serial(monkeypatch):
+    """Test that processing the grid in slabs in parallel gives the same cube
+    as processing it in one go."""
+    cubes = _wxcubes((7, 5))
+    decision_tree = wxcode_decision_tree()
+    monkeypatch.delenv("IMPROVER_N_JOBS", raising=False)
+    expected = categorical_modes.process(*cubes, decision_tree=decision_tree)
+
+    monkeypatch.setenv("IMPROVER_N_JOBS", "3")
+    monkeypatch.setattr(categorical_modes, "PARALLEL_GRID_POINTS", 10)
+    assert len(categorical_modes._y_slabs(cubes, 3)) == 3
+    result = categorical_modes.process(*cubes, decision_tree=decision_tree)
+
+    assert result == expected
+    np.testing.assert_array_equal(result.data, expected.data)
+    assert result.dtype == expected.dtype
+
+
+@pytest.mark.parametrize("value", ("two", "1.5", "0", "-2"))
+def test_invalid_n_jobs(monkeypatch, value):
+    """Test that a clear error is raised if IMPROVER_N_JOBS is not a positive
+    integer."""
+    monkeypatch.setenv("IMPROVER_N_JOBS", value)
+    msg = f"IMPROVER_N_JOBS must be a positive integer, not '{value}'"
+    with pytest.raises(ValueError, match=msg):
+        categorical_modes.process(*_wxcubes((6, 5)), decision_tree={})
@@ -0,0 +1,122 @@
+# (C) Crown copyright, Met Office. All rights reserved.
+#
+# This file is part of IMPROVER and is released under a BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Unit tests for the handling of a background raw cube load in the
+generate-realizations CLI"""
+
+import threading
+from concurrent.futures import Future
+from unittest.mock import patch
+
+import iris
+import numpy as np
+import pytest
+
+from improver.cli import SUBCOMMANDS_DISPATCHER, execute_command, generate_realizations
+from improver.synthetic_data.set_up_test_cubes import (
+    set_up_percentile_cube,
+    set_up_variable_cube,
+)
+from improver.utilities.load import load_cube
+
+
+def _future(result=None, exception=None):
+    """Create a completed Future holding a result or an exception."""
+    future = Future()
+    if exception is not None:
+        future.set_exception(exception)
+    else:
+        future.set_result(result)
+    return future
+
+
+@pytest.fixture(name="percentile_cube")
+def percentile_cube_fixture():
+    """Percentile cube to be converted to realizations."""
+    data = np.stack(
+        [np.full((3, 3), value, dtype=np.float32) for value in (270, 280, 290)]
+    )
+    return set_up_percentile_cube(data, [25, 50, 75])
+
+
+@pytest.fixture(name="raw_cube")
+def raw_cube_fixture():
+    """Raw ensemble with three realizations."""
+    rng = np.random.default_rng(0)
+    data = rng.uniform(265, 295, (3, 3, 3)).astype(np.float32)
+    return set_up_variable_cube(data, realizations=[0, 1, 2])
+
+
+@pytest.mark.parametrize("realizations_count", (None, 3))
+def test_raw_cube_future(percentile_cube, raw_cube, realizations_count):
+    """Test that a Future of the raw cube gives the same result as the raw
+    cube itself, whether or not the realizations count is taken from it."""
+    kwargs = {"realizations_count": realizations_count, "random_seed": 0}
+    expected = generate_realizations.process(percentile_cube, raw_cube, **kwargs)
+    result = generate_realizations.process(percentile_cube, _future(raw_cube), **kwargs)
+    assert result == expected
+    np.testing.assert_array_equal(result.coord("realization").points, [0, 1, 2])
+
+
+@pytest.mark.parametrize("realizations_count", (None, 3))
+def test_raw_cube_future_error(percentile_cube, realizations_count):
+    """Test that an error raised while loading the raw cube is raised by
+    process."""
+    future = _future(exception=OSError("cannot read raw cube"))
+    with pytest.raises(OSError, match="cannot read raw cube"):
+        generate_realizations.process(
+            percentile_cube, future, realizations_count=realizations_count
+        )
+
+
+def test_realization_cube_waits_for_raw_cube(raw_cube):
+    """Test that an input cube which already has realizations is returned
+    unchanged, after waiting on the raw cube load so that its errors are
+    raised rather than lost."""
+    result = generate_realizations.process(raw_cube, _future(raw_cube))
+    assert result is raw_cube
+    future = _future(exception=OSError("cannot read raw cube"))
+    with pytest.raises(OSError, match="cannot read raw cube"):
+        generate_realizations.process(raw_cube, future)
+
+
+def test_netcdf_loads(tmp_path, percentile_cube, raw_cube):
+    """Test that the CLI gives the same result from netCDF files as from the
+    loaded cubes, with the input cube loaded in full on the main thread before
+    the background load of the raw cube starts."""
+    paths = {"input": tmp_path / "input.nc", "raw": tmp_path / "raw.nc"}
+    iris.save(percentile_cube, str(paths["input"]))
+    iris.save(raw_cube, str(paths["raw"]))
+    events = []
+
+    def recording_load_cube(path, **kwargs):
+        events.append(("start", path, threading.current_thread()))
+        cube = load_cube(path, **kwargs)
+        assert not cube.has_lazy_data()
+        events.append(("end", path, threading.current_thread()))
+        return cube
+
+    with patch("improver.utilities.load.load_cube", side_effect=recording_load_cube):
+        result = execute_command(
+            SUBCOMMANDS_DISPATCHER,
+            "improver",
+            "generate-realizations",
+            paths["input"],
+            paths["raw"],
+            "--random-seed",
+            "0",
+        )
+    expected = generate_realizations.process(
+        load_cube(str(paths["input"])), load_cube(str(paths["raw"])), random_seed=0
+    )
+    assert result == expected
+    steps = [(step, path) for step, path, _ in events]
+    assert steps == [
+        ("start", str(paths["input"])),
+        ("end", str(paths["input"])),
+        ("start", str(paths["raw"])),
+        ("end", str(paths["raw"])),
+    ]
+    assert events[0][2] is threading.main_thread()
+    assert events[2][2] is not threading.main_thread()
@@ -5,6 +5,7 @@
 """Unit tests for cli.__init__"""
 
 import unittest
+from concurrent.futures import Future
 from unittest.mock import patch
 
 import dask.array as da
@@ -18,6 +19,7 @@ from improver.cli import (
     create_constrained_inputcubelist_converter,
     docutilize,
     inputcube,
+    inputcube_async,
     inputcube_nolazy,
     inputcubelist,
     inputdatetime,
@@ -144,6 +146,29 @@ class Test_inputcube_nolazy(unittest.TestCase):
         self.assertEqual(result, "return")
 
 
+class Test_inputcube_async(unittest.TestCase):
+    """Tests the input cube async function"""
+
+    @patch("improver.cli.maybe_coerce_with", return_value="return")
+    def test_string_arg(self, m):
+        """Check that inputcube_async returns a future of the result of the
+        coerce func called with the input string."""
+        result = inputcube_async("foo")
+        self.assertIsInstance(result, Future)
+        self.assertEqual(result.result(), "return")
+        m.assert_called_with(
+            improver.utilities.load.load_cube, "foo", no_lazy_load=True
+        )
+
+    @patch("improver.cli.maybe_coerce_with")
+    def test_cube_arg(self, m):
+        """Check that an input cube is returned without being loaded."""
+        cube = Cube(np.zeros((1, 1)), long_name="dummy")
+        result = inputcube_async(cube)
+        self.assertIs(result, cube)
+        m.assert_not_called()
+
+
 class Test_inputcubelist(unittest.TestCase):
     """Tests the input cubelist function"""
 
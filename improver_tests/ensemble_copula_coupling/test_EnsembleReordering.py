@@ -9,11 +9,13 @@ Unit tests for the
 """
 import itertools
 import unittest
+from unittest.mock import patch
 
 import numpy as np
 from iris.cube import Cube
 from iris.tests import IrisTest
 
+from improver.ensemble_copula_coupling.ensemble_copula_coupling import _RANKING_CACHE
 from improver.ensemble_copula_coupling.ensemble_copula_coupling import (
     EnsembleReordering as Plugin,
 )
@@ -353,6 +355,79 @@ class Test_rank_ecc(IrisTest):
         matches = [np.array_equal(aresult, result.data) for aresult in permutations]
         self.assertIn(True, matches)
 
+    def test_ranking_reused(self):
+        """Test that the ranking of a raw forecast without tied values is
+        reused when the same raw forecast is reordered again, giving the
+        same result without re-sorting the raw forecast."""
+        raw_data = np.array([[3, 1], [1, 3], [2, 2]])
+        calibrated_data = np.array([[1, 1], [2, 2], [3, 3]])
+        result_data = raw_data.copy()
+
+        raw_cube = self.cube_2d.copy(data=raw_data)
+        calibrated_cube = self.cube_2d.copy(data=calibrated_data)
+        _RANKING_CACHE.clear()
+        Plugin().rank_ecc(calibrated_cube, raw_cube)
+        self.assertEqual(len(_RANKING_CACHE), 1)
+        with patch("numpy.lexsort") as lexsort:
+            result = Plugin().rank_ecc(calibrated_cube, raw_cube.copy())
+        lexsort.assert_not_called()
+        self.assertArrayAlmostEqual(result.data, result_data)
+
+    def test_ranking_with_ties_not_reused(self):
+        """Test that the ranking of a raw forecast with tied values is not
+        cached if no random seed is set, as the tied values are split
+        randomly on each call."""
+        raw_data = np.array([[1, 1], [3, 2], [2, 2]])
+        calibrated_data = np.array([[1, 1], [2, 2], [3, 3]])
+
+        raw_cube = self.cube_2d.copy(data=raw_data)
+        calibrated_cube = self.cube_2d.copy(data=calibrated_data)
+        _RANKING_CACHE.clear()
+        Plugin().rank_ecc(calibrated_cube, raw_cube)
+        self.assertEqual(len(_RANKING_CACHE), 0)
+        Plugin().rank_ecc(calibrated_cube, raw_cube, random_seed=0)
+        self.assertEqual(len(_RANKING_CACHE), 1)
+
+    def test_ranking_cache_evicted(self):
+        """Test that the least recently used rankings are evicted to keep the
+        cache within its maximum size in bytes."""
+        raw_data = np.array([[3, 1], [1, 3], [2, 2]])
+        calibrated_cube = self.cube_2d.copy(data=np.array([[1, 1], [2, 2], [3, 3]]))
+        max_bytes = 2 * raw_data.size * np.dtype(np.intp).itemsize
+        _RANKING_CACHE.clear()
+        with patch(
+            "improver.ensemble_copula_coupling.ensemble_copula_coupling."
+            "_RANKING_CACHE_MAX_BYTES",
+            max_bytes,
+        ):
+            for offset in range(3):
+                raw_cube = self.cube_2d.copy(data=raw_data + offset)
+                Plugin().rank_ecc(calibrated_cube, raw_cube)
+            self.assertEqual(len(_RANKING_CACHE), 2)
+            self.assertLessEqual(
+                sum(ranking.nbytes for ranking in _RANKING_CACHE.values()),
+                max_bytes,
+            )
+            # The ranking of the first raw forecast has been evicted.
+            with patch("numpy.lexsort", wraps=np.lexsort) as lexsort:
+                Plugin().rank_ecc(calibrated_cube, self.cube_2d.copy(data=raw_data))
+            lexsort.assert_called_once()
+
+    def test_ranking_too_large_not_cached(self):
+        """Test that a ranking larger than the cache is not cached, and that
+        its raw forecast is not hashed."""
+        raw_cube = self.cube_2d.copy(data=np.array([[3, 1], [1, 3], [2, 2]]))
+        calibrated_cube = self.cube_2d.copy(data=np.array([[1, 1], [2, 2], [3, 3]]))
+        _RANKING_CACHE.clear()
+        with patch(
+            "improver.ensemble_copula_coupling.ensemble_copula_coupling."
+            "_RANKING_CACHE_MAX_BYTES",
+            8,
+        ), patch("hashlib.blake2b") as blake2b:
+            Plugin().rank_ecc(calibrated_cube, raw_cube)
+        blake2b.assert_not_called()
+        self.assertEqual(len(_RANKING_CACHE), 0)
+
 
 class Test__check_input_cube_masks(IrisTest):
 
@@ -9,6 +9,7 @@ Unit tests for the
 import importlib
 import unittest
 import unittest.mock as mock
+import warnings
 from datetime import datetime
 from unittest.case import skipIf
 from unittest.mock import patch
@@ -499,6 +500,41 @@ class TestInterpolateMultipleRowsSameX(IrisTest):
         result = slow_interp_same_x(x, xp, fp)
         np.testing.assert_allclose(result, expected)
 
+    def test_slow_vs_np_interp(self):
+        """Test that slow interp matches np.interp applied to each row,
+        including where xp contains repeats and x is beyond the ends of xp."""
+        xp = self.xp.copy()
+        xp[51] = xp[50]
+        x = np.concatenate([[-1.0, xp[50], xp[-1]], self.x, [2.0]])
+        expected = np.array([np.interp(x, xp, row) for row in self.fp])
+        result = slow_interp_same_x(x, xp, self.fp)
+        self.assertEqual(result.dtype, np.float32)
+        np.testing.assert_allclose(result, expected, rtol=1e-6)
+
+    def test_slow_vs_np_interp_non_finite(self):
+        """Test that slow interp matches np.interp, without warnings, where x
+        or fp contain NaN or inf, including where x lies on a knot next to a
+        non-finite value of fp and where x is beyond the ends of xp."""
+        xp = np.array([0, 1, 1, 2, 3], dtype=np.float32)
+        fp = np.array(
+            [
+                [0, 1, 2, np.inf, 4],
+                [0, np.nan, 1, 2, 3],
+                [np.inf, np.inf, 1, 2, -np.inf],
+                [0, 1, 2, 3, 4],
+            ],
+            dtype=np.float32,
+        )
+        x = np.array(
+            [np.nan, -1, 0, 0.5, 1, 1.5, 2, 2.5, 3, 4, np.inf, -np.inf],
+            dtype=np.float32,
+        )
+        expected = np.array([np.interp(x, xp, row) for row in fp], dtype=np.float32)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            result = slow_interp_same_x(x, xp, fp)
+        np.testing.assert_array_equal(result, expected)
+
     @skipIf(not (numba_installed), "numba not installed")
     def test_fast(self):
         """Test fast interp against known result."""
@@ -4,20 +4,31 @@
 # See LICENSE in the root of the repository for full licensing details.
 """Unit tests for the GenerateTopographicZoneWeights plugin."""
 
-import unittest
+import importlib
+import unittest.mock as mock
+from unittest.mock import patch
 
 import iris
 import numpy as np
 import pytest
 from cf_units import Unit
 from iris.exceptions import InvalidCubeError
-from iris.tests import IrisTest
 
 from improver.generate_ancillaries.generate_topographic_zone_weights import (
     GenerateTopographicZoneWeights,
+    _parsed_bands,
 )
 from improver.synthetic_data.set_up_test_cubes import set_up_variable_cube
 
+numba_installed = True
+try:
+    importlib.util.find_spec("numba")
+    from improver.generate_ancillaries.numba_utilities import fast_compute_band_weights
+except ImportError:
+    numba_installed = False
+
+THRESHOLDS_DICT = {"bounds": [[0, 50], [50, 200]], "units": "m"}
+
 
 def set_up_orography_cube(data):
     """
@@ -36,385 +47,435 @@ def set_up_orography_cube(data):
     return orography
 
 
-class Test_add_weight_to_upper_adjacent_band(IrisTest):
-    """Test for adding weights to the upper adjacent band."""
-
-    def setUp(self):
-        """Set up plugin."""
-        self.plugin = GenerateTopographicZoneWeights()
-
-    def test_equal_to_max_band_number(self):
-        """Test that the results are as expected when the band number is equal
-        to the max band number."""
-        expected_weights = np.array([[[0.0, 0.0], [1.0, 1.0]]])
-
-        topographic_zone_weights = np.zeros((1, 2, 2))
-        orography_band = np.array([[25.0, 50.0], [75.0, 100.0]])
-        midpoint = 50.0
-        band_number = 0
-        max_band_number = 0
-        topographic_zone_weights = self.plugin.add_weight_to_upper_adjacent_band(
-            topographic_zone_weights,
-            orography_band,
-            midpoint,
-            band_number,
-            max_band_number,
-        )
-        self.assertIsInstance(topographic_zone_weights, np.ndarray)
-        self.assertArrayAlmostEqual(topographic_zone_weights, expected_weights)
-
-    def test_not_equal_to_max_band_number(self):
-        """Test that the results are as expected when the band number is not
-        equal to the max band number."""
-        expected_weights = np.array(
-            [[[1.0, 1.0], [0.75, 0.5]], [[0.0, 0.0], [0.25, 0.5]]]
-        )
-        topographic_zone_weights = np.array(
-            [[[1.0, 1.0], [0.75, 0.5]], [[0.0, 0.0], [0.0, 0.0]]]
-        )
-        orography_band = np.array([[25.0, 50.0], [75.0, 100.0]])
-        midpoint = 50.0
-        band_number = 0
-        max_band_number = 1
-        topographic_zone_weights = self.plugin.add_weight_to_upper_adjacent_band(
-            topographic_zone_weights,
-            orography_band,
-            midpoint,
-            band_number,
-            max_band_number,
-        )
-        self.assertIsInstance(topographic_zone_weights, np.ndarray)
-        self.assertArrayAlmostEqual(topographic_zone_weights, expected_weights)
-
-    def test_none_above_midpoint(self):
-        """Test that the results are as expected when none of the points
-        are above the midpoint."""
-        expected_weights = np.array(
-            [[[0.75, 1.0], [0.65, 0.7]], [[0.0, 0.0], [0.0, 0.0]]]
-        )
-        topographic_zone_weights = np.array(
-            [[[0.75, 1.0], [0.65, 0.7]], [[0.0, 0.0], [0.0, 0.0]]]
-        )
-        orography_band = np.array([[25.0, 50.0], [15.0, 30.0]])
-        midpoint = 50.0
-        band_number = 0
-        max_band_number = 1
-        topographic_zone_weights = self.plugin.add_weight_to_upper_adjacent_band(
-            topographic_zone_weights,
-            orography_band,
-            midpoint,
-            band_number,
-            max_band_number,
-        )
-        self.assertIsInstance(topographic_zone_weights, np.ndarray)
-        self.assertArrayAlmostEqual(topographic_zone_weights, expected_weights)
-
-    def test_all_above_midpoint(self):
-        """Test that the results are as expected when all of the points
-        are above the midpoint."""
-        expected_weights = np.array(
-            [[[0.75, 0.7], [0.6, 0.55]], [[0.25, 0.3], [0.4, 0.45]]]
-        )
-        topographic_zone_weights = np.array(
-            [[[0.75, 0.7], [0.6, 0.55]], [[0.0, 0.0], [0.0, 0.0]]]
-        )
-        orography_band = np.array([[75.0, 80.0], [90.0, 95.0]])
-        midpoint = 50.0
-        band_number = 0
-        max_band_number = 1
-        topographic_zone_weights = self.plugin.add_weight_to_upper_adjacent_band(
-            topographic_zone_weights,
-            orography_band,
-            midpoint,
-            band_number,
-            max_band_number,
-        )
-        self.assertIsInstance(topographic_zone_weights, np.ndarray)
-        self.assertArrayAlmostEqual(topographic_zone_weights, expected_weights)
+@pytest.fixture(name="orography_cube", scope="module")
+def orography_cube_fixture():
+    """Orography cube of shape (2, 2), shared by the tests in this module so
+    should not be modified in place."""
+    return set_up_orography_cube(np.array([[10.0, 25.0], [75.0, 100.0]]))
+
+
+@pytest.fixture(name="landmask_cube", scope="module")
+def landmask_cube_fixture(orography_cube):
+    """Land-sea mask on the grid of the orography cube, with a single sea
+    point. Shared by the tests in this module so should not be modified in
+    place."""
+    landmask_data = np.array([[0, 1], [1, 1]], dtype=np.float32)
+    landmask = orography_cube.copy(data=landmask_data)
+    landmask.rename("land_binary_mask")
+    landmask.units = Unit("1")
+    return landmask
+
+
+def test__parsed_bands_basic():
+    """Test that the lower and upper bounds are returned as separate
+    read-only float32 arrays."""
+    band_los, band_his = _parsed_bands(((0, 50), (50, 200)), "m", "m")
+    np.testing.assert_allclose(band_los, [0.0, 50.0])
+    np.testing.assert_allclose(band_his, [50.0, 200.0])
+    for band_bounds in (band_los, band_his):
+        assert band_bounds.dtype == np.float32
+        assert not band_bounds.flags.writeable
+
+
+def test__parsed_bands_unit_conversion():
+    """Test that the bounds are converted to the units of the
+    orography."""
+    band_los, band_his = _parsed_bands(((0, 0.05), (0.05, 0.2)), "km", "m")
+    np.testing.assert_allclose(band_los, [0.0, 50.0], atol=1e-4)
+    np.testing.assert_allclose(band_his, [50.0, 200.0], atol=1e-4)
+
+
+def test__parsed_bands_cached():
+    """Test that the parsed bands are reused for repeated calls."""
+    bounds = ((0, 100), (100, 300))
+    first = _parsed_bands(bounds, "m", "m")
+    hits = _parsed_bands.cache_info().hits
+    second = _parsed_bands(bounds, "m", "m")
+    assert _parsed_bands.cache_info().hits == hits + 1
+    assert first is second
+
+
+def test__parsed_bands_invalid_bounds():
+    """Test that an error is raised if the bounds of each band are not
+    an upper and lower limit."""
+    msg = "The bounds of each topographic band should have only an upper"
+    with pytest.raises(TypeError, match=msg):
+        _parsed_bands(((0, 50, 100),), "m", "m")
+
+
+@pytest.fixture(name="three_bands")
+def three_bands_fixture():
+    """Lower and upper bounds of three contiguous bands, with midpoints of
+    50, 150 and 250."""
+    return np.array([0.0, 100.0, 200.0]), np.array([100.0, 200.0, 300.0])
+
+
+def test_triangle_weights_single_band():
+    """Test that all points are given a weight of 1 when there is only a
+    single band."""
+    orography = np.array([[10.0, 25.0], [75.0, 100.0]])
+    result = GenerateTopographicZoneWeights().calculate_triangle_weights(
+        orography, np.array([0.0]), np.array([100.0]), 0
+    )
+    np.testing.assert_allclose(result, np.ones((2, 2)))
 
 
-class Test_add_weight_to_lower_adjacent_band(IrisTest):
-    """Test for adding weights to the lower adjacent band."""
+def test_triangle_weights_middle_band(three_bands):
+    """Test the weights of a band with adjacent bands both above and below,
+    including the weight added from points in the adjacent bands."""
+    orography = np.array([50.0, 75.0, 100.0, 125.0, 150.0, 175.0, 200.0, 250.0])
+    expected = np.array([0.0, 0.25, 0.5, 0.75, 1.0, 0.75, 0.5, 0.0])
+    result = GenerateTopographicZoneWeights().calculate_triangle_weights(
+        orography, *three_bands, 1
+    )
+    np.testing.assert_allclose(result, expected)
 
-    def setUp(self):
-        """Set up plugin."""
-        self.plugin = GenerateTopographicZoneWeights()
 
-    def test_equal_to_zeroth_band_number(self):
-        """Test that the results are as expected when the band number is equal
-        to the zeroth band."""
-        expected_weights = np.array([[[1.0, 0.0], [0.0, 0.0]]])
+def test_triangle_weights_lowest_band(three_bands):
+    """Test that points below the midpoint of the lowest band are given a
+    weight of 1, and points above it weight shared with the band above."""
+    orography = np.array([[10.0, 50.0], [75.0, 150.0]])
+    expected = np.array([[1.0, 1.0], [0.75, 0.0]])
+    result = GenerateTopographicZoneWeights().calculate_triangle_weights(
+        orography, *three_bands, 0
+    )
+    np.testing.assert_allclose(result, expected)
 
-        topographic_zone_weights = np.zeros((1, 2, 2))
-        orography_band = np.array([[25.0, 50.0], [75.0, 100.0]])
-        midpoint = 50.0
-        band_number = 0
-        topographic_zone_weights = self.plugin.add_weight_to_lower_adjacent_band(
-            topographic_zone_weights, orography_band, midpoint, band_number
-        )
-        self.assertIsInstance(topographic_zone_weights, np.ndarray)
-        self.assertArrayAlmostEqual(topographic_zone_weights, expected_weights)
-
-    def test_not_equal_to_zeroth_band_number(self):
-        """Test that the results are as expected when the band number is not
-        equal to the zeroth band number."""
-        expected_weights = np.array(
-            [[[0.25, 0.0], [0.0, 0.0]], [[0.75, 1.0], [1.0, 1.0]]]
-        )
-        topographic_zone_weights = np.array(
-            [[[0.0, 0.0], [0.0, 0.0]], [[0.75, 1.0], [1.0, 1.0]]]
-        )
-        orography_band = np.array([[25.0, 50.0], [75.0, 100.0]])
-        midpoint = 50.0
-        band_number = 1
-        topographic_zone_weights = self.plugin.add_weight_to_lower_adjacent_band(
-            topographic_zone_weights, orography_band, midpoint, band_number
-        )
-        self.assertIsInstance(topographic_zone_weights, np.ndarray)
-        self.assertArrayAlmostEqual(topographic_zone_weights, expected_weights)
-
-    def test_none_below_midpoint(self):
-        """Test that the results are as expected when none of the points
-        are below the midpoint."""
-        expected_weights = np.array(
-            [[[0.0, 0.0], [0.0, 0.0]], [[1.0, 1.0], [1.0, 1.0]]]
-        )
-        topographic_zone_weights = np.array(
-            [[[0.0, 0.0], [0.0, 0.0]], [[1.0, 1.0], [1.0, 1.0]]]
-        )
-        orography_band = np.array([[75.0, 50.0], [85.0, 70.0]])
-        midpoint = 50.0
-        band_number = 1
-        topographic_zone_weights = self.plugin.add_weight_to_lower_adjacent_band(
-            topographic_zone_weights, orography_band, midpoint, band_number
-        )
-        self.assertIsInstance(topographic_zone_weights, np.ndarray)
-        self.assertArrayAlmostEqual(topographic_zone_weights, expected_weights)
-
-    def test_all_below_midpoint(self):
-        """Test that the results are as expected when all of the points
-        are below the midpoint."""
-        expected_weights = np.array(
-            [[[0.25, 0.3], [0.4, 0.45]], [[0.75, 0.7], [0.6, 0.55]]]
-        )
-        topographic_zone_weights = np.array(
-            [[[0.0, 0.0], [0.0, 0.0]], [[0.75, 0.7], [0.6, 0.55]]]
-        )
-        orography_band = np.array([[25.0, 20.0], [10.0, 5.0]])
-        midpoint = 50.0
-        band_number = 1
-        topographic_zone_weights = self.plugin.add_weight_to_lower_adjacent_band(
-            topographic_zone_weights, orography_band, midpoint, band_number
-        )
-        self.assertIsInstance(topographic_zone_weights, np.ndarray)
-        self.assertArrayAlmostEqual(topographic_zone_weights, expected_weights)
-
-
-class Test_calculate_weights(IrisTest):
-    """Test the calculation of weights."""
-
-    def setUp(self):
-        """Set up plugin."""
-        self.plugin = GenerateTopographicZoneWeights()
-
-    def test_one_point(self):
-        """Test when the input array has one point."""
-        expected = np.array([0.75])
-        points = np.array([125])
-        band = [100, 200]
-        result = self.plugin.calculate_weights(points, band)
-        self.assertIsInstance(result, np.ndarray)
-        self.assertArrayAlmostEqual(result, expected)
-
-    def test_multiple_points_matching_points(self):
-        """Test when the input array has multiple points, which match the
-        midpoint and band limits."""
-        expected = np.array([0.5, 1.0, 0.5])
-        points = np.array([100, 150, 200])
-        band = [100, 200]
-        result = self.plugin.calculate_weights(points, band)
-        self.assertIsInstance(result, np.ndarray)
-        self.assertArrayAlmostEqual(result, expected)
-
-    def test_multiple_points_with_points_not_matching(self):
-        """Test when the input array has multiple points, which do not match
-        the midpoint and band limits."""
-        expected = np.array([0.6, 0.9, 0.6])
-        points = np.array([110, 140, 190])
-        band = [100, 200]
-        result = self.plugin.calculate_weights(points, band)
-        self.assertIsInstance(result, np.ndarray)
-        self.assertArrayAlmostEqual(result, expected)
-
-    def test_point_beyond_bands(self):
-        """Test when the input array has points beyond the band limits.
-        The default behaviour is for values beyond the band limits to be 0.5,
-        as 0.5 is the value at the band limits."""
-        expected = np.array([0.5, 1.0, 0.5])
-        points = np.array([90, 150, 210])
-        band = [100, 200]
-        result = self.plugin.calculate_weights(points, band)
-        self.assertIsInstance(result, np.ndarray)
-        self.assertArrayAlmostEqual(result, expected)
-
-
-class Test_process(IrisTest):
-    """Test the process method."""
-
-    def setUp(self):
-        """Set up data for testing."""
-        self.plugin = GenerateTopographicZoneWeights()
-        orography_data = np.array([[10.0, 25.0], [75.0, 100.0]])
-        self.orography = set_up_orography_cube(orography_data)
-
-        landmask_data = np.array([[0, 1], [1, 1]], dtype=np.float32)
-        landmask = self.orography.copy(data=landmask_data)
-        landmask.rename("land_binary_mask")
-        landmask.units = Unit("1")
-        self.landmask = landmask
-        self.thresholds_dict = {"bounds": [[0, 50], [50, 200]], "units": "m"}
-
-    def test_basic(self):
-        """Test that the output is a cube with the expected format."""
-        result = self.plugin.process(
-            self.orography, self.thresholds_dict, self.landmask
-        )
-        self.assertIsInstance(result, iris.cube.Cube)
-        self.assertEqual(result.name(), "topographic_zone_weights")
-        self.assertEqual(result.units, Unit("1"))
-        self.assertTrue(result.coord("topographic_zone"))
-        self.assertEqual(result.coord("topographic_zone").units, Unit("m"))
-
-    def test_invalid_orography(self):
-        """Test that the appropriate exception is raised if the orography has
-        more than two dimensions."""
-        orography_data = np.array([[[0.0, 25.0], [75.0, 100.0]]])
-        orography = set_up_orography_cube(orography_data)
-        msg = "The input orography cube should be two-dimensional"
-        with self.assertRaisesRegex(InvalidCubeError, msg):
-            self.plugin.process(orography, self.thresholds_dict, self.landmask)
-
-    def test_data(self):
-        """Test that the result data and mask is as expected."""
-        expected_weights_data = np.array(
-            [[[1e20, 1.0], [0.33, 0.17]], [[1e20, 0.0], [0.67, 0.83]]], dtype=np.float32
-        )
-        expected_weights_mask = np.array(
-            [[[True, False], [False, False]], [[True, False], [False, False]]]
-        )
-        result = self.plugin.process(
-            self.orography, self.thresholds_dict, self.landmask
-        )
-        self.assertIsInstance(result, iris.cube.Cube)
-        self.assertArrayAlmostEqual(result.data.data, expected_weights_data, decimal=2)
-        self.assertArrayAlmostEqual(result.data.mask, expected_weights_mask)
-
-    def test_data_no_mask(self):
-        """Test that the result data is as expected, when none of the points
-        are masked."""
-        expected_weights_data = np.array(
-            [[[1.0, 1.0], [0.33, 0.17]], [[0.0, 0.0], [0.67, 0.83]]], dtype=np.float32
+
+def test_triangle_weights_uppermost_band(three_bands):
+    """Test that points above the midpoint of the uppermost band are given a
+    weight of 1, and points below it weight shared with the band below."""
+    orography = np.array([[150.0, 175.0], [250.0, 290.0]])
+    expected = np.array([[0.0, 0.25], [1.0, 1.0]])
+    result = GenerateTopographicZoneWeights().calculate_triangle_weights(
+        orography, *three_bands, 2
+    )
+    np.testing.assert_allclose(result, expected)
+
+
+def test_triangle_weights_unequal_widths():
+    """Test that the weight added to an adjacent band follows the width of
+    the band containing the point, rather than the adjacent band."""
+    band_los, band_his = np.array([0.0, 50.0]), np.array([50.0, 250.0])
+    orography = np.array([37.5, 50.0, 100.0, 150.0])
+    result = GenerateTopographicZoneWeights().calculate_triangle_weights(
+        orography, band_los, band_his, 0
+    )
+    np.testing.assert_allclose(result, [0.75, 0.5, 0.25, 0.0])
+    result = GenerateTopographicZoneWeights().calculate_triangle_weights(
+        orography, band_los, band_his, 1
+    )
+    np.testing.assert_allclose(result, [0.25, 0.5, 0.75, 1.0])
+
+
+def test_add_weight_to_upper_adjacent_band():
+    """Test that the deprecated method adds 1-weight to the band above for
+    points above the midpoint, with a deprecation warning."""
+    expected_weights = np.array([[[1.0, 1.0], [0.75, 0.5]], [[0.0, 0.0], [0.25, 0.5]]])
+    topographic_zone_weights = np.array(
+        [[[1.0, 1.0], [0.75, 0.5]], [[0.0, 0.0], [0.0, 0.0]]]
+    )
+    orography_band = np.array([[25.0, 50.0], [75.0, 100.0]])
+    with pytest.warns(DeprecationWarning, match="calculate_triangle_weights"):
+        result = GenerateTopographicZoneWeights().add_weight_to_upper_adjacent_band(
+            topographic_zone_weights, orography_band, 50.0, 0, 1
         )
-        landmask_data = np.array([[1, 1], [1, 1]])
-        landmask = self.landmask.copy(landmask_data)
-        result = self.plugin.process(self.orography, self.thresholds_dict, landmask)
-        self.assertIsInstance(result, iris.cube.Cube)
-        self.assertArrayAlmostEqual(result.data, expected_weights_data, decimal=2)
-
-    def test_data_no_mask_input(self):
-        """Test that the result data is as expected, when no landsea
-           mask is input."""
-        expected_weights_data = np.array(
-            [[[1.0, 1.0], [0.33, 0.17]], [[0.0, 0.0], [0.67, 0.83]]], dtype=np.float32
+    np.testing.assert_allclose(result, expected_weights)
+
+
+def test_add_weight_to_lower_adjacent_band():
+    """Test that the deprecated method adds 1-weight to the band below for
+    points below the midpoint, with a deprecation warning."""
+    expected_weights = np.array([[[0.25, 0.0], [0.0, 0.0]], [[0.75, 1.0], [1.0, 1.0]]])
+    topographic_zone_weights = np.array(
+        [[[0.0, 0.0], [0.0, 0.0]], [[0.75, 1.0], [1.0, 1.0]]]
+    )
+    orography_band = np.array([[25.0, 50.0], [75.0, 100.0]])
+    with pytest.warns(DeprecationWarning, match="calculate_triangle_weights"):
+        result = GenerateTopographicZoneWeights().add_weight_to_lower_adjacent_band(
+            topographic_zone_weights, orography_band, 50.0, 1
         )
-        result = self.plugin.process(self.orography, self.thresholds_dict)
-        self.assertIsInstance(result, iris.cube.Cube)
-        self.assertArrayAlmostEqual(result.data, expected_weights_data, decimal=2)
-
-    def test_data_no_mask_input_metatdata(self):
-        """Test that the result metadata is as expected, when no landsea
-           mask is input."""
-        result = self.plugin.process(self.orography, self.thresholds_dict)
-        self.assertIsInstance(result, iris.cube.Cube)
-        self.assertEqual(
-            result.attributes["topographic_zones_include_seapoints"], "True"
+    np.testing.assert_allclose(result, expected_weights)
+
+
+def test_calculate_weights():
+    """Test that the deprecated method gives weights of 1 at the midpoint of
+    the band and 0.5 at and beyond its edges, with a deprecation warning."""
+    with pytest.warns(DeprecationWarning, match="calculate_triangle_weights"):
+        result = GenerateTopographicZoneWeights().calculate_weights(
+            np.array([90, 100, 125, 150, 200, 210]), [100, 200]
         )
+    assert result.dtype == np.float32
+    np.testing.assert_allclose(result, [0.5, 0.5, 0.75, 1.0, 0.5, 0.5])
+
+
+@pytest.fixture(name="band_weights_inputs")
+def band_weights_inputs_fixture():
+    """Random orography with bands that cover all but the extremes of the
+    orography."""
+    np.random.seed(0)
+    orography = np.random.uniform(-10.0, 310.0, (20, 30)).astype(np.float32)
+    band_los = np.array([0, 50, 200], dtype=np.float32)
+    band_his = np.array([50, 200, 300], dtype=np.float32)
+    return orography, band_los, band_his
+
+
+def test_compute_band_weights_slow():
+    """Test the NumPy implementation against a known result."""
+    orography = np.array([[10.0, 25.0], [75.0, 100.0]], dtype=np.float32)
+    band_los = np.array([0, 50], dtype=np.float32)
+    band_his = np.array([50, 200], dtype=np.float32)
+    expected = np.array(
+        [[[1.0, 1.0], [0.33, 0.17]], [[0.0, 0.0], [0.67, 0.83]]], dtype=np.float32
+    )
+    result = np.full((2, 2, 2), np.nan, dtype=np.float32)
+    GenerateTopographicZoneWeights().slow_compute_band_weights(
+        orography, band_los, band_his, result
+    )
+    np.testing.assert_allclose(result, expected, atol=0.01)
+
+
+def test_slow_compute_band_weights_outside_bands():
+    """Test that points in a gap between bands, outside all of the bands or
+    with NaN orography are given a weight of 0 in all bands."""
+    orography = np.array([[50.0, 150.0], [350.0, np.nan]], dtype=np.float32)
+    band_los = np.array([0, 200], dtype=np.float32)
+    band_his = np.array([100, 300], dtype=np.float32)
+    out = np.full((2, 2, 2), np.nan, dtype=np.float32)
+    GenerateTopographicZoneWeights().slow_compute_band_weights(
+        orography, band_los, band_his, out
+    )
+    expected = np.array([[[1.0, 0.0], [0.0, 0.0]], [[0.0, 0.0], [0.0, 0.0]]])
+    np.testing.assert_allclose(out, expected)
+
+
+def test_compute_band_weights_output_shape(band_weights_inputs):
+    """Test that the weights are returned with the band as the leading
+    dimension."""
+    result = GenerateTopographicZoneWeights().compute_band_weights(*band_weights_inputs)
+    assert result.shape == (3, 20, 30)
+    assert result.dtype == np.float32
+
+
+@patch.dict("sys.modules", numba=None)
+@patch.object(GenerateTopographicZoneWeights, "slow_compute_band_weights")
+def test_slow_compute_band_weights_called(weights_imp, band_weights_inputs):
+    """Test that slow_compute_band_weights is called if numba is not
+    installed."""
+    msg = "Module numba unavailable"
+    with pytest.warns(UserWarning, match=msg):
+        GenerateTopographicZoneWeights().compute_band_weights(*band_weights_inputs)
+    weights_imp.assert_called_once_with(*band_weights_inputs, mock.ANY)
+
+
+@pytest.mark.skipif(not numba_installed, reason="numba not installed")
+@patch("improver.generate_ancillaries.numba_utilities.fast_compute_band_weights")
+def test_fast_compute_band_weights_called(weights_imp, band_weights_inputs):
+    """Test that fast_compute_band_weights is called if numba is
+    installed."""
+    GenerateTopographicZoneWeights().compute_band_weights(*band_weights_inputs)
+    weights_imp.assert_called_once_with(*band_weights_inputs, mock.ANY, "C")
+
+
+@pytest.mark.skipif(not numba_installed, reason="numba not installed")
+@pytest.mark.parametrize("order", ("C", "F"))
+def test_compute_band_weights_slow_vs_fast(band_weights_inputs, order):
+    """Test that slow and fast versions give the same result, for output in
+    either memory layout."""
+    result_slow = np.empty((3, 20, 30), dtype=np.float32)
+    GenerateTopographicZoneWeights().slow_compute_band_weights(
+        *band_weights_inputs, result_slow
+    )
+    result_fast = np.full_like(result_slow, np.nan, order=order)
+    fast_compute_band_weights(*band_weights_inputs, result_fast, order)
+    np.testing.assert_allclose(result_slow, result_fast, atol=1e-6)
+
 
-    def test_data_no_mask_three_bands(self):
-        """Test that the result data is as expected, when none of the points
-        are masked and there are three bands defined."""
-        orography_data = np.array(
-            [[10.0, 40.0, 45.0], [70.0, 80.0, 95.0], [115.0, 135.0, 145.0]]
+def test_process_basic(orography_cube, landmask_cube):
+    """Test that the output is a cube with the expected format."""
+    result = GenerateTopographicZoneWeights().process(
+        orography_cube, THRESHOLDS_DICT, landmask_cube
+    )
+    assert isinstance(result, iris.cube.Cube)
+    assert result.name() == "topographic_zone_weights"
+    assert result.units == Unit("1")
+    assert result.coord("topographic_zone")
+    assert result.coord("topographic_zone").units == Unit("m")
+
+
+def test_process_invalid_orography(landmask_cube):
+    """Test that the appropriate exception is raised if the orography has
+    more than two dimensions."""
+    orography_data = np.array([[[0.0, 25.0], [75.0, 100.0]]])
+    orography = set_up_orography_cube(orography_data)
+    msg = "The input orography cube should be two-dimensional"
+    with pytest.raises(InvalidCubeError, match=msg):
+        GenerateTopographicZoneWeights().process(
+            orography, THRESHOLDS_DICT, landmask_cube
         )
-        orography = set_up_orography_cube(orography_data)
-
-        landmask_data = np.array([[1, 1, 1], [1, 1, 1], [1, 1, 1]])
-        landmask = orography.copy(data=landmask_data)
-        landmask.rename("land_binary_mask")
-        landmask.units = Unit("1")
-
-        thresholds_dict = {"bounds": [[0, 50], [50, 100], [100, 150]], "units": "m"}
-        expected_weights_data = np.array(
-            [
-                [[1.0, 0.7, 0.6], [0.1, 0.0, 0.0], [0.0, 0.0, 0.0]],
-                [[0.0, 0.3, 0.4], [0.9, 0.9, 0.6], [0.2, 0.0, 0.0]],
-                [[0.0, 0.0, 0.0], [0.0, 0.1, 0.4], [0.8, 1.0, 1.0]],
-            ]
+
+
+def test_process_data(orography_cube, landmask_cube):
+    """Test that the result data and mask is as expected."""
+    expected_weights_data = np.array(
+        [[[1e20, 1.0], [0.33, 0.17]], [[1e20, 0.0], [0.67, 0.83]]], dtype=np.float32
+    )
+    expected_weights_mask = np.array(
+        [[[True, False], [False, False]], [[True, False], [False, False]]]
+    )
+    result = GenerateTopographicZoneWeights().process(
+        orography_cube, THRESHOLDS_DICT, landmask_cube
+    )
+    assert isinstance(result, iris.cube.Cube)
+    np.testing.assert_allclose(result.data.data, expected_weights_data, atol=0.01)
+    np.testing.assert_array_equal(result.data.mask, expected_weights_mask)
+
+
+def test_process_data_no_mask(orography_cube, landmask_cube):
+    """Test that the result data is as expected, when none of the points
+    are masked."""
+    expected_weights_data = np.array(
+        [[[1.0, 1.0], [0.33, 0.17]], [[0.0, 0.0], [0.67, 0.83]]], dtype=np.float32
+    )
+    landmask_data = np.array([[1, 1], [1, 1]])
+    landmask = landmask_cube.copy(landmask_data)
+    result = GenerateTopographicZoneWeights().process(
+        orography_cube, THRESHOLDS_DICT, landmask
+    )
+    assert isinstance(result, iris.cube.Cube)
+    np.testing.assert_allclose(result.data, expected_weights_data, atol=0.01)
+
+
+def test_process_data_no_mask_input(orography_cube):
+    """Test that the result data is as expected, when no landsea
+    mask is input."""
+    expected_weights_data = np.array(
+        [[[1.0, 1.0], [0.33, 0.17]], [[0.0, 0.0], [0.67, 0.83]]], dtype=np.float32
+    )
+    result = GenerateTopographicZoneWeights().process(orography_cube, THRESHOLDS_DICT)
+    assert isinstance(result, iris.cube.Cube)
+    np.testing.assert_allclose(result.data, expected_weights_data, atol=0.01)
+
+
+def test_process_data_no_mask_input_metadata(orography_cube):
+    """Test that the result metadata is as expected, when no landsea
+    mask is input."""
+    result = GenerateTopographicZoneWeights().process(orography_cube, THRESHOLDS_DICT)
+    assert isinstance(result, iris.cube.Cube)
+    assert result.attributes["topographic_zones_include_seapoints"] == "True"
+
+
+def test_process_data_no_mask_three_bands():
+    """Test that the result data is as expected, when none of the points
+    are masked and there are three bands defined."""
+    orography_data = np.array(
+        [[10.0, 40.0, 45.0], [70.0, 80.0, 95.0], [115.0, 135.0, 145.0]]
+    )
+    orography = set_up_orography_cube(orography_data)
+
+    landmask_data = np.array([[1, 1, 1], [1, 1, 1], [1, 1, 1]])
+    landmask = orography.copy(data=landmask_data)
+    landmask.rename("land_binary_mask")
+    landmask.units = Unit("1")
+
+    thresholds_dict = {"bounds": [[0, 50], [50, 100], [100, 150]], "units": "m"}
+    expected_weights_data = np.array(
+        [
+            [[1.0, 0.7, 0.6], [0.1, 0.0, 0.0], [0.0, 0.0, 0.0]],
+            [[0.0, 0.3, 0.4], [0.9, 0.9, 0.6], [0.2, 0.0, 0.0]],
+            [[0.0, 0.0, 0.0], [0.0, 0.1, 0.4], [0.8, 1.0, 1.0]],
+        ]
+    )
+    result = GenerateTopographicZoneWeights().process(
+        orography, thresholds_dict, landmask
+    )
+    assert isinstance(result, iris.cube.Cube)
+    np.testing.assert_allclose(result.data, expected_weights_data, atol=0.01)
+
+
+def test_process_different_band_units(orography_cube, landmask_cube):
+    """Test for if the thresholds are specified in a different unit to
+    the orography. The thresholds are converted to match the units of the
+    orography."""
+    expected_weights_data = np.array(
+        [[[1e20, 1.0], [0.333, 0.167]], [[1e20, 0.0], [0.67, 0.83]]],
+        dtype=np.float32,
+    )
+    expected_weights_mask = np.array(
+        [[[True, False], [False, False]], [[True, False], [False, False]]]
+    )
+    thresholds_dict = {"bounds": [[0, 0.05], [0.05, 0.2]], "units": "km"}
+    result = GenerateTopographicZoneWeights().process(
+        orography_cube, thresholds_dict, landmask_cube
+    )
+    assert isinstance(result, iris.cube.Cube)
+    np.testing.assert_allclose(result.data.data, expected_weights_data, atol=0.01)
+    np.testing.assert_array_equal(result.data.mask, expected_weights_mask)
+
+
+def test_process_one_band_with_orography_in_band(orography_cube, landmask_cube):
+    """Test that if only one band is specified, the results are as
+    expected."""
+    expected_weights_data = np.array([[1e20, 1.0], [1.0, 1.0]], dtype=np.float32)
+    expected_weights_mask = np.array([[True, False], [False, False]])
+    orography_data = np.array([[10.0, 20.0], [30.0, 40.0]], dtype=np.float32)
+    orography = orography_cube.copy(data=orography_data)
+    thresholds_dict = {"bounds": [[0, 50]], "units": "m"}
+    result = GenerateTopographicZoneWeights().process(
+        orography, thresholds_dict, landmask_cube
+    )
+    assert isinstance(result, iris.cube.Cube)
+    np.testing.assert_allclose(result.data.data, expected_weights_data, atol=0.01)
+    np.testing.assert_array_equal(result.data.mask, expected_weights_mask)
+
+
+def test_process_warning_if_orography_above_bands(orography_cube, landmask_cube):
+    """Test that a warning is raised if the orography is greater than the
+    maximum band."""
+    orography_data = np.array([[60.0, 70.0], [80.0, 90.0]])
+    orography = orography_cube.copy(data=orography_data)
+    thresholds_dict = {"bounds": [[0, 50]], "units": "m"}
+    msg = "The maximum orography is greater than the uppermost band"
+    with pytest.warns(UserWarning, match=msg):
+        GenerateTopographicZoneWeights().process(
+            orography, thresholds_dict, landmask_cube
         )
-        result = self.plugin.process(orography, thresholds_dict, landmask)
-        self.assertIsInstance(result, iris.cube.Cube)
-        self.assertArrayAlmostEqual(result.data, expected_weights_data, decimal=2)
-
-    def test_different_band_units(self):
-        """Test for if the thresholds are specified in a different unit to
-        the orography. The thresholds are converted to match the units of the
-        orography."""
-        expected_weights_data = np.array(
-            [[[1e20, 1.0], [0.333, 0.167]], [[1e20, 0.0], [0.67, 0.83]]],
-            dtype=np.float32,
+
+
+def test_process_warning_if_orography_below_bands(orography_cube, landmask_cube):
+    """Test that a warning is raised if the orography is lower than the
+    minimum band."""
+    orography_data = np.array([[60.0, 70.0], [80.0, 90.0]])
+    orography = orography_cube.copy(data=orography_data)
+    thresholds_dict = {"bounds": [[100, 150]], "units": "m"}
+    msg = "The minimum orography is lower than the lowest band"
+    with pytest.warns(UserWarning, match=msg):
+        GenerateTopographicZoneWeights().process(
+            orography, thresholds_dict, landmask_cube
         )
-        expected_weights_mask = np.array(
-            [[[True, False], [False, False]], [[True, False], [False, False]]]
+
+
+@pytest.mark.parametrize("with_landmask", (True, False))
+def test_process_fortran_output_order(orography_cube, landmask_cube, with_landmask):
+    """Test that the weights are returned in Fortran order, with the same
+    values and mask, if output_order is "F"."""
+    landmask = landmask_cube if with_landmask else None
+    plugin = GenerateTopographicZoneWeights()
+    expected = plugin.process(orography_cube, THRESHOLDS_DICT, landmask)
+    result = plugin.process(orography_cube, THRESHOLDS_DICT, landmask, output_order="F")
+    assert result.data.flags.f_contiguous
+    assert not result.data.flags.c_contiguous
+    np.testing.assert_array_equal(result.data, expected.data)
+    np.testing.assert_array_equal(
+        np.ma.getmaskarray(result.data), np.ma.getmaskarray(expected.data)
+    )
+    assert result == expected
+
+
+def test_process_invalid_output_order(orography_cube):
+    """Test that an error is raised if the output order is not recognised."""
+    msg = 'output_order must be "C" or "F"'
+    with pytest.raises(ValueError, match=msg):
+        GenerateTopographicZoneWeights().process(
+            orography_cube, THRESHOLDS_DICT, output_order="A"
         )
-        thresholds_dict = {"bounds": [[0, 0.05], [0.05, 0.2]], "units": "km"}
-        result = self.plugin.process(self.orography, thresholds_dict, self.landmask)
-        self.assertIsInstance(result, iris.cube.Cube)
-        self.assertArrayAlmostEqual(result.data.data, expected_weights_data, decimal=2)
-        self.assertArrayAlmostEqual(result.data.mask, expected_weights_mask)
-
-    def test_one_band_with_orography_in_band(self):
-        """Test that if only one band is specified, the results are as
-        expected."""
-        expected_weights_data = np.array([[1e20, 1.0], [1.0, 1.0]], dtype=np.float32)
-        expected_weights_mask = np.array([[True, False], [False, False]])
-        orography_data = np.array([[10.0, 20.0], [30.0, 40.0]], dtype=np.float32)
-        orography = self.orography.copy(data=orography_data)
-        thresholds_dict = {"bounds": [[0, 50]], "units": "m"}
-        result = self.plugin.process(orography, thresholds_dict, self.landmask)
-        self.assertIsInstance(result, iris.cube.Cube)
-        self.assertArrayAlmostEqual(result.data.data, expected_weights_data, decimal=2)
-        self.assertArrayAlmostEqual(result.data.mask, expected_weights_mask)
-
-    def test_warning_if_orography_above_bands(self):
-        """Test that a warning is raised if the orography is greater than the
-        maximum band."""
-        orography_data = np.array([[60.0, 70.0], [80.0, 90.0]])
-        orography = self.orography.copy(data=orography_data)
-        thresholds_dict = {"bounds": [[0, 50]], "units": "m"}
-        msg = "The maximum orography is greater than the uppermost band"
-        with pytest.warns(UserWarning, match=msg):
-            self.plugin.process(orography, thresholds_dict, self.landmask)
-
-    def test_warning_if_orography_below_bands(self):
-        """Test that a warning is raised if the orography is lower than the
-        minimum band."""
-        orography_data = np.array([[60.0, 70.0], [80.0, 90.0]])
-        orography = self.orography.copy(data=orography_data)
-        thresholds_dict = {"bounds": [[100, 150]], "units": "m"}
-        msg = "The minimum orography is lower than the lowest band"
-        with pytest.warns(UserWarning, match=msg):
-            self.plugin.process(orography, thresholds_dict, self.landmask)
-
-
-if __name__ == "__main__":
-    unittest.main()
@@ -4,201 +4,257 @@
 # See LICENSE in the root of the repository for full licensing details.
 """Unit tests for the percentile.PercentileConverter plugin."""
 
-import unittest
-from datetime import datetime
-
 import iris
 import numpy as np
+import pytest
 from iris.exceptions import CoordinateNotFoundError
-from iris.tests import IrisTest
 
 from improver.percentile import PercentileConverter
 from improver.synthetic_data.set_up_test_cubes import set_up_variable_cube
 from improver.utilities.cube_manipulation import get_coord_names, get_dim_coord_names
 
-
-class Test_process(IrisTest):
-
-    """Test the creation of percentiles by the plugin."""
-
-    def setUp(self):
-        """Create a cube with collapsable coordinates.
-
-        Data is formatted to increase linearly in x/y dimensions,
-        e.g.
-              0 0 0 0
-              1 1 1 1
-              2 2 2 2
-              3 3 3 3
-
-        """
-        data = [[list(range(0, 11, 1))] * 11] * 3
-        data = np.array(data).astype(np.float32)
-        data.resize((3, 11, 11))
-        self.cube = set_up_variable_cube(data, realizations=[0, 1, 2])
-        self.default_percentiles = np.array(
-            [0, 5, 10, 20, 25, 30, 40, 50, 60, 70, 75, 80, 90, 95, 100]
-        )
-
-    def test_valid_single_coord_string(self):
-        """Test that the plugin handles a valid collapse_coord passed in
-        as a string."""
-
-        collapse_coord = "longitude"
-
-        plugin = PercentileConverter(collapse_coord)
-        result = plugin.process(self.cube)
-
-        # Check percentile values.
-        self.assertArrayAlmostEqual(
-            result.data[:, 0, 0], self.default_percentiles * 0.1
-        )
-        # Check coordinate name.
-        self.assertEqual(result.coords()[0].name(), "percentile")
-        # Check coordinate units.
-        self.assertEqual(result.coords()[0].units, "%")
-        # Check coordinate points.
-        self.assertArrayEqual(
-            result.coord("percentile").points,
-            [0, 5, 10, 20, 25, 30, 40, 50, 60, 70, 75, 80, 90, 95, 100],
-        )
-        # Check resulting data shape.
-        self.assertEqual(result.data.shape, (15, 3, 11))
-
-    def test_valid_single_coord_string_for_time(self):
-        """Test that the plugin handles time being the collapse_coord that is
-        passed in as a string."""
-        data = [[list(range(1, 12, 1))] * 11] * 3
-        data = np.array(data).astype(np.float32)
-        data.resize((3, 11, 11))
-        new_cube = set_up_variable_cube(
-            data,
-            time=datetime(2017, 11, 11, 4, 0),
-            frt=datetime(2017, 11, 11, 0, 0),
-            realizations=[0, 1, 2],
-        )
-        cube = iris.cube.CubeList([self.cube, new_cube]).merge_cube()
-
-        collapse_coord = "time"
-
-        plugin = PercentileConverter(collapse_coord)
-        result = plugin.process(cube)
-
-        # Check percentile values.
-        self.assertArrayAlmostEqual(
-            result.data[:, 0, 0, 0], self.default_percentiles * 0.01
-        )
-        # Check coordinate name.
-        self.assertEqual(result.coords()[0].name(), "percentile")
-        # Check coordinate units.
-        self.assertEqual(result.coords()[0].units, "%")
-        # Check coordinate points.
-        self.assertArrayEqual(
-            result.coord("percentile").points,
-            [0, 5, 10, 20, 25, 30, 40, 50, 60, 70, 75, 80, 90, 95, 100],
-        )
-        # Check resulting data shape.
-        self.assertEqual(result.data.shape, (15, 3, 11, 11))
-
-    def test_valid_multi_coord_string_list(self):
-        """Test that the plugin handles a valid list of collapse_coords passed
-        in as a list of strings."""
-
-        collapse_coord = ["longitude", "latitude"]
-
-        plugin = PercentileConverter(collapse_coord)
-        result = plugin.process(self.cube)
-
-        # Check percentile values.
-        self.assertArrayAlmostEqual(
-            result.data[:, 0],
-            [
-                0.0,
-                0.0,
-                1.0,
-                2.0,
-                2.0,
-                3.0,
-                4.0,
-                5.0,
-                6.0,
-                7.0,
-                8.0,
-                8.0,
-                9.0,
-                10.0,
-                10.0,
-            ],
-        )
-        # Check coordinate name.
-        self.assertEqual(result.coords()[0].name(), "percentile")
-        # Check coordinate units.
-        self.assertEqual(result.coords()[0].units, "%")
-        # Check coordinate points.
-        self.assertArrayEqual(
-            result.coord("percentile").points,
-            [0, 5, 10, 20, 25, 30, 40, 50, 60, 70, 75, 80, 90, 95, 100],
-        )
-        # Check resulting data shape.
-        self.assertEqual(result.data.shape, (15, 3))
-
-    def test_single_percentile(self):
-        """Test dimensions of output at median only"""
-        collapse_coord = ["realization"]
-        plugin = PercentileConverter(collapse_coord, percentiles=[50])
-        result = plugin.process(self.cube)
-        result_coords = get_coord_names(result)
-        self.assertNotIn("realization", result_coords)
-        self.assertIn("percentile", result_coords)
-        self.assertNotIn("percentile", get_dim_coord_names(result))
-
-    def test_use_with_masked_data(self):
-        """Test that the plugin handles masked data, this requiring the option
-        fast_percentile_method=False."""
-
-        mask = np.zeros((3, 11, 11))
-        mask[:, :, 1:-1:2] = 1
-        masked_data = np.ma.array(self.cube.data, mask=mask)
-        cube = self.cube.copy(data=masked_data)
-        collapse_coord = "longitude"
-
-        plugin = PercentileConverter(collapse_coord, fast_percentile_method=False)
-        result = plugin.process(cube)
-
-        # Check percentile values.
-        self.assertArrayAlmostEqual(
-            result.data[:, 0, 0], self.default_percentiles * 0.1
-        )
-        # Check coordinate name.
-        self.assertEqual(result.coords()[0].name(), "percentile")
-        # Check coordinate units.
-        self.assertEqual(result.coords()[0].units, "%")
-        # Check coordinate points.
-        self.assertArrayEqual(
-            result.coord("percentile").points,
-            [0, 5, 10, 20, 25, 30, 40, 50, 60, 70, 75, 80, 90, 95, 100],
-        )
-        # Check resulting data shape.
-        self.assertEqual(result.data.shape, (15, 3, 11))
-
-    def test_unavailable_collapse_coord(self):
-        """Test that the plugin handles a collapse_coord that is not
-        available in the cube."""
-
-        collapse_coord = "not_a_coordinate"
-        plugin = PercentileConverter(collapse_coord)
-        msg = "Coordinate "
-        with self.assertRaisesRegex(CoordinateNotFoundError, msg):
-            plugin.process(self.cube)
-
-    def test_invalid_collapse_coord_type(self):
-        """Test that the plugin handles invalid collapse_coord type."""
-
-        collapse_coord = self.cube
-        msg = "collapse_coord is "
-        with self.assertRaisesRegex(TypeError, msg):
-            PercentileConverter(collapse_coord)
-
-
-if __name__ == "__main__":
-    unittest.main()
+DEFAULT_PERCENTILES = np.array(
+    [0, 5, 10, 20, 25, 30, 40, 50, 60, 70, 75, 80, 90, 95, 100], dtype=np.float32
+)
+# Expected percentile values of the test data when collapsing in longitude
+# and time respectively.
+DEFAULT_PERCENTILES_X01 = DEFAULT_PERCENTILES * np.float32(0.1)
+DEFAULT_PERCENTILES_X001 = DEFAULT_PERCENTILES * np.float32(0.01)
+# The expected values are shared by all of the tests, so make sure that no
+# test can modify them.
+DEFAULT_PERCENTILES.setflags(write=False)
+DEFAULT_PERCENTILES_X01.setflags(write=False)
+DEFAULT_PERCENTILES_X001.setflags(write=False)
+
+
+@pytest.fixture(name="base_cube", scope="module")
+def base_cube_fixture():
+    """Create a cube with collapsable coordinates. The cube is shared by the
+    tests in this module, so should not be modified.
+
+    Data is formatted to increase linearly in x/y dimensions,
+    e.g.
+          0 0 0 0
+          1 1 1 1
+          2 2 2 2
+          3 3 3 3
+
+    """
+    data = np.ascontiguousarray(
+        np.broadcast_to(np.arange(11, dtype=np.float32), (3, 11, 11))
+    )
+    return set_up_variable_cube(data, realizations=[0, 1, 2])
+
+
+def _make_time_cube(base_cube, with_bounds=False):
+    """Create a cube with the coordinates of the base cube at its own time
+    and 24 hours later, with the data increased by one at the later time.
+    The cube is built directly, rather than by merging a cube for each time.
+    The time coordinate is optionally given bounds of one hour."""
+    data = np.stack([base_cube.data, base_cube.data + 1])
+    time, frt = base_cube.coord("time"), base_cube.coord("forecast_reference_time")
+    day = 24 * 3600
+    time_points = np.concatenate([time.points, time.points + day])
+    bounds = None
+    if with_bounds:
+        bounds = np.stack([time_points - 3600, time_points], axis=-1)
+    time_coord = time.copy(points=time_points, bounds=bounds)
+    frt_coord = iris.coords.AuxCoord.from_coord(frt).copy(
+        points=np.concatenate([frt.points, frt.points + day])
+    )
+    dim_coords = [(time_coord, 0)] + [
+        (coord.copy(), base_cube.coord_dims(coord)[0] + 1)
+        for coord in base_cube.coords(dim_coords=True)
+    ]
+    aux_coords = [(frt_coord, 0)] + [
+        (coord.copy(), None)
+        for coord in base_cube.coords(dim_coords=False)
+        if coord not in (time, frt)
+    ]
+    return iris.cube.Cube(
+        data,
+        dim_coords_and_dims=dim_coords,
+        aux_coords_and_dims=aux_coords,
+        **base_cube.metadata._asdict(),
+    )
+
+
+@pytest.fixture(name="time_cube", scope="module")
+def time_cube_fixture(base_cube):
+    """Cube with two times, shared by the tests in this module."""
+    return _make_time_cube(base_cube)
+
+
+@pytest.fixture(name="time_cube_with_bounds", scope="module")
+def time_cube_with_bounds_fixture(base_cube):
+    """Cube with two times and time bounds, shared by the tests in this
+    module."""
+    return _make_time_cube(base_cube, with_bounds=True)
+
+
+@pytest.fixture(name="masked_cube", scope="module")
+def masked_cube_fixture(base_cube):
+    """Copy of the base cube with every other longitude masked, except at the
+    edges of the domain."""
+    mask = np.zeros((3, 11, 11), dtype=bool)
+    mask[:, :, 1:-1:2] = True
+    return base_cube.copy(data=np.ma.array(base_cube.data, mask=mask))
+
+
+@pytest.fixture(name="plugin_lon", scope="module")
+def plugin_lon_fixture():
+    """Plugin collapsing longitude. The plugin holds only its configuration,
+    so can be shared by the tests in this module."""
+    return PercentileConverter("longitude")
+
+
+@pytest.fixture(name="plugin_lonlat", scope="module")
+def plugin_lonlat_fixture():
+    """Plugin collapsing longitude and latitude."""
+    return PercentileConverter(["longitude", "latitude"])
+
+
+@pytest.fixture(name="plugin_lon_slow", scope="module")
+def plugin_lon_slow_fixture():
+    """Plugin collapsing longitude without the fast percentile method."""
+    return PercentileConverter("longitude", fast_percentile_method=False)
+
+
+def _assert_percentile_metadata(result, expected_shape):
+    """Check that the leading coordinate of the result is the percentile
+    coordinate with the default percentiles, and that the result data has the
+    expected shape."""
+    assert result.coords()[0].name() == "percentile"
+    assert result.coords()[0].units == "%"
+    np.testing.assert_array_equal(
+        result.coord("percentile").points, DEFAULT_PERCENTILES
+    )
+    assert result.coord("percentile").dtype == DEFAULT_PERCENTILES.dtype
+    assert result.data.shape == expected_shape
+
+
+def test_valid_single_coord_string(base_cube, plugin_lon):
+    """Test that the plugin handles a valid collapse_coord passed in
+    as a string."""
+
+    result = plugin_lon.process(base_cube)
+
+    # Check percentile values.
+    np.testing.assert_allclose(result.data[:, 0, 0], DEFAULT_PERCENTILES_X01, atol=1e-6)
+    _assert_percentile_metadata(result, (15, 3, 11))
+
+
+def test_valid_single_coord_string_for_time(time_cube):
+    """Test that the plugin handles time being the collapse_coord that is
+    passed in as a string."""
+    collapse_coord = "time"
+
+    plugin = PercentileConverter(collapse_coord)
+    result = plugin.process(time_cube)
+
+    # Check percentile values.
+    np.testing.assert_allclose(
+        result.data[:, 0, 0, 0], DEFAULT_PERCENTILES_X001, atol=1e-6
+    )
+    _assert_percentile_metadata(result, (15, 3, 11, 11))
+
+
+def test_retain_time_coordinate_bounds(time_cube_with_bounds, plugin_lon):
+    """Test that the points and bounds of the time coordinates are retained
+    when collapsing a different coordinate."""
+    cube = time_cube_with_bounds
+    result = plugin_lon.process(cube)
+    for name in ("time", "forecast_reference_time"):
+        result_coord, input_coord = result.coord(name), cube.coord(name)
+        np.testing.assert_array_equal(result_coord.points, input_coord.points)
+        np.testing.assert_array_equal(result_coord.bounds, input_coord.bounds)
+    assert result.data.shape == (15, 2, 3, 11)
+
+
+def test_valid_multi_coord_string_list(base_cube, plugin_lonlat):
+    """Test that the plugin handles a valid list of collapse_coords passed
+    in as a list of strings."""
+
+    result = plugin_lonlat.process(base_cube)
+
+    # Check percentile values.
+    np.testing.assert_allclose(
+        result.data[:, 0],
+        [
+            0.0,
+            0.0,
+            1.0,
+            2.0,
+            2.0,
+            3.0,
+            4.0,
+            5.0,
+            6.0,
+            7.0,
+            8.0,
+            8.0,
+            9.0,
+            10.0,
+            10.0,
+        ],
+        atol=1e-6,
+    )
+    _assert_percentile_metadata(result, (15, 3))
+
+
+@pytest.mark.parametrize("fast_percentile_method", (True, False))
+def test_large_ensemble(fast_percentile_method):
+    """Test the percentiles of a realistically sized ensemble match those
+    calculated directly with numpy for both percentile methods."""
+    rng = np.random.default_rng(0)
+    data = rng.normal(280, 5, size=(50, 20, 20)).astype(np.float32)
+    cube = set_up_variable_cube(data, realizations=list(range(50)))
+    plugin = PercentileConverter(
+        "realization", fast_percentile_method=fast_percentile_method
+    )
+    result = plugin.process(cube)
+    expected = np.percentile(data, DEFAULT_PERCENTILES, axis=0)
+    assert result.dtype == np.float32
+    np.testing.assert_allclose(result.data, expected, rtol=1e-6)
+
+
+def test_single_percentile(base_cube):
+    """Test dimensions of output at median only"""
+    collapse_coord = ["realization"]
+    plugin = PercentileConverter(collapse_coord, percentiles=[50])
+    result = plugin.process(base_cube)
+    result_coords = get_coord_names(result)
+    assert "realization" not in result_coords
+    assert "percentile" in result_coords
+    assert "percentile" not in get_dim_coord_names(result)
+
+
+def test_use_with_masked_data(masked_cube, plugin_lon_slow):
+    """Test that the plugin handles masked data, this requiring the option
+    fast_percentile_method=False."""
+
+    result = plugin_lon_slow.process(masked_cube)
+
+    # Check percentile values.
+    np.testing.assert_allclose(result.data[:, 0, 0], DEFAULT_PERCENTILES_X01, atol=1e-6)
+    _assert_percentile_metadata(result, (15, 3, 11))
+
+
+def test_unavailable_collapse_coord(base_cube):
+    """Test that the plugin handles a collapse_coord that is not
+    available in the cube."""
+
+    collapse_coord = "not_a_coordinate"
+    plugin = PercentileConverter(collapse_coord)
+    msg = "Coordinate "
+    with pytest.raises(CoordinateNotFoundError, match=msg):
+        plugin.process(base_cube)
+
+
+def test_invalid_collapse_coord_type(base_cube):
+    """Test that the plugin handles invalid collapse_coord type."""
+
+    collapse_coord = base_cube
+    msg = "collapse_coord is "
+    with pytest.raises(TypeError, match=msg):
+        PercentileConverter(collapse_coord)
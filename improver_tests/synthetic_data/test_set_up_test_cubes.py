@@ -7,17 +7,20 @@ Unit tests for cube setup functions
 """
 
 import unittest
-from datetime import datetime
+from datetime import datetime, timedelta
 
 import iris
 import numpy as np
-from iris.tests import IrisTest
+import pytest
+from numpy.testing import assert_array_almost_equal, assert_array_equal
 
 from improver.grids import GLOBAL_GRID_CCRS, STANDARD_GRID_CCRS
 from improver.metadata.check_datatypes import check_mandatory_standards
 from improver.metadata.constants.time_types import TIME_COORDS
 from improver.metadata.probabilistic import find_threshold_coordinate
 from improver.synthetic_data.set_up_test_cubes import (
+    _construct_percentile_cube,
+    _template_percentile_cube,
     add_coordinate,
     construct_scalar_time_coords,
     construct_yx_coords,
@@ -31,118 +34,132 @@ from improver.synthetic_data.set_up_test_cubes import (
 from improver.utilities.cube_manipulation import get_dim_coord_names
 from improver.utilities.temporal import iris_time_to_datetime
 
-
-class Test_construct_yx_coords(IrisTest):
+# Times shared by the construct_scalar_time_coords tests
+TIME = datetime(2017, 12, 1, 14, 0)
+TIME_BOUNDS = (datetime(2017, 12, 1, 13, 0), TIME)
+FRT = datetime(2017, 12, 1, 9, 0)
+
+
+def _time_point_to_datetime(time_coord):
+    """Convert the first point of a time coordinate to a datetime. Points in
+    the default units of seconds since the epoch are converted directly,
+    otherwise this falls back on iris_time_to_datetime.
+
+    Args:
+        time_coord (iris.coords.Coord):
+            Time coordinate.
+
+    Returns:
+        datetime.datetime:
+            The first point of the coordinate.
+    """
+    if time_coord.units == TIME_COORDS[time_coord.name()].units:
+        return datetime(1970, 1, 1) + timedelta(seconds=int(time_coord.points[0]))
+    return iris_time_to_datetime(time_coord)[0]
+
+
+# Expected coordinate points centred on 0 for the given number of points and
+# grid spacing
+POINTS_3_SPACING_1 = np.array([-1.0, 0.0, 1.0], dtype=np.float32)
+POINTS_3_SPACING_2 = np.array([-2.0, 0.0, 2.0], dtype=np.float32)
+POINTS_3_SPACING_10 = np.array([-10.0, 0.0, 10.0], dtype=np.float32)
+POINTS_4_SPACING_1 = np.array([-1.5, -0.5, 0.5, 1.5], dtype=np.float32)
+POINTS_4_SPACING_3 = np.array([-4.5, -1.5, 1.5, 4.5], dtype=np.float32)
+
+# Expected coordinate points for 3 x 4 grids with the default grid spacing,
+# starting from the domain corners used in the domain corner tests
+LATLON_CORNER_Y_POINTS = -17.0 + 10.0 * np.arange(3)
+LATLON_CORNER_X_POINTS = -10.0 + 10.0 * np.arange(4)
+EQUALAREA_CORNER_Y_POINTS = 1100.0 + 2000.0 * np.arange(3)
+EQUALAREA_CORNER_X_POINTS = 300.0 + 2000.0 * np.arange(4)
+
+# Spatial grid name, expected y and x coordinate names, default grid spacing,
+# units and coordinate system for each of the supported spatial grids
+GRIDS = [
+    ("latlon", "latitude", "longitude", 10.0, "degrees", GLOBAL_GRID_CCRS),
+    (
+        "equalarea",
+        "projection_y_coordinate",
+        "projection_x_coordinate",
+        2000.0,
+        "metres",
+        STANDARD_GRID_CCRS,
+    ),
+]
+
+
+class Test_construct_yx_coords(unittest.TestCase):
     """Test the construct_yx_coords method"""
 
-    def test_lat_lon(self):
-        """Test coordinates created for a lat-lon grid"""
-        y_coord, x_coord = construct_yx_coords(4, 3, "latlon")
-        self.assertEqual(y_coord.name(), "latitude")
-        self.assertEqual(x_coord.name(), "longitude")
-        for crd in [y_coord, x_coord]:
-            self.assertEqual(crd.units, "degrees")
-            self.assertEqual(crd.dtype, np.float32)
-            self.assertEqual(crd.coord_system, GLOBAL_GRID_CCRS)
-        self.assertEqual(len(y_coord.points), 4)
-        self.assertEqual(len(x_coord.points), 3)
+    def test_coords(self):
+        """Test coordinates created for each spatial grid"""
+        for grid, y_name, x_name, _, units, crs in GRIDS:
+            with self.subTest(grid=grid):
+                y_coord, x_coord = construct_yx_coords(4, 3, grid)
+                self.assertEqual(y_coord.name(), y_name)
+                self.assertEqual(x_coord.name(), x_name)
+                for crd in [y_coord, x_coord]:
+                    self.assertEqual(crd.units, units)
+                    self.assertEqual(crd.dtype, np.float32)
+                    self.assertEqual(crd.coord_system, crs)
+                self.assertEqual(len(y_coord.points), 4)
+                self.assertEqual(len(x_coord.points), 3)
 
     def test_lat_lon_values(self):
         """Test latitude and longitude point values are as expected"""
         y_coord, x_coord = construct_yx_coords(3, 3, "latlon")
-        self.assertArrayAlmostEqual(x_coord.points, [-10.0, 0.0, 10.0])
-        self.assertArrayAlmostEqual(y_coord.points, [-10.0, 0.0, 10.0])
-
-    def test_lat_lon_grid_spacing(self):
-        """Test latitude and longitude point values created around 0,0 with
-        provided grid spacing"""
-        y_coord, x_coord = construct_yx_coords(
-            3, 3, "latlon", x_grid_spacing=10, y_grid_spacing=10
-        )
-        self.assertArrayEqual(x_coord.points, [-10.0, 0.0, 10.0])
-        self.assertArrayEqual(y_coord.points, [-10.0, 0.0, 10.0])
-
-        y_coord, x_coord = construct_yx_coords(
-            3, 3, "latlon", x_grid_spacing=1, y_grid_spacing=2
-        )
-        self.assertArrayEqual(x_coord.points, [-1.0, 0.0, 1.0])
-        self.assertArrayEqual(y_coord.points, [-2.0, 0.0, 2.0])
-
-        y_coord, x_coord = construct_yx_coords(
-            4, 4, "latlon", x_grid_spacing=1, y_grid_spacing=3
-        )
-        self.assertArrayEqual(x_coord.points, [-1.5, -0.5, 0.5, 1.5])
-        self.assertArrayEqual(y_coord.points, [-4.5, -1.5, 1.5, 4.5])
-
-    def test_lat_lon_grid_spacing_domain_corner(self):
-        """Test latitude and longitude point values start at domain corner
-        with provided grid spacing"""
-        y_coord, x_coord = construct_yx_coords(
-            3, 3, "latlon", x_grid_spacing=2, y_grid_spacing=3, domain_corner=(15, 12)
-        )
-        self.assertArrayEqual(x_coord.points, [12.0, 14.0, 16.0])
-        self.assertArrayEqual(y_coord.points, [15.0, 18.0, 21.0])
-
-    def test_lat_lon_domain_corner(self):
-        """Test grid points generated with default grid spacing if domain corner
-        provided and grid spacing not provided"""
-        y_coord, x_coord = construct_yx_coords(3, 3, "latlon", domain_corner=(0, 0))
-        self.assertArrayEqual(x_coord.points, [0.0, 10.0, 20.0])
-        self.assertArrayEqual(y_coord.points, [0.0, 10.0, 20.0])
-
-    def test_proj_xy(self):
-        """Test coordinates created for an equal area grid"""
-        y_coord, x_coord = construct_yx_coords(4, 3, "equalarea")
-        self.assertEqual(y_coord.name(), "projection_y_coordinate")
-        self.assertEqual(x_coord.name(), "projection_x_coordinate")
-        for crd in [y_coord, x_coord]:
-            self.assertEqual(crd.units, "metres")
-            self.assertEqual(crd.dtype, np.float32)
-            self.assertEqual(crd.coord_system, STANDARD_GRID_CCRS)
-        self.assertEqual(len(y_coord.points), 4)
-        self.assertEqual(len(x_coord.points), 3)
-
-    def test_equal_area_grid_spacing(self):
-        """Test projection_y_coordinate and projection_x_coordinate point
-        values created around 0,0 with provided grid spacing"""
-        y_coord, x_coord = construct_yx_coords(
-            3, 3, "equalarea", x_grid_spacing=10, y_grid_spacing=10
-        )
-        self.assertArrayEqual(x_coord.points, [-10.0, 0.0, 10.0])
-        self.assertArrayEqual(y_coord.points, [-10.0, 0.0, 10.0])
-
-        y_coord, x_coord = construct_yx_coords(
-            3, 3, "equalarea", x_grid_spacing=1, y_grid_spacing=2
-        )
-        self.assertArrayEqual(x_coord.points, [-1.0, 0.0, 1.0])
-        self.assertArrayEqual(y_coord.points, [-2.0, 0.0, 2.0])
-
-        y_coord, x_coord = construct_yx_coords(
-            4, 4, "equalarea", x_grid_spacing=1, y_grid_spacing=3
-        )
-        self.assertArrayEqual(x_coord.points, [-1.5, -0.5, 0.5, 1.5])
-        self.assertArrayEqual(y_coord.points, [-4.5, -1.5, 1.5, 4.5])
-
-    def test_equal_area_grid_spacing_domain_corner(self):
-        """Test projection_y_coordinate and projection_x_coordinate point values
-        start at domain corner with provided grid spacing"""
-        y_coord, x_coord = construct_yx_coords(
-            3,
-            3,
-            "equalarea",
-            x_grid_spacing=2,
-            y_grid_spacing=3,
-            domain_corner=(15, 12),
-        )
-        self.assertArrayEqual(x_coord.points, [12.0, 14.0, 16.0])
-        self.assertArrayEqual(y_coord.points, [15.0, 18.0, 21.0])
-
-    def test_equal_area_domain_corner(self):
-        """Test grid points generated with default grid spacing if domain
-        corner provided and grid spacing not provided"""
-        y_coord, x_coord = construct_yx_coords(3, 3, "equalarea", domain_corner=(0, 0))
-        self.assertArrayEqual(x_coord.points, [0.0, 2000.0, 4000.0])
-        self.assertArrayEqual(y_coord.points, [0.0, 2000.0, 4000.0])
+        assert_array_almost_equal(x_coord.points, POINTS_3_SPACING_10)
+        assert_array_almost_equal(y_coord.points, POINTS_3_SPACING_10)
+
+    def test_grid_spacing(self):
+        """Test point values created around 0,0 with provided grid spacing
+        for each spatial grid"""
+        for grid, *_ in GRIDS:
+            with self.subTest(grid=grid):
+                y_coord, x_coord = construct_yx_coords(
+                    3, 3, grid, x_grid_spacing=10, y_grid_spacing=10
+                )
+                assert_array_equal(x_coord.points, POINTS_3_SPACING_10)
+                assert_array_equal(y_coord.points, POINTS_3_SPACING_10)
+
+                y_coord, x_coord = construct_yx_coords(
+                    3, 3, grid, x_grid_spacing=1, y_grid_spacing=2
+                )
+                assert_array_equal(x_coord.points, POINTS_3_SPACING_1)
+                assert_array_equal(y_coord.points, POINTS_3_SPACING_2)
+
+                y_coord, x_coord = construct_yx_coords(
+                    4, 4, grid, x_grid_spacing=1, y_grid_spacing=3
+                )
+                assert_array_equal(x_coord.points, POINTS_4_SPACING_1)
+                assert_array_equal(y_coord.points, POINTS_4_SPACING_3)
+
+    def test_grid_spacing_domain_corner(self):
+        """Test point values start at domain corner with provided grid
+        spacing for each spatial grid"""
+        for grid, *_ in GRIDS:
+            with self.subTest(grid=grid):
+                y_coord, x_coord = construct_yx_coords(
+                    3,
+                    3,
+                    grid,
+                    x_grid_spacing=2,
+                    y_grid_spacing=3,
+                    domain_corner=(15, 12),
+                )
+                assert_array_equal(x_coord.points, [12.0, 14.0, 16.0])
+                assert_array_equal(y_coord.points, [15.0, 18.0, 21.0])
+
+    def test_domain_corner(self):
+        """Test grid points generated with the default grid spacing of each
+        spatial grid if domain corner provided and grid spacing not
+        provided"""
+        for grid, _, _, spacing, *_ in GRIDS:
+            with self.subTest(grid=grid):
+                y_coord, x_coord = construct_yx_coords(3, 3, grid, domain_corner=(0, 0))
+                expected = [0.0, spacing, 2 * spacing]
+                assert_array_equal(x_coord.points, expected)
+                assert_array_equal(y_coord.points, expected)
 
     def test_unknown_spatial_grid(self):
         """Test error raised if spatial_grid unknown"""
@@ -152,7 +169,7 @@ class Test_construct_yx_coords(IrisTest):
             construct_yx_coords(3, 3, spatial_grid, domain_corner=(0, 0))
 
 
-class Test_construct_scalar_time_coords(IrisTest):
+class Test_construct_scalar_time_coords(unittest.TestCase):
     """Test the construct_scalar_time_coords method"""
 
     def basic_test(
@@ -160,9 +177,9 @@ class Test_construct_scalar_time_coords(IrisTest):
     ):
         """Common method for test_basic, test_blend_time and test_blend_time_and_frt"""
         coord_dims = construct_scalar_time_coords(
-            datetime(2017, 12, 1, 14, 0),
+            TIME,
             None,
-            **{k: datetime(2017, 12, 1, 9, 0) for k in ref_time_kword},
+            **{k: FRT for k in ref_time_kword},
         )
         time_coords = [item[0] for item in coord_dims]
 
@@ -170,14 +187,12 @@ class Test_construct_scalar_time_coords(IrisTest):
             self.assertIsInstance(crd, iris.coords.DimCoord)
 
         self.assertEqual(time_coords[0].name(), "time")
-        self.assertEqual(
-            iris_time_to_datetime(time_coords[0])[0], datetime(2017, 12, 1, 14, 0)
-        )
+        self.assertEqual(iris_time_to_datetime(time_coords[0])[0], TIME)
         for i, coord_name in enumerate(ref_time_coord):
             self.assertEqual(time_coords[i + 1].name(), coord_name)
             self.assertEqual(
                 iris_time_to_datetime(time_coords[i + 1])[0],
-                datetime(2017, 12, 1, 9, 0),
+                FRT,
             )
         self.assertEqual(time_coords[-1].name(), "forecast_period")
         self.assertEqual(time_coords[-1].points[0], 3600 * 5)
@@ -221,9 +236,7 @@ class Test_construct_scalar_time_coords(IrisTest):
         negative"""
         msg = "Cannot set up cube with negative forecast period"
         with self.assertRaisesRegex(ValueError, msg):
-            _ = construct_scalar_time_coords(
-                datetime(2017, 12, 1, 14, 0), None, datetime(2017, 12, 1, 16, 0)
-            )
+            _ = construct_scalar_time_coords(TIME, None, datetime(2017, 12, 1, 16, 0))
 
     def test_error_no_reference_time(self):
         """Test an error is raised if neither a forecast reference time nor blend time are supplied
@@ -233,19 +246,17 @@ class Test_construct_scalar_time_coords(IrisTest):
             "or a blend time."
         )
         with self.assertRaisesRegex(ValueError, msg):
-            construct_scalar_time_coords(datetime(2017, 12, 1, 14, 0), None)
+            construct_scalar_time_coords(TIME, None)
 
     def test_time_bounds(self):
         """Test creation of time coordinate with bounds"""
         coord_dims = construct_scalar_time_coords(
-            datetime(2017, 12, 1, 14, 0),
-            (datetime(2017, 12, 1, 13, 0), datetime(2017, 12, 1, 14, 0)),
-            datetime(2017, 12, 1, 9, 0),
+            TIME,
+            TIME_BOUNDS,
+            FRT,
         )
         time_coord = coord_dims[0][0]
-        self.assertEqual(
-            iris_time_to_datetime(time_coord)[0], datetime(2017, 12, 1, 14, 0)
-        )
+        self.assertEqual(iris_time_to_datetime(time_coord)[0], TIME)
         self.assertEqual(time_coord.bounds[0][0], time_coord.points[0] - 3600)
         self.assertEqual(time_coord.bounds[0][1], time_coord.points[0])
 
@@ -253,14 +264,12 @@ class Test_construct_scalar_time_coords(IrisTest):
         """Test time bounds are correctly applied even if supplied in the wrong
         order"""
         coord_dims = construct_scalar_time_coords(
-            datetime(2017, 12, 1, 14, 0),
-            (datetime(2017, 12, 1, 14, 0), datetime(2017, 12, 1, 13, 0)),
-            datetime(2017, 12, 1, 9, 0),
+            TIME,
+            TIME_BOUNDS[::-1],
+            FRT,
         )
         time_coord = coord_dims[0][0]
-        self.assertEqual(
-            iris_time_to_datetime(time_coord)[0], datetime(2017, 12, 1, 14, 0)
-        )
+        self.assertEqual(iris_time_to_datetime(time_coord)[0], TIME)
         self.assertEqual(time_coord.bounds[0][0], time_coord.points[0] - 3600)
         self.assertEqual(time_coord.bounds[0][1], time_coord.points[0])
 
@@ -276,25 +285,48 @@ class Test_construct_scalar_time_coords(IrisTest):
             )
 
 
-class Test_set_up_variable_cube(IrisTest):
+class Test_set_up_variable_cube(unittest.TestCase):
     """Test the set_up_variable_cube base function"""
 
-    def setUp(self):
-        """Set up simple temperature data array"""
-        self.data = np.linspace(275.0, 284.0, 12).reshape(3, 4).astype(np.float32)
-        self.data_3d = np.array([self.data, self.data, self.data])
+    @classmethod
+    def setUpClass(cls):
+        """Set up simple temperature data arrays once for all of the tests.
+        These are shared, so are made read-only to prevent any test from
+        modifying them."""
+        cls.data = np.linspace(275.0, 284.0, 12, dtype=np.float32).reshape(3, 4)
+        cls.data.setflags(write=False)
+        cls.data_3d = np.broadcast_to(cls.data, (3, 3, 4))
+        cls.data_4d = np.broadcast_to(cls.data, (2, 3, 3, 4))
+        cls.data_degc = cls.data - 273.15
+        cls.data_degc.setflags(write=False)
+        # Cube set up with the default arguments, shared by the tests that
+        # only inspect it
+        cls.default_cube = set_up_variable_cube(cls.data)
+        cls.default_cube.data.setflags(write=False)
+
+    def assert_coord_dims(self, cube, expected):
+        """Assert that the coordinates of the cube span the expected
+        dimensions.
+
+        Args:
+            cube (iris.cube.Cube):
+                Cube to check.
+            expected (dict):
+                Expected dimensions, keyed by coordinate name.
+        """
+        self.assertEqual({name: cube.coord_dims(name) for name in expected}, expected)
 
     def test_defaults(self):
         """Test default arguments produce cube with expected dimensions
         and metadata"""
-        result = set_up_variable_cube(self.data)
+        result = self.default_cube
 
         # check type, data and attributes
         self.assertIsInstance(result, iris.cube.Cube)
         self.assertEqual(result.standard_name, "air_temperature")
         self.assertEqual(result.name(), "air_temperature")
         self.assertEqual(result.units, "K")
-        self.assertArrayAlmostEqual(result.data, self.data)
+        assert_array_equal(result.data, self.data)
         self.assertEqual(result.attributes, {})
 
         # check dimension coordinates
@@ -307,17 +339,20 @@ class Test_set_up_variable_cube(IrisTest):
         self.assertEqual(result.coord("forecast_period").dtype, np.int32)
 
         expected_time = datetime(2017, 11, 10, 4, 0)
-        time_point = iris_time_to_datetime(result.coord("time"))[0]
+        time_point = _time_point_to_datetime(result.coord("time"))
         self.assertEqual(time_point, expected_time)
 
         expected_frt = datetime(2017, 11, 10, 0, 0)
-        frt_point = iris_time_to_datetime(result.coord("forecast_reference_time"))[0]
+        frt_point = _time_point_to_datetime(result.coord("forecast_reference_time"))
         self.assertEqual(frt_point, expected_frt)
 
         self.assertEqual(result.coord("forecast_period").units, "seconds")
         self.assertEqual(result.coord("forecast_period").points[0], 14400)
 
-        check_mandatory_standards(result)
+    def test_defaults_mandatory_standards(self):
+        """Test the cube set up with default arguments meets the mandatory
+        standards"""
+        check_mandatory_standards(self.default_cube)
 
     def test_non_standard_name(self):
         """Test non CF standard cube naming"""
@@ -327,9 +362,9 @@ class Test_set_up_variable_cube(IrisTest):
     def test_name_and_units(self):
         """Test ability to set data name and units"""
         result = set_up_variable_cube(
-            self.data - 273.15, name="wet_bulb_temperature", units="degC"
+            self.data_degc, name="wet_bulb_temperature", units="degC"
         )
-        self.assertArrayAlmostEqual(result.data, self.data - 273.15)
+        assert_array_equal(result.data, self.data_degc)
         self.assertEqual(result.name(), "wet_bulb_temperature")
         self.assertEqual(result.units, "degC")
 
@@ -377,13 +412,13 @@ class Test_set_up_variable_cube(IrisTest):
         expected_units = "m"
         expected_attributes = {"positive": "up"}
         result = set_up_variable_cube(self.data_3d, height_levels=height_levels)
-        self.assertArrayAlmostEqual(result.data, self.data_3d)
-        self.assertEqual(result.coord_dims("height"), (0,))
-        self.assertArrayEqual(result.coord("height").points, np.array(height_levels))
+        assert_array_equal(result.data, self.data_3d)
+        self.assert_coord_dims(
+            result, {"height": (0,), "latitude": (1,), "longitude": (2,)}
+        )
+        assert_array_equal(result.coord("height").points, np.array(height_levels))
         self.assertEqual(result.coord("height").units, expected_units)
         self.assertEqual(result.coord("height").attributes, expected_attributes)
-        self.assertEqual(result.coord_dims("latitude"), (1,))
-        self.assertEqual(result.coord_dims("longitude"), (2,))
 
     def test_pressure_levels(self):
         """Test pressure coordinate is added"""
@@ -394,95 +429,90 @@ class Test_set_up_variable_cube(IrisTest):
         result = set_up_variable_cube(
             self.data_3d, height_levels=height_levels, pressure=pressure
         )
-        self.assertArrayAlmostEqual(result.data, self.data_3d)
-        self.assertEqual(result.coord_dims("pressure"), (0,))
-        self.assertArrayEqual(result.coord("pressure").points, np.array(height_levels))
+        assert_array_equal(result.data, self.data_3d)
+        self.assert_coord_dims(
+            result, {"pressure": (0,), "latitude": (1,), "longitude": (2,)}
+        )
+        assert_array_equal(result.coord("pressure").points, np.array(height_levels))
         self.assertEqual(result.coord("pressure").units, expected_units)
         self.assertEqual(result.coord("pressure").attributes, expected_attributes)
-        self.assertEqual(result.coord_dims("latitude"), (1,))
-        self.assertEqual(result.coord_dims("longitude"), (2,))
 
     def test_realizations_from_data(self):
         """Test realization coordinate is added for 3D data"""
         result = set_up_variable_cube(self.data_3d)
-        self.assertArrayAlmostEqual(result.data, self.data_3d)
-        self.assertEqual(result.coord_dims("realization"), (0,))
-        self.assertArrayEqual(result.coord("realization").points, np.array([0, 1, 2]))
-        self.assertEqual(result.coord_dims("latitude"), (1,))
-        self.assertEqual(result.coord_dims("longitude"), (2,))
+        assert_array_equal(result.data, self.data_3d)
+        self.assert_coord_dims(
+            result, {"realization": (0,), "latitude": (1,), "longitude": (2,)}
+        )
+        assert_array_equal(result.coord("realization").points, np.array([0, 1, 2]))
 
     def test_realizations(self):
         """Test specific realization values"""
         result = set_up_variable_cube(self.data_3d, realizations=np.array([0, 3, 4]))
-        self.assertArrayEqual(result.coord("realization").points, np.array([0, 3, 4]))
-
-    def test_error_unmatched_realizations(self):
-        """Test error is raised if the realizations provided do not match the
-        data dimensions"""
-        realizations_len = 4
-        data_len = self.data_3d.shape[0]
-        msg = "Cannot generate {} realizations with data of length {}".format(
-            realizations_len, data_len
-        )
-        with self.assertRaisesRegex(ValueError, msg):
-            _ = set_up_variable_cube(
-                self.data_3d, realizations=np.arange(realizations_len)
-            )
+        assert_array_equal(result.coord("realization").points, np.array([0, 3, 4]))
 
-    def test_error_unmatched_height_levels(self):
-        """Test error is raised if the heights provided do not match the
-        data dimensions"""
-        height_levels_len = 4
+    def test_error_unmatched_coordinate_length(self):
+        """Test error is raised if the realizations or heights provided do not
+        match the data dimensions"""
+        points = np.arange(4)
         data_len = self.data_3d.shape[0]
-        msg = "Cannot generate {} heights with data of length {}".format(
-            height_levels_len, data_len
-        )
-        with self.assertRaisesRegex(ValueError, msg):
-            _ = set_up_variable_cube(
-                self.data_3d, height_levels=np.arange(height_levels_len)
-            )
+        for kwarg, coord_description in [
+            ("realizations", "realizations"),
+            ("height_levels", "heights"),
+        ]:
+            with self.subTest(kwarg=kwarg):
+                msg = "Cannot generate {} {} with data of length {}".format(
+                    len(points), coord_description, data_len
+                )
+                with self.assertRaisesRegex(ValueError, msg):
+                    _ = set_up_variable_cube(self.data_3d, **{kwarg: points})
 
     def test_realizations_from_data_height_levels(self):
         """ Tests realizations from data and height coordinates added """
         height_levels = [1.5, 3.0, 4.5]
-        data_4d = np.array([self.data_3d, self.data_3d])
-        result = set_up_variable_cube(data_4d, height_levels=height_levels)
-        self.assertArrayAlmostEqual(result.data, data_4d)
-        self.assertEqual(result.coord_dims("realization"), (0,))
-        self.assertArrayEqual(result.coord("realization").points, np.array([0, 1]))
-        self.assertEqual(result.coord_dims("height"), (1,))
-        self.assertArrayEqual(result.coord("height").points, np.array(height_levels))
-        self.assertEqual(result.coord_dims("latitude"), (2,))
-        self.assertEqual(result.coord_dims("longitude"), (3,))
+        result = set_up_variable_cube(self.data_4d, height_levels=height_levels)
+        assert_array_equal(result.data, self.data_4d)
+        self.assert_coord_dims(
+            result,
+            {
+                "realization": (0,),
+                "height": (1,),
+                "latitude": (2,),
+                "longitude": (3,),
+            },
+        )
+        assert_array_equal(result.coord("realization").points, np.array([0, 1]))
+        assert_array_equal(result.coord("height").points, np.array(height_levels))
 
     def test_realizations_height_levels(self):
         """ Tests realizations and height coordinates added """
         realizations = [0, 3]
         height_levels = [1.5, 3.0, 4.5]
-        data_4d = np.array([self.data_3d, self.data_3d])
         result = set_up_variable_cube(
-            data_4d, realizations=realizations, height_levels=height_levels
+            self.data_4d, realizations=realizations, height_levels=height_levels
         )
-        self.assertArrayAlmostEqual(result.data, data_4d)
-        self.assertEqual(result.coord_dims("realization"), (0,))
-        self.assertArrayEqual(
-            result.coord("realization").points, np.array(realizations)
+        assert_array_equal(result.data, self.data_4d)
+        self.assert_coord_dims(
+            result,
+            {
+                "realization": (0,),
+                "height": (1,),
+                "latitude": (2,),
+                "longitude": (3,),
+            },
         )
-        self.assertEqual(result.coord_dims("height"), (1,))
-        self.assertArrayEqual(result.coord("height").points, np.array(height_levels))
-        self.assertEqual(result.coord_dims("latitude"), (2,))
-        self.assertEqual(result.coord_dims("longitude"), (3,))
+        assert_array_equal(result.coord("realization").points, np.array(realizations))
+        assert_array_equal(result.coord("height").points, np.array(height_levels))
 
     def test_error_no_height_levels_4d_data(self):
         """ Tests error is raised if 4d data provided but not height_levels """
-        data_4d = np.array([self.data_3d, self.data_3d])
         msg = "Height levels must be provided if data has > 3 dimensions."
         with self.assertRaisesRegex(ValueError, msg):
-            _ = set_up_variable_cube(data_4d)
+            _ = set_up_variable_cube(self.data_4d)
 
     def test_error_too_many_dimensions(self):
         """Test error is raised if input cube has more than 4 dimensions"""
-        data_5d = np.array([[self.data_3d, self.data_3d], [self.data_3d, self.data_3d]])
+        data_5d = np.broadcast_to(self.data_3d, (2, 2) + self.data_3d.shape)
         msg = "Expected 2 to 4 dimensions on input data: got 5"
         with self.assertRaisesRegex(ValueError, msg):
             _ = set_up_variable_cube(data_5d)
@@ -518,65 +548,26 @@ class Test_set_up_variable_cube(IrisTest):
 
     def test_latlon_grid_spacing(self):
         """Test ability to set up lat-lon grid around 0,0 with specified grid spacing"""
-        x_grid_spacing = 1
-        y_grid_spacing = 2
         result = set_up_variable_cube(
-            self.data,
-            spatial_grid="latlon",
-            x_grid_spacing=x_grid_spacing,
-            y_grid_spacing=y_grid_spacing,
-        )
-
-        self.assertEqual(result.coord_dims("latitude"), (0,))
-        self.assertEqual(result.coord_dims("longitude"), (1,))
-
-        lat_spacing = abs(
-            result.coord("latitude").points[0] - result.coord("latitude").points[1]
-        )
-        lon_spacing = abs(
-            result.coord("longitude").points[0] - result.coord("longitude").points[1]
-        )
-        self.assertEqual(lat_spacing, y_grid_spacing)
-        self.assertEqual(lon_spacing, x_grid_spacing)
-        self.assertEqual(
-            abs(result.coord("latitude").points[0]),
-            abs(result.coord("latitude").points[-1]),
-        )
-        self.assertEqual(
-            abs(result.coord("longitude").points[0]),
-            abs(result.coord("longitude").points[-1]),
+            self.data, spatial_grid="latlon", x_grid_spacing=1, y_grid_spacing=2
         )
+        self.assert_coord_dims(result, {"latitude": (0,), "longitude": (1,)})
+        assert_array_equal(result.coord("latitude").points, POINTS_3_SPACING_2)
+        assert_array_equal(result.coord("longitude").points, POINTS_4_SPACING_1)
 
     def test_equalarea_grid_spacing(self):
         """Test ability to set up equalarea grid around 0,0 with specified grid spacing"""
-        x_grid_spacing = 1
-        y_grid_spacing = 2
         result = set_up_variable_cube(
-            self.data,
-            spatial_grid="equalarea",
-            x_grid_spacing=x_grid_spacing,
-            y_grid_spacing=y_grid_spacing,
-        )
-        self.assertEqual(result.coord_dims("projection_y_coordinate"), (0,))
-        self.assertEqual(result.coord_dims("projection_x_coordinate"), (1,))
-
-        y_spacing = abs(
-            result.coord("projection_y_coordinate").points[0]
-            - result.coord("projection_y_coordinate").points[1]
+            self.data, spatial_grid="equalarea", x_grid_spacing=1, y_grid_spacing=2
         )
-        x_spacing = abs(
-            result.coord("projection_x_coordinate").points[0]
-            - result.coord("projection_x_coordinate").points[1]
+        self.assert_coord_dims(
+            result, {"projection_y_coordinate": (0,), "projection_x_coordinate": (1,)}
         )
-        self.assertEqual(y_spacing, y_grid_spacing)
-        self.assertEqual(x_spacing, x_grid_spacing)
-        self.assertEqual(
-            abs(result.coord("projection_y_coordinate").points[0]),
-            abs(result.coord("projection_y_coordinate").points[-1]),
+        assert_array_equal(
+            result.coord("projection_y_coordinate").points, POINTS_3_SPACING_2
         )
-        self.assertEqual(
-            abs(result.coord("projection_x_coordinate").points[0]),
-            abs(result.coord("projection_x_coordinate").points[-1]),
+        assert_array_equal(
+            result.coord("projection_x_coordinate").points, POINTS_4_SPACING_1
         )
 
     def test_latlon_domain_corner_grid_spacing(self):
@@ -591,20 +582,12 @@ class Test_set_up_variable_cube(IrisTest):
             y_grid_spacing=y_grid_spacing,
             domain_corner=domain_corner,
         )
-
-        self.assertEqual(result.coord_dims("latitude"), (0,))
-        self.assertEqual(result.coord_dims("longitude"), (1,))
-
-        lat_spacing = abs(
-            result.coord("latitude").points[0] - result.coord("latitude").points[1]
-        )
-        lon_spacing = abs(
-            result.coord("longitude").points[0] - result.coord("longitude").points[1]
-        )
-        self.assertEqual(lat_spacing, y_grid_spacing)
-        self.assertEqual(lon_spacing, x_grid_spacing)
-        self.assertEqual(result.coord("latitude").points[0], domain_corner[0])
-        self.assertEqual(result.coord("longitude").points[0], domain_corner[1])
+        ny, nx = self.data.shape
+        expected_y = domain_corner[0] + np.arange(ny) * y_grid_spacing
+        expected_x = domain_corner[1] + np.arange(nx) * x_grid_spacing
+        self.assert_coord_dims(result, {"latitude": (0,), "longitude": (1,)})
+        assert_array_equal(result.coord("latitude").points, expected_y)
+        assert_array_equal(result.coord("longitude").points, expected_x)
 
     def test_equalarea_domain_corner_grid_spacing(self):
         """Test ability to set up equalarea grid from domain corner with grid spacing"""
@@ -618,26 +601,14 @@ class Test_set_up_variable_cube(IrisTest):
             y_grid_spacing=y_grid_spacing,
             domain_corner=domain_corner,
         )
-
-        self.assertEqual(result.coord_dims("projection_y_coordinate"), (0,))
-        self.assertEqual(result.coord_dims("projection_x_coordinate"), (1,))
-
-        y_spacing = abs(
-            result.coord("projection_y_coordinate").points[0]
-            - result.coord("projection_y_coordinate").points[1]
-        )
-        x_spacing = abs(
-            result.coord("projection_x_coordinate").points[0]
-            - result.coord("projection_x_coordinate").points[1]
-        )
-        self.assertEqual(y_spacing, y_grid_spacing)
-        self.assertEqual(x_spacing, x_grid_spacing)
-        self.assertEqual(
-            result.coord("projection_y_coordinate").points[0], domain_corner[0]
-        )
-        self.assertEqual(
-            result.coord("projection_x_coordinate").points[0], domain_corner[1]
+        ny, nx = self.data.shape
+        expected_y = domain_corner[0] + np.arange(ny) * y_grid_spacing
+        expected_x = domain_corner[1] + np.arange(nx) * x_grid_spacing
+        self.assert_coord_dims(
+            result, {"projection_y_coordinate": (0,), "projection_x_coordinate": (1,)}
         )
+        assert_array_equal(result.coord("projection_y_coordinate").points, expected_y)
+        assert_array_equal(result.coord("projection_x_coordinate").points, expected_x)
 
     def test_latlon_domain_corner(self):
         """Test grid points generated with default grid spacing if domain
@@ -646,10 +617,8 @@ class Test_set_up_variable_cube(IrisTest):
         result = set_up_variable_cube(
             self.data, spatial_grid="latlon", domain_corner=domain_corner
         )
-        self.assertArrayEqual(result.coord("latitude").points, [-17.0, -7.0, 3.0])
-        self.assertArrayEqual(
-            result.coord("longitude").points, [-10.0, 0.0, 10.0, 20.0]
-        )
+        assert_array_equal(result.coord("latitude").points, LATLON_CORNER_Y_POINTS)
+        assert_array_equal(result.coord("longitude").points, LATLON_CORNER_X_POINTS)
 
     def test_equalarea_domain_corner(self):
         """Test grid points generated with default grid spacing if domain
@@ -658,266 +627,260 @@ class Test_set_up_variable_cube(IrisTest):
         result = set_up_variable_cube(
             self.data, spatial_grid="equalarea", domain_corner=domain_corner
         )
-        self.assertArrayEqual(
-            result.coord("projection_y_coordinate").points, [1100.0, 3100.0, 5100.0]
+        assert_array_equal(
+            result.coord("projection_y_coordinate").points, EQUALAREA_CORNER_Y_POINTS
         )
-        self.assertArrayEqual(
-            result.coord("projection_x_coordinate").points,
-            [300.0, 2300.0, 4300.0, 6300.0],
+        assert_array_equal(
+            result.coord("projection_x_coordinate").points, EQUALAREA_CORNER_X_POINTS
         )
 
 
-class Test_set_up_spot_variable_cube(IrisTest):
-    """Test the set_up_spot_variable_cube base function. Much of this
-    functionality overlaps with the gridded case, so these tests primarily
-    cover the spot specific elements."""
-
-    def setUp(self):
-        """Set up simple temperature data array"""
-        self.data = np.linspace(275.0, 284.0, 4).astype(np.float32)
-        self.data_2d = np.array([self.data, self.data, self.data])
-        self.site_crds = ["latitude", "longitude", "altitude", "wmo_id"]
-
-    def test_defaults(self):
-        """Test default arguments produce cube with expected dimensions
-        and metadata"""
-        result = set_up_spot_variable_cube(self.data)
-
-        # check type, data and attributes
-        self.assertIsInstance(result, iris.cube.Cube)
-        self.assertEqual(result.standard_name, "air_temperature")
-        self.assertEqual(result.name(), "air_temperature")
-        self.assertEqual(result.units, "K")
-        self.assertArrayAlmostEqual(result.data, self.data)
-        self.assertEqual(result.attributes, {})
-
-        # check auxiliary coordinates associated with expected dimension
-        expected_site_dim = result.coord_dims("spot_index")
-        for crd in self.site_crds:
-            self.assertEqual(result.coord_dims(crd), expected_site_dim)
-
-        # check scalar time coordinates
-        for time_coord in ["time", "forecast_reference_time"]:
-            self.assertEqual(result.coord(time_coord).dtype, np.int64)
-        self.assertEqual(result.coord("forecast_period").dtype, np.int32)
-
-        expected_time = datetime(2017, 11, 10, 4, 0)
-        time_point = iris_time_to_datetime(result.coord("time"))[0]
-        self.assertEqual(time_point, expected_time)
-
-        expected_frt = datetime(2017, 11, 10, 0, 0)
-        frt_point = iris_time_to_datetime(result.coord("forecast_reference_time"))[0]
-        self.assertEqual(frt_point, expected_frt)
-
-        self.assertEqual(result.coord("forecast_period").units, "seconds")
-        self.assertEqual(result.coord("forecast_period").points[0], 14400)
+SPOT_SITE_COORDS = ["latitude", "longitude", "altitude", "wmo_id"]
 
-        check_mandatory_standards(result)
 
-    def test_height_levels(self):
-        """Test height coordinate is added"""
-        height_levels = [1.5, 3.0, 4.5]
-        expected_units = "m"
-        expected_attributes = {"positive": "up"}
-        expected_site_dim = 1
-        result = set_up_spot_variable_cube(self.data_2d, height_levels=height_levels)
-        self.assertArrayAlmostEqual(result.data, self.data_2d)
-        self.assertEqual(result.coord_dims("height"), (0,))
-        self.assertArrayEqual(result.coord("height").points, np.array(height_levels))
-        self.assertEqual(result.coord("height").units, expected_units)
-        self.assertEqual(result.coord("height").attributes, expected_attributes)
-        for crd in self.site_crds:
-            self.assertEqual(result.coord_dims(crd)[0], expected_site_dim)
+def _coord_dims_map(cube):
+    """Map the name of each coordinate on the cube to the dimensions it spans"""
+    return {coord.name(): cube.coord_dims(coord) for coord in cube.coords()}
 
-    def test_pressure_levels(self):
-        """Test pressure coordinate is added"""
-        height_levels = [90000, 70000, 3000]
-        expected_units = "Pa"
-        pressure = True
-        expected_attributes = {"positive": "down"}
-        expected_site_dim = 1
-        result = set_up_spot_variable_cube(
-            self.data_2d, height_levels=height_levels, pressure=pressure
-        )
-        self.assertArrayAlmostEqual(result.data, self.data_2d)
-        self.assertEqual(result.coord_dims("pressure"), (0,))
-        self.assertArrayEqual(result.coord("pressure").points, np.array(height_levels))
-        self.assertEqual(result.coord("pressure").units, expected_units)
-        self.assertEqual(result.coord("pressure").attributes, expected_attributes)
-        for crd in self.site_crds:
-            self.assertEqual(result.coord_dims(crd)[0], expected_site_dim)
 
-    def test_realizations_from_data(self):
-        """Test realization coordinate is added for 3D data"""
-        expected_site_dim = 1
-        result = set_up_spot_variable_cube(self.data_2d)
-        self.assertArrayAlmostEqual(result.data, self.data_2d)
-        self.assertEqual(result.coord_dims("realization"), (0,))
-        self.assertArrayEqual(result.coord("realization").points, np.array([0, 1, 2]))
-        for crd in self.site_crds:
-            self.assertEqual(result.coord_dims(crd)[0], expected_site_dim)
+def assert_site_coord_dims(cube, expected_site_dims):
+    """Assert that all of the site coordinates span the expected dimensions"""
+    coord_dims = _coord_dims_map(cube)
+    site_coord_dims = {crd: coord_dims[crd] for crd in SPOT_SITE_COORDS}
+    assert site_coord_dims == dict.fromkeys(SPOT_SITE_COORDS, expected_site_dims)
 
-    def test_realizations(self):
-        """Test specific realization values"""
-        result = set_up_spot_variable_cube(
-            self.data_2d, realizations=np.array([0, 3, 4])
-        )
-        self.assertArrayEqual(result.coord("realization").points, np.array([0, 3, 4]))
-
-    def test_error_unmatched_realizations(self):
-        """Test error is raised if the realizations provided do not match the
-        data dimensions"""
-        realizations_len = 4
-        data_len = self.data_2d.shape[0]
-        msg = "Cannot generate {} realizations with data of length {}".format(
-            realizations_len, data_len
-        )
-        with self.assertRaisesRegex(ValueError, msg):
-            _ = set_up_spot_variable_cube(
-                self.data_2d, realizations=np.arange(realizations_len)
-            )
 
-    def test_error_unmatched_height_levels(self):
-        """Test error is raised if the heights provided do not match the
-        data dimensions"""
-        height_levels_len = 4
-        data_len = self.data_2d.shape[0]
-        msg = "Cannot generate {} heights with data of length {}".format(
-            height_levels_len, data_len
-        )
-        with self.assertRaisesRegex(ValueError, msg):
-            _ = set_up_spot_variable_cube(
-                self.data_2d, height_levels=np.arange(height_levels_len)
-            )
+@pytest.fixture(name="spot_data", scope="module")
+def spot_data_fixture():
+    """Simple spot temperature data array, shared by the set_up_spot_variable_cube
+    tests so made read-only"""
+    data = np.linspace(275.0, 284.0, 4, dtype=np.float32)
+    data.setflags(write=False)
+    return data
 
-    def test_realizations_from_data_height_levels(self):
-        """ Tests realizations from data and height coordinates added """
-        height_levels = [1.5, 3.0, 4.5]
-        data_3d = np.array([self.data_2d, self.data_2d])
-        expected_site_dim = 2
-        result = set_up_spot_variable_cube(data_3d, height_levels=height_levels)
-        self.assertArrayAlmostEqual(result.data, data_3d)
-        self.assertEqual(result.coord_dims("realization"), (0,))
-        self.assertArrayEqual(result.coord("realization").points, np.array([0, 1]))
-        self.assertEqual(result.coord_dims("height"), (1,))
-        self.assertArrayEqual(result.coord("height").points, np.array(height_levels))
-        for crd in self.site_crds:
-            self.assertEqual(result.coord_dims(crd)[0], expected_site_dim)
 
-    def test_realizations_height_levels(self):
-        """ Tests realizations and height coordinates added """
-        realizations = [0, 3]
-        height_levels = [1.5, 3.0, 4.5]
-        data_3d = np.array([self.data_2d, self.data_2d])
-        expected_site_dim = 2
-        result = set_up_spot_variable_cube(
-            data_3d, realizations=realizations, height_levels=height_levels
-        )
-        self.assertArrayAlmostEqual(result.data, data_3d)
-        self.assertEqual(result.coord_dims("realization"), (0,))
-        self.assertArrayEqual(
-            result.coord("realization").points, np.array(realizations)
-        )
-        self.assertEqual(result.coord_dims("height"), (1,))
-        self.assertArrayEqual(result.coord("height").points, np.array(height_levels))
-        for crd in self.site_crds:
-            self.assertEqual(result.coord_dims(crd)[0], expected_site_dim)
-
-    def test_error_no_height_levels_3d_data(self):
-        """ Tests error is raised if 3d data provided but not height_levels """
-        data_3d = np.array([self.data_2d, self.data_2d])
-        msg = "Height levels must be provided if data has > 2 dimensions."
-        with self.assertRaisesRegex(ValueError, msg):
-            _ = set_up_spot_variable_cube(data_3d)
+@pytest.fixture(name="spot_data_2d", scope="module")
+def spot_data_2d_fixture(spot_data):
+    """Spot temperature data for three realizations or vertical levels"""
+    return np.broadcast_to(spot_data, (3, 4))
 
-    def test_error_too_many_dimensions(self):
-        """Test error is raised if input cube has more than 4 dimensions"""
-        data_4d = np.array([[self.data_2d, self.data_2d], [self.data_2d, self.data_2d]])
-        msg = "Expected 1 to 3 dimensions on input data: got 4"
-        with self.assertRaisesRegex(ValueError, msg):
-            _ = set_up_spot_variable_cube(data_4d)
 
-    def test_error_not_enough_dimensions(self):
-        """Test error is raised if 3D input cube and both realizations and heights provided"""
-        realizations = [0, 3, 4]
-        height_levels = [1.5, 3.0, 4.5]
-        msg = (
-            "Input data must have 3 dimensions to add both realization "
-            "and height coordinates: got 2"
-        )
-        with self.assertRaisesRegex(ValueError, msg):
-            _ = set_up_spot_variable_cube(
-                self.data_2d, realizations=realizations, height_levels=height_levels
-            )
+@pytest.fixture(name="spot_data_3d", scope="module")
+def spot_data_3d_fixture(spot_data_2d):
+    """Spot temperature data for two realizations on three vertical levels"""
+    return np.broadcast_to(spot_data_2d, (2,) + spot_data_2d.shape)
 
-    def test_custom_coords(self):
-        """Test that a cube can be set-up with custom coordinates associated
-        with the spot_index, e.g. latitude, altitude, etc."""
 
-        latitudes = [50, 55, 56, 57]
-        longitudes = [-10, 5, 70, 71]
-        altitudes = [-1, 0, 30, 20]
-        wmo_ids = [9, 8, 7, 6]
-        unique_ids = [20, 100, 5000, 999999]
-        unique_site_id_key = "met_office_site_id"
+def test_spot_defaults(spot_data):
+    """Test default arguments produce cube with expected dimensions
+    and metadata"""
+    result = set_up_spot_variable_cube(spot_data)
 
-        result = set_up_spot_variable_cube(
-            self.data,
-            latitudes=latitudes,
-            longitudes=longitudes,
-            altitudes=altitudes,
-            wmo_ids=wmo_ids,
-            unique_site_id=unique_ids,
-            unique_site_id_key=unique_site_id_key,
-        )
-        self.assertArrayEqual(result.coord("latitude").points, latitudes)
-        self.assertArrayEqual(result.coord("longitude").points, longitudes)
-        self.assertArrayEqual(result.coord("altitude").points, altitudes)
-        self.assertArrayEqual(
-            result.coord("wmo_id").points, [f"{item:05d}" for item in wmo_ids]
-        )
-        self.assertArrayEqual(
-            result.coord(unique_site_id_key).points,
-            [f"{item:08d}" for item in unique_ids],
-        )
+    # check type, data and attributes
+    assert isinstance(result, iris.cube.Cube)
+    assert result.standard_name == "air_temperature"
+    assert result.name() == "air_temperature"
+    assert result.units == "K"
+    assert_array_equal(result.data, spot_data)
+    assert result.attributes == {}
 
-    def test_site_ids_as_strings(self):
-        """Test that site IDs provided preformatted as strings are handled
-        correctly."""
+    # check auxiliary coordinates associated with expected dimension
+    assert_site_coord_dims(result, result.coord_dims("spot_index"))
 
-        wmo_ids = ["00009", "00008", "00007", "00006"]
-        unique_ids = ["00000020", "00000100", "00005000", "00999999"]
-        unique_site_id_key = "met_office_site_id"
+    # check scalar time coordinates
+    for time_coord in ["time", "forecast_reference_time"]:
+        assert result.coord(time_coord).dtype == np.int64
+    assert result.coord("forecast_period").dtype == np.int32
 
-        result = set_up_spot_variable_cube(
-            self.data,
-            wmo_ids=wmo_ids,
-            unique_site_id=unique_ids,
-            unique_site_id_key=unique_site_id_key,
-        )
-        self.assertArrayEqual(result.coord("wmo_id").points, wmo_ids)
-        self.assertArrayEqual(result.coord(unique_site_id_key).points, unique_ids)
+    expected_time = datetime(2017, 11, 10, 4, 0)
+    time_point = _time_point_to_datetime(result.coord("time"))
+    assert time_point == expected_time
 
-    def test_no_unique_id_key_exception(self):
-        """Test an exception is raised if unique_site_ids are provided but no
-        unique_site_id_key is provided."""
+    expected_frt = datetime(2017, 11, 10, 0, 0)
+    frt_point = _time_point_to_datetime(result.coord("forecast_reference_time"))
+    assert frt_point == expected_frt
 
-        wmo_ids = ["00009", "00008", "00007", "00006"]
-        unique_ids = ["00000020", "00000100", "00005000", "00999999"]
+    assert result.coord("forecast_period").units == "seconds"
+    assert result.coord("forecast_period").points[0] == 14400
 
-        msg = "A unique_site_id_key must be provided if a unique_site_id"
-        with self.assertRaisesRegex(ValueError, msg):
-            set_up_spot_variable_cube(
-                self.data, wmo_ids=wmo_ids, unique_site_id=unique_ids,
-            )
+    check_mandatory_standards(result)
 
 
-class Test_set_up_percentile_cube(IrisTest):
+@pytest.mark.parametrize(
+    "height_levels, pressure, coord_name, expected_units, expected_attributes",
+    (
+        ([1.5, 3.0, 4.5], False, "height", "m", {"positive": "up"}),
+        ([90000, 70000, 3000], True, "pressure", "Pa", {"positive": "down"}),
+    ),
+)
+def test_spot_vertical_levels(
+    spot_data_2d,
+    height_levels,
+    pressure,
+    coord_name,
+    expected_units,
+    expected_attributes,
+):
+    """Test height or pressure coordinate is added"""
+    result = set_up_spot_variable_cube(
+        spot_data_2d, height_levels=height_levels, pressure=pressure
+    )
+    assert_array_equal(result.data, spot_data_2d)
+    assert result.coord_dims(coord_name) == (0,)
+    assert_array_equal(result.coord(coord_name).points, height_levels)
+    assert result.coord(coord_name).units == expected_units
+    assert result.coord(coord_name).attributes == expected_attributes
+    assert_site_coord_dims(result, (1,))
+
+
+@pytest.mark.parametrize(
+    "n_heights, kwargs, expected_realizations",
+    (
+        (0, {}, [0, 1, 2]),
+        (0, {"realizations": np.array([0, 3, 4])}, [0, 3, 4]),
+        (3, {}, [0, 1]),
+        (3, {"realizations": [0, 3]}, [0, 3]),
+    ),
+)
+def test_spot_realizations(
+    spot_data_2d, spot_data_3d, n_heights, kwargs, expected_realizations
+):
+    """Test realization coordinate is added, either from the data or with
+    specific values, with and without height coordinates"""
+    data = spot_data_2d
+    if n_heights:
+        data = spot_data_3d
+        kwargs = {"height_levels": [1.5, 3.0, 4.5], **kwargs}
+    result = set_up_spot_variable_cube(data, **kwargs)
+    assert_array_equal(result.data, data)
+    assert result.coord_dims("realization") == (0,)
+    assert_array_equal(result.coord("realization").points, expected_realizations)
+    if n_heights:
+        assert result.coord_dims("height") == (1,)
+        assert_array_equal(result.coord("height").points, kwargs["height_levels"])
+    assert_site_coord_dims(result, (data.ndim - 1,))
+
+
+@pytest.mark.parametrize(
+    "kwarg, coord_description",
+    (("realizations", "realizations"), ("height_levels", "heights")),
+)
+def test_spot_error_unmatched_coordinate_length(spot_data_2d, kwarg, coord_description):
+    """Test error is raised if the realizations or heights provided do not
+    match the data dimensions"""
+    points = np.arange(4)
+    msg = "Cannot generate {} {} with data of length {}".format(
+        len(points), coord_description, spot_data_2d.shape[0]
+    )
+    with pytest.raises(ValueError, match=msg):
+        _ = set_up_spot_variable_cube(spot_data_2d, **{kwarg: points})
+
+
+def test_spot_error_no_height_levels_3d_data(spot_data_3d):
+    """Tests error is raised if 3d data provided but not height_levels"""
+    msg = "Height levels must be provided if data has > 2 dimensions."
+    with pytest.raises(ValueError, match=msg):
+        _ = set_up_spot_variable_cube(spot_data_3d)
+
+
+def test_spot_error_too_many_dimensions(spot_data_2d):
+    """Test error is raised if input cube has more than 4 dimensions"""
+    data_4d = np.broadcast_to(spot_data_2d, (2, 2) + spot_data_2d.shape)
+    msg = "Expected 1 to 3 dimensions on input data: got 4"
+    with pytest.raises(ValueError, match=msg):
+        _ = set_up_spot_variable_cube(data_4d)
+
+
+def test_spot_error_not_enough_dimensions(spot_data_2d):
+    """Test error is raised if 3D input cube and both realizations and heights
+    provided"""
+    realizations = [0, 3, 4]
+    height_levels = [1.5, 3.0, 4.5]
+    msg = (
+        "Input data must have 3 dimensions to add both realization "
+        "and height coordinates: got 2"
+    )
+    with pytest.raises(ValueError, match=msg):
+        _ = set_up_spot_variable_cube(
+            spot_data_2d, realizations=realizations, height_levels=height_levels
+        )
+
+
+def test_spot_custom_coords(spot_data):
+    """Test that a cube can be set-up with custom coordinates associated
+    with the spot_index, e.g. latitude, altitude, etc."""
+
+    latitudes = [50, 55, 56, 57]
+    longitudes = [-10, 5, 70, 71]
+    altitudes = [-1, 0, 30, 20]
+    wmo_ids = [9, 8, 7, 6]
+    unique_ids = [20, 100, 5000, 999999]
+    unique_site_id_key = "met_office_site_id"
+
+    result = set_up_spot_variable_cube(
+        spot_data,
+        latitudes=latitudes,
+        longitudes=longitudes,
+        altitudes=altitudes,
+        wmo_ids=wmo_ids,
+        unique_site_id=unique_ids,
+        unique_site_id_key=unique_site_id_key,
+    )
+    assert_array_equal(result.coord("latitude").points, latitudes)
+    assert_array_equal(result.coord("longitude").points, longitudes)
+    assert_array_equal(result.coord("altitude").points, altitudes)
+    assert_array_equal(
+        result.coord("wmo_id").points, ["00009", "00008", "00007", "00006"]
+    )
+    assert_array_equal(
+        result.coord(unique_site_id_key).points,
+        ["00000020", "00000100", "00005000", "00999999"],
+    )
+
+
+def test_spot_site_ids_as_strings(spot_data):
+    """Test that site IDs provided preformatted as strings are handled
+    correctly."""
+
+    wmo_ids = ["00009", "00008", "00007", "00006"]
+    unique_ids = ["00000020", "00000100", "00005000", "00999999"]
+    unique_site_id_key = "met_office_site_id"
+
+    result = set_up_spot_variable_cube(
+        spot_data,
+        wmo_ids=wmo_ids,
+        unique_site_id=unique_ids,
+        unique_site_id_key=unique_site_id_key,
+    )
+    assert_array_equal(result.coord("wmo_id").points, wmo_ids)
+    assert_array_equal(result.coord(unique_site_id_key).points, unique_ids)
+
+
+def test_spot_no_unique_id_key_exception(spot_data):
+    """Test an exception is raised if unique_site_ids are provided but no
+    unique_site_id_key is provided."""
+
+    wmo_ids = ["00009", "00008", "00007", "00006"]
+    unique_ids = ["00000020", "00000100", "00005000", "00999999"]
+
+    msg = "A unique_site_id_key must be provided if a unique_site_id"
+    with pytest.raises(ValueError, match=msg):
+        set_up_spot_variable_cube(spot_data, wmo_ids=wmo_ids, unique_site_id=unique_ids)
+
+
+# Percentiles shared by the gridded and spot percentile cube tests
+PERCENTILES = np.array([20, 50, 80])
+PERCENTILES.setflags(write=False)
+
+
+class Test_set_up_percentile_cube(unittest.TestCase):
     """Test the set_up_percentile_cube function"""
 
-    def setUp(self):
-        """Set up simple array of percentile-type data"""
-        self.data = np.array(
+    @classmethod
+    def setUpClass(cls):
+        """Set up simple array of percentile-type data, shared by all of the
+        tests in the class"""
+        cls.data = np.array(
             [
                 [[273.5, 275.1, 274.9], [274.2, 274.8, 274.1]],
                 [[274.2, 276.4, 275.5], [275.1, 276.8, 274.6]],
@@ -925,21 +888,21 @@ class Test_set_up_percentile_cube(IrisTest):
             ],
             dtype=np.float32,
         )
-        self.percentiles = np.array([20, 50, 80])
+        cls.data.setflags(write=False)
 
     def test_defaults(self):
         """Test default arguments produce cube with expected dimensions
         and metadata"""
-        result = set_up_percentile_cube(self.data, self.percentiles)
+        result = set_up_percentile_cube(self.data, PERCENTILES)
         perc_coord = result.coord("percentile")
-        self.assertArrayEqual(perc_coord.points, self.percentiles)
+        assert_array_equal(perc_coord.points, PERCENTILES)
         self.assertEqual(perc_coord.units, "%")
         check_mandatory_standards(result)
 
     def test_standard_grid_metadata(self):
         """Test standard grid metadata"""
         result = set_up_percentile_cube(
-            self.data, self.percentiles, standard_grid_metadata="uk_ens"
+            self.data, PERCENTILES, standard_grid_metadata="uk_ens"
         )
         self.assertEqual(result.attributes["mosg__grid_type"], "standard")
         self.assertEqual(result.attributes["mosg__grid_version"], "1.3.0")
@@ -949,18 +912,59 @@ class Test_set_up_percentile_cube(IrisTest):
     def test_single_percentile(self):
         """Test a cube with one percentile correctly stores this as a scalar
         coordinate"""
-        result = set_up_percentile_cube(self.data[1:2], self.percentiles[1:2])
+        result = set_up_percentile_cube(self.data[1:2], PERCENTILES[1:2])
         dim_coords = get_dim_coord_names(result)
         self.assertNotIn("percentile", dim_coords)
 
+    def test_cached_template(self):
+        """Test that a cube copied from a cached template is identical to one
+        built directly, and that the template holds no full size data"""
+        kwargs = {"name": "wind_speed", "units": "m s-1"}
+        _template_percentile_cube.cache_clear()
+        set_up_percentile_cube(self.data, PERCENTILES, **kwargs)
+        result = set_up_percentile_cube(self.data, PERCENTILES, **kwargs)
+        self.assertEqual(_template_percentile_cube.cache_info().hits, 1)
+        expected = _construct_percentile_cube(
+            set_up_variable_cube, self.data, PERCENTILES, **kwargs
+        )
+        self.assertEqual(
+            result.xml(checksum=True, byteorder=False),
+            expected.xml(checksum=True, byteorder=False),
+        )
+        template = _template_percentile_cube(
+            set_up_variable_cube,
+            self.data.shape,
+            self.data.dtype.str,
+            PERCENTILES.dtype.str,
+            tuple(PERCENTILES.tolist()),
+            tuple(sorted(kwargs.items())),
+        )
+        self.assertEqual(template.data.strides, (0, 0, 0))
+
+    def test_uncached_arguments(self):
+        """Test that masked data and unhashable keyword arguments bypass the
+        template cache"""
+        _template_percentile_cube.cache_clear()
+        masked_data = np.ma.masked_less(self.data, 274.0)
+        result = set_up_percentile_cube(masked_data, PERCENTILES)
+        self.assertIsInstance(result.data, np.ma.MaskedArray)
+        assert_array_equal(result.data.mask, masked_data.mask)
+        result = set_up_percentile_cube(
+            self.data, PERCENTILES, attributes={"source": "test"}
+        )
+        self.assertEqual(result.attributes["source"], "test")
+        self.assertEqual(_template_percentile_cube.cache_info().currsize, 0)
+
 
-class Test_set_up_spot_percentile_cube(IrisTest):
+class Test_set_up_spot_percentile_cube(unittest.TestCase):
     """Test the set_up_spot_percentile_cube function. These tests are largely
     the same as for the gridded case, omitting the grid metadata check."""
 
-    def setUp(self):
-        """Set up simple array of percentile-type data"""
-        self.data = np.array(
+    @classmethod
+    def setUpClass(cls):
+        """Set up simple array of percentile-type data, shared by all of the
+        tests in the class"""
+        cls.data = np.array(
             [
                 [273.5, 275.1, 274.9, 272.0],
                 [274.2, 276.4, 275.5, 274.5],
@@ -968,31 +972,33 @@ class Test_set_up_spot_percentile_cube(IrisTest):
             ],
             dtype=np.float32,
         )
-        self.percentiles = np.array([20, 50, 80])
+        cls.data.setflags(write=False)
 
     def test_defaults(self):
         """Test default arguments produce cube with expected dimensions
         and metadata"""
-        result = set_up_spot_percentile_cube(self.data, self.percentiles)
+        result = set_up_spot_percentile_cube(self.data, PERCENTILES)
         perc_coord = result.coord("percentile")
-        self.assertArrayEqual(perc_coord.points, self.percentiles)
+        assert_array_equal(perc_coord.points, PERCENTILES)
         self.assertEqual(perc_coord.units, "%")
         check_mandatory_standards(result)
 
     def test_single_percentile(self):
         """Test a cube with one percentile correctly stores this as a scalar
         coordinate"""
-        result = set_up_spot_percentile_cube(self.data[1:2], self.percentiles[1:2])
+        result = set_up_spot_percentile_cube(self.data[1:2], PERCENTILES[1:2])
         dim_coords = get_dim_coord_names(result)
         self.assertNotIn("percentile", dim_coords)
 
 
-class Test_set_up_probability_cube(IrisTest):
+class Test_set_up_probability_cube(unittest.TestCase):
     """Test the set_up_probability_cube function"""
 
-    def setUp(self):
-        """Set up array of exceedance probabilities"""
-        self.data = np.array(
+    @classmethod
+    def setUpClass(cls):
+        """Set up array of exceedance probabilities, shared by all of the tests
+        in the class"""
+        cls.data = np.array(
             [
                 [[1.0, 1.0, 0.9], [0.9, 0.9, 0.8]],
                 [[0.8, 0.8, 0.7], [0.7, 0.6, 0.4]],
@@ -1001,7 +1007,11 @@ class Test_set_up_probability_cube(IrisTest):
             ],
             dtype=np.float32,
         )
-        self.thresholds = np.array([275.0, 275.5, 276.0, 276.5], dtype=np.float32)
+        cls.thresholds = np.array([275.0, 275.5, 276.0, 276.5], dtype=np.float32)
+        cls.flipped_data = np.ascontiguousarray(np.flipud(cls.data))
+        cls.data.setflags(write=False)
+        cls.thresholds.setflags(write=False)
+        cls.flipped_data.setflags(write=False)
 
     def test_defaults(self):
         """Test default arguments produce cube with expected dimensions
@@ -1012,7 +1022,7 @@ class Test_set_up_probability_cube(IrisTest):
             result.name(), "probability_of_air_temperature_above_threshold"
         )
         self.assertEqual(result.units, "1")
-        self.assertArrayEqual(thresh_coord.points, self.thresholds)
+        assert_array_equal(thresh_coord.points, self.thresholds)
         self.assertEqual(thresh_coord.name(), "air_temperature")
         self.assertEqual(thresh_coord.var_name, "threshold")
         self.assertEqual(thresh_coord.units, "K")
@@ -1024,15 +1034,12 @@ class Test_set_up_probability_cube(IrisTest):
 
     def test_relative_to_threshold(self):
         """Test ability to reset the "spp__relative_to_threshold" attribute"""
-        data = np.flipud(self.data)
         result = set_up_probability_cube(
-            data, self.thresholds, spp__relative_to_threshold="less_than"
-        )
-        self.assertEqual(len(result.coord(var_name="threshold").attributes), 1)
-        self.assertEqual(
-            result.coord(var_name="threshold").attributes["spp__relative_to_threshold"],
-            "less_than",
+            self.flipped_data, self.thresholds, spp__relative_to_threshold="less_than"
         )
+        thresh_attributes = result.coord(var_name="threshold").attributes
+        self.assertEqual(len(thresh_attributes), 1)
+        self.assertEqual(thresh_attributes["spp__relative_to_threshold"], "less_than")
 
     def test_relative_to_threshold_set(self):
         """Test that an error is raised if the "spp__relative_to_threshold"
@@ -1073,17 +1080,23 @@ class Test_set_up_probability_cube(IrisTest):
         self.assertEqual(thresh_coord.var_name, "threshold")
 
 
-class Test_set_up_spot_probability_cube(IrisTest):
+class Test_set_up_spot_probability_cube(unittest.TestCase):
     """Test the set_up_spot_probability_cube function. These tests are largely
     the same as for the gridded case, omitting the grid metadata check."""
 
-    def setUp(self):
-        """Set up array of exceedance probabilities"""
-        self.data = np.array(
+    @classmethod
+    def setUpClass(cls):
+        """Set up array of exceedance probabilities, shared by all of the tests
+        in the class"""
+        cls.data = np.array(
             [[1.0, 1.0, 0.9, 0.9], [0.8, 0.8, 0.7, 0.8], [0.6, 0.4, 0.3, 0.3]],
             dtype=np.float32,
         )
-        self.thresholds = np.array([275.0, 275.5, 276.0], dtype=np.float32)
+        cls.thresholds = np.array([275.0, 275.5, 276.0], dtype=np.float32)
+        cls.flipped_data = np.ascontiguousarray(np.flipud(cls.data))
+        cls.data.setflags(write=False)
+        cls.thresholds.setflags(write=False)
+        cls.flipped_data.setflags(write=False)
 
     def test_defaults(self):
         """Test default arguments produce cube with expected dimensions
@@ -1094,7 +1107,7 @@ class Test_set_up_spot_probability_cube(IrisTest):
             result.name(), "probability_of_air_temperature_above_threshold"
         )
         self.assertEqual(result.units, "1")
-        self.assertArrayEqual(thresh_coord.points, self.thresholds)
+        assert_array_equal(thresh_coord.points, self.thresholds)
         self.assertEqual(thresh_coord.name(), "air_temperature")
         self.assertEqual(thresh_coord.var_name, "threshold")
         self.assertEqual(thresh_coord.units, "K")
@@ -1106,15 +1119,12 @@ class Test_set_up_spot_probability_cube(IrisTest):
 
     def test_relative_to_threshold(self):
         """Test ability to reset the "spp__relative_to_threshold" attribute"""
-        data = np.flipud(self.data)
         result = set_up_spot_probability_cube(
-            data, self.thresholds, spp__relative_to_threshold="less_than"
-        )
-        self.assertEqual(len(result.coord(var_name="threshold").attributes), 1)
-        self.assertEqual(
-            result.coord(var_name="threshold").attributes["spp__relative_to_threshold"],
-            "less_than",
+            self.flipped_data, self.thresholds, spp__relative_to_threshold="less_than"
         )
+        thresh_attributes = result.coord(var_name="threshold").attributes
+        self.assertEqual(len(thresh_attributes), 1)
+        self.assertEqual(thresh_attributes["spp__relative_to_threshold"], "less_than")
 
     def test_relative_to_threshold_set(self):
         """Test that an error is raised if the "spp__relative_to_threshold"
@@ -1133,18 +1143,31 @@ class Test_set_up_spot_probability_cube(IrisTest):
         self.assertNotIn("air_temperature", dim_coords)
 
 
-class Test_add_coordinate(IrisTest):
+# Time points added by the add_coordinate tests, and the forecast periods
+# expected for them from the 2017-10-09 21Z forecast reference time of the
+# input cube
+DATETIME_POINTS = (datetime(2017, 10, 10, 3, 0), datetime(2017, 10, 10, 4, 0))
+EXPECTED_FP_POINTS = 3600 * np.array([6, 7], dtype=np.int64)
+EXPECTED_FP_POINTS.setflags(write=False)
+
+
+class Test_add_coordinate(unittest.TestCase):
     """Test the add_coordinate utility"""
 
-    def setUp(self):
-        """Set up new coordinate descriptors"""
-        self.height_points = np.arange(100.0, 1001.0, 100.0)
-        self.height_unit = "metres"
-        self.input_cube = set_up_variable_cube(
-            np.ones((3, 4), dtype=np.float32),
+    @classmethod
+    def setUpClass(cls):
+        """Set up new coordinate descriptors and an input cube, shared by all
+        of the tests in the class"""
+        cls.height_points = np.arange(100.0, 1001.0, 100.0)
+        cls.height_unit = "metres"
+        cls.ones = np.ones((3, 4), dtype=np.float32)
+        cls.input_cube = set_up_variable_cube(
+            cls.ones,
             time=datetime(2017, 10, 10, 1, 0),
             frt=datetime(2017, 10, 9, 21, 0),
         )
+        cls.height_points.setflags(write=False)
+        cls.ones.setflags(write=False)
 
     def test_basic(self):
         """Test addition of a leading height coordinate"""
@@ -1153,10 +1176,11 @@ class Test_add_coordinate(IrisTest):
         )
         self.assertIsInstance(result, iris.cube.Cube)
         self.assertSequenceEqual(result.shape, (10, 3, 4))
-        self.assertEqual(result.coord_dims("height"), (0,))
-        self.assertArrayAlmostEqual(result.coord("height").points, self.height_points)
-        self.assertEqual(result.coord("height").dtype, np.float32)
-        self.assertEqual(result.coord("height").units, self.height_unit)
+        height_coord = result.coord("height")
+        self.assertEqual(result.coord_dims(height_coord), (0,))
+        assert_array_almost_equal(height_coord.points, self.height_points)
+        self.assertEqual(height_coord.dtype, np.float32)
+        self.assertEqual(height_coord.units, self.height_unit)
         check_mandatory_standards(result)
 
     def test_adding_coordinate_with_attribute(self):
@@ -1171,12 +1195,13 @@ class Test_add_coordinate(IrisTest):
             attributes=height_attribute,
         )
         self.assertIsInstance(result, iris.cube.Cube)
-        self.assertEqual(result.coord_dims("height"), (0,))
-        self.assertEqual(result.coord("height").attributes, height_attribute)
+        height_coord = result.coord("height")
+        self.assertEqual(result.coord_dims(height_coord), (0,))
+        self.assertEqual(height_coord.attributes, height_attribute)
 
     def test_reorder(self):
         """Test new coordinate can be placed in different positions"""
-        input_cube = set_up_variable_cube(np.ones((4, 3, 4), dtype=np.float32))
+        input_cube = set_up_variable_cube(np.broadcast_to(self.ones, (4, 3, 4)))
         result = add_coordinate(
             input_cube,
             self.height_points,
@@ -1200,31 +1225,27 @@ class Test_add_coordinate(IrisTest):
 
     def test_datetime(self):
         """Test a leading time coordinate can be added successfully"""
-        datetime_points = [datetime(2017, 10, 10, 3, 0), datetime(2017, 10, 10, 4, 0)]
         result = add_coordinate(
-            self.input_cube, datetime_points, "time", is_datetime=True
+            self.input_cube, DATETIME_POINTS, "time", is_datetime=True
         )
         # check time is now the leading dimension
-        self.assertEqual(result.coord_dims("time"), (0,))
-        self.assertEqual(len(result.coord("time").points), 2)
+        time_coord = result.coord("time")
+        self.assertEqual(result.coord_dims(time_coord), (0,))
+        self.assertEqual(len(time_coord.points), 2)
         # check forecast period has been updated
-        expected_fp_points = 3600 * np.array([6, 7], dtype=np.int64)
-        self.assertArrayAlmostEqual(
-            result.coord("forecast_period").points, expected_fp_points
+        assert_array_almost_equal(
+            result.coord("forecast_period").points, EXPECTED_FP_POINTS
         )
 
     def test_datetime_no_fp(self):
         """Test a leading time coordinate can be added successfully when there
         is no forecast period on the input cube"""
-        self.input_cube.remove_coord("forecast_period")
-        datetime_points = [datetime(2017, 10, 10, 3, 0), datetime(2017, 10, 10, 4, 0)]
-        result = add_coordinate(
-            self.input_cube, datetime_points, "time", is_datetime=True
-        )
+        input_cube = self.input_cube.copy()
+        input_cube.remove_coord("forecast_period")
+        result = add_coordinate(input_cube, DATETIME_POINTS, "time", is_datetime=True)
         # check a forecast period coordinate has been added
-        expected_fp_points = 3600 * np.array([6, 7], dtype=np.int64)
-        self.assertArrayAlmostEqual(
-            result.coord("forecast_period").points, expected_fp_points
+        assert_array_almost_equal(
+            result.coord("forecast_period").points, EXPECTED_FP_POINTS
         )
 
     def test_time_points(self):
@@ -1241,10 +1262,8 @@ class Test_add_coordinate(IrisTest):
             coord_units=TIME_COORDS["time"].units,
             dtype=TIME_COORDS["time"].dtype,
         )
-        self.assertArrayEqual(result.coord("time").points, time_points)
-        self.assertArrayEqual(
-            result.coord("forecast_period").points, expected_fp_points
-        )
+        assert_array_equal(result.coord("time").points, time_points)
+        assert_array_equal(result.coord("forecast_period").points, expected_fp_points)
 
 
 if __name__ == "__main__":
@@ -53,6 +53,33 @@ class Test_cycletime_to_datetime(IrisTest):
         result = cycletime_to_datetime(cycletime, cycletime_format="%Y%m%d%H%M")
         self.assertEqual(result, dt)
 
+    def test_invalid_cycletime(self):
+        """Test that a cycletime not matching the default format raises an
+        error."""
+        for cycletime in (
+            "20171122X0100Z",
+            "2017112T01000Z",
+            "20171322T0100Z",
+            "2017112\u00b2T0100Z",
+        ):
+            with self.assertRaises(ValueError):
+                cycletime_to_datetime(cycletime)
+
+    def test_non_ascii_digits(self):
+        """Test that a cycletime with non-ASCII decimal digits is parsed in
+        the same way as by strptime."""
+        cycletime = "\uff12\uff10\uff11\uff171122T0100Z"
+        result = cycletime_to_datetime(cycletime)
+        self.assertEqual(result, datetime.strptime(cycletime, "%Y%m%dT%H%MZ"))
+
+    def test_repeated_cycletime_cached(self):
+        """Test that the datetime is cached for a repeated cycletime."""
+        cycletime_to_datetime.cache_clear()
+        first = cycletime_to_datetime("20171122T0100Z")
+        second = cycletime_to_datetime("20171122T0100Z")
+        self.assertIs(second, first)
+        self.assertEqual(cycletime_to_datetime.cache_info().hits, 1)
+
 
 class Test_datetime_to_cycletime(IrisTest):
 
@@ -121,6 +148,18 @@ class Test_cycletime_to_number(IrisTest):
         result = cycletime_to_number(cycletime, calendar="365_day")
         self.assertAlmostEqual(result, dt)
 
+    def test_repeated_cycletime_cached(self):
+        """Test that the number is cached for a repeated cycletime, and not
+        reused for a different calendar."""
+        cycletime_to_number.cache_clear()
+        cycletime = "20171122T0000Z"
+        first = cycletime_to_number(cycletime)
+        second = cycletime_to_number(cycletime)
+        result_365_day = cycletime_to_number(cycletime, calendar="365_day")
+        self.assertIs(second, first)
+        self.assertEqual(cycletime_to_number.cache_info().hits, 1)
+        self.assertAlmostEqual(result_365_day, 419520.0)
+
 
 class Test_iris_time_to_datetime(IrisTest):
     """Test iris_time_to_datetime"""
@@ -3,6 +3,7 @@
 # This file is part of IMPROVER and is released under a BSD 3-Clause license.
 # See LICENSE in the root of the repository for full licensing details.
 """Unit tests for the "forecast_reference_enforcement.normalise_to_reference" function."""
+
 import iris
 import numpy as np
 import pytest
@@ -12,63 +13,85 @@ from improver.synthetic_data.set_up_test_cubes import (
     set_up_probability_cube,
 )
 from improver.utilities.forecast_reference_enforcement import normalise_to_reference
+from improver_tests import assert_cubelist_equal
+
+
+def _copy_cubes(cubes):
+    """Copy a cube or each cube in a cubelist, so that a test can modify the
+    cubes without changing the module-scoped fixtures."""
+    if isinstance(cubes, iris.cube.Cube):
+        return cubes.copy()
+    return iris.cube.CubeList(cube.copy() for cube in cubes)
 
 
-@pytest.fixture
+def _phase_data(values: list, shape: tuple, scaling: float) -> np.ndarray:
+    """Create float32 data for each phase, filled with the value for that phase
+    and with the second index of the leading dimension multiplied by scaling.
+    The data for all of the phases are returned stacked in a single array.
+    """
+    data = np.empty((len(values), *shape), dtype=np.float32)
+    data[...] = np.reshape(values, (-1,) + (1,) * len(shape))
+    data[:, 1] *= scaling
+    return data
+
+
+@pytest.fixture(scope="module")
 def shape() -> tuple:
     """Define shape of all cubes used in these tests."""
     output = (2, 3, 3)
     return output
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def percentiles() -> list:
     """Define the percentiles of all percentile cubes used in these tests."""
     return [40.0, 60.0]
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def thresholds() -> list:
     """Define the thresholds of all probability cubes used in these tests."""
     return [1.0, 2.0]
 
 
-@pytest.fixture
-def input_percentile_cubes(shape, percentiles) -> iris.cube.CubeList:
-    """Create cubelist used as input for tests. Each cube contains percentile
-    forecasts.
+@pytest.fixture(scope="module")
+def percentile_cube_templates(shape, percentiles) -> iris.cube.CubeList:
+    """Create the rain, sleet and snow percentile cubes, with zero data, from
+    which the input and expected percentile cubes are copied.
     """
-    rain_data = 0.5 * 4 * np.ones(shape, dtype=np.float32)
-    sleet_data = 0.4 * 4 * np.ones(shape, dtype=np.float32)
-    snow_data = 0.1 * 4 * np.ones(shape, dtype=np.float32)
-
-    for data in [rain_data, sleet_data, snow_data]:
-        data[1, :, :] = 1.5 * data[1, :, :]
+    data = np.zeros(shape, dtype=np.float32)
 
     rain_cube = set_up_percentile_cube(
-        rain_data, percentiles, name="rainfall_rate", units="m s-1"
+        data, percentiles, name="rainfall_rate", units="m s-1"
     )
     sleet_cube = set_up_percentile_cube(
-        sleet_data, percentiles, name="lwe_sleetfall_rate", units="m s-1"
+        data, percentiles, name="lwe_sleetfall_rate", units="m s-1"
     )
     snow_cube = set_up_percentile_cube(
-        snow_data, percentiles, name="lwe_snowfall_rate", units="m s-1"
+        data, percentiles, name="lwe_snowfall_rate", units="m s-1"
     )
 
     return iris.cube.CubeList([rain_cube, sleet_cube, snow_cube])
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
+def input_percentile_cubes(shape, percentile_cube_templates) -> iris.cube.CubeList:
+    """Create cubelist used as input for tests. Each cube contains percentile
+    forecasts.
+    """
+    phase_data = _phase_data([0.5 * 4, 0.4 * 4, 0.1 * 4], shape, 1.5)
+    return iris.cube.CubeList(
+        cube.copy(data=data)
+        for cube, data in zip(percentile_cube_templates, phase_data)
+    )
+
+
+@pytest.fixture(scope="module")
 def input_probability_cubes(shape, thresholds) -> iris.cube.CubeList:
     """Create cubelist used as input for tests. Each cube contains probability
     forecasts.
     """
-    rain_data = 0.25 * np.ones(shape, dtype=np.float32)
-    sleet_data = 0.2 * np.ones(shape, dtype=np.float32)
-    snow_data = 0.05 * np.ones(shape, dtype=np.float32)
-
-    for data in [rain_data, sleet_data, snow_data]:
-        data[1, :, :] = 2 * data[1, :, :]
+    rain_data, sleet_data, snow_data = _phase_data([0.25, 0.2, 0.05], shape, 2)
 
     rain_cube = set_up_probability_cube(
         rain_data, thresholds, variable_name="rainfall_rate", threshold_units="m s-1"
@@ -89,26 +112,26 @@ def input_probability_cubes(shape, thresholds) -> iris.cube.CubeList:
     return iris.cube.CubeList([rain_cube, sleet_cube, snow_cube])
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def reference_percentile_cube(shape, percentiles) -> iris.cube.Cube:
     """Create reference cube used as input for tests. Cube contains a percentile
     forecast.
     """
-    precip_data = 8 * np.ones(shape, dtype=np.float32)
-    precip_data[1, :, :] = 1.5 * precip_data[1, :, :]
+    precip_data = np.full(shape, 8, dtype=np.float32)
+    precip_data[1, :, :] *= 1.5
 
     return set_up_percentile_cube(
         precip_data, percentiles, name="lwe_precipitation_rate", units="m s-1"
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def reference_probability_cube(shape, thresholds) -> iris.cube.Cube:
     """Create reference cube used as input for tests. Cube contains a probability
     forecast.
     """
-    precip_data = 0.4 * np.ones(shape, dtype=np.float32)
-    precip_data[1, :, :] = 2 * precip_data[1, :, :]
+    precip_data = np.full(shape, 0.4, dtype=np.float32)
+    precip_data[1, :, :] *= 2
 
     return set_up_probability_cube(
         precip_data,
@@ -118,42 +141,26 @@ def reference_probability_cube(shape, thresholds) -> iris.cube.Cube:
     )
 
 
-@pytest.fixture()
-def expected_percentile_cubes(shape, percentiles) -> iris.cube.CubeList:
+@pytest.fixture(scope="module")
+def expected_percentile_cubes(shape, percentile_cube_templates) -> iris.cube.CubeList:
     """Create cubelist containing expected outputs of tests. Each cube contains
     percentile forecasts.
     """
-    rain_data = 0.5 * 8 * np.ones(shape, dtype=np.float32)
-    sleet_data = 0.4 * 8 * np.ones(shape, dtype=np.float32)
-    snow_data = 0.1 * 8 * np.ones(shape, dtype=np.float32)
-
-    for data in [rain_data, sleet_data, snow_data]:
-        data[1, :, :] = 1.5 * data[1, :, :]
-
-    rain_cube = set_up_percentile_cube(
-        rain_data, percentiles, name="rainfall_rate", units="m s-1"
+    phase_data = _phase_data([0.5 * 8, 0.4 * 8, 0.1 * 8], shape, 1.5)
+    return iris.cube.CubeList(
+        cube.copy(data=data)
+        for cube, data in zip(percentile_cube_templates, phase_data)
     )
-    sleet_cube = set_up_percentile_cube(
-        sleet_data, percentiles, name="lwe_sleetfall_rate", units="m s-1"
-    )
-    snow_cube = set_up_percentile_cube(
-        snow_data, percentiles, name="lwe_snowfall_rate", units="m s-1"
-    )
-
-    return iris.cube.CubeList([rain_cube, sleet_cube, snow_cube])
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def expected_probability_cubes(shape, thresholds) -> iris.cube.CubeList:
     """Create cubelist containing expected outputs of tests. Each cube contains
     probability forecasts.
     """
-    rain_data = 0.5 * 0.4 * np.ones(shape, dtype=np.float32)
-    sleet_data = 0.4 * 0.4 * np.ones(shape, dtype=np.float32)
-    snow_data = 0.1 * 0.4 * np.ones(shape, dtype=np.float32)
-
-    for data in [rain_data, sleet_data, snow_data]:
-        data[1, :, :] = 2 * data[1, :, :]
+    rain_data, sleet_data, snow_data = _phase_data(
+        [0.5 * 0.4, 0.4 * 0.4, 0.1 * 0.4], shape, 2
+    )
 
     rain_cube = set_up_probability_cube(
         rain_data, thresholds, variable_name="rainfall_rate", threshold_units="m s-1"
@@ -181,7 +188,7 @@ def test_percentile_basic(
     output = normalise_to_reference(input_percentile_cubes, reference_percentile_cube)
     output_sum = output[0].data + output[1].data + output[2].data
 
-    assert output == expected_percentile_cubes
+    assert_cubelist_equal(output, expected_percentile_cubes)
     assert np.array_equal(output_sum, reference_percentile_cube.data)
 
 
@@ -192,7 +199,7 @@ def test_probability_basic(
     output = normalise_to_reference(input_probability_cubes, reference_probability_cube)
     output_sum = output[0].data + output[1].data + output[2].data
 
-    assert output == expected_probability_cubes
+    assert_cubelist_equal(output, expected_probability_cubes)
     assert np.array_equal(output_sum, reference_probability_cube.data)
 
 
@@ -206,6 +213,8 @@ def test_zero_total(
     """Test cubes are updated correctly when some values in input_cubes are zero in
     all input cubes.
     """
+    input_percentile_cubes = _copy_cubes(input_percentile_cubes)
+    expected_percentile_cubes = _copy_cubes(expected_percentile_cubes)
     for index in range(len(input_percentile_cubes)):
         input_percentile_cubes[index].data[0, :, :] = 0.0
         expected_percentile_cubes[index].data[0, :, :] = 0.0
@@ -226,10 +235,32 @@ def test_zero_total(
         reference_with_zeroes = reference_percentile_cube.copy()
         reference_with_zeroes.data[0, :, :] = 0.0
 
-        assert output == expected_percentile_cubes
+        assert_cubelist_equal(output, expected_percentile_cubes)
         assert np.array_equal(output_sum, reference_with_zeroes.data)
 
 
+@pytest.mark.parametrize("masked_index", (0, 1, 2))
+def test_masked_input(input_percentile_cubes, reference_percentile_cube, masked_index):
+    """Test that a point masked in any one of the input cubes is masked in all
+    of the output cubes, as the total is not known there."""
+    input_percentile_cubes = _copy_cubes(input_percentile_cubes)
+    masked_cube = input_percentile_cubes[masked_index]
+    masked_cube.data = np.ma.masked_array(masked_cube.data, mask=False)
+    masked_cube.data[0, 0, 0] = np.ma.masked
+    expected_mask = np.zeros(masked_cube.shape, dtype=bool)
+    expected_mask[0, 0, 0] = True
+
+    output = normalise_to_reference(input_percentile_cubes, reference_percentile_cube)
+
+    for cube in output:
+        assert np.ma.isMaskedArray(cube.data)
+        np.testing.assert_array_equal(np.ma.getmaskarray(cube.data), expected_mask)
+    output_sum = output[0].data + output[1].data + output[2].data
+    np.testing.assert_allclose(
+        output_sum.compressed(), reference_percentile_cube.data[~expected_mask]
+    )
+
+
 @pytest.mark.parametrize("cubes_length", (0, 1))
 def test_cubes_too_short(
     input_percentile_cubes, reference_percentile_cube, cubes_length
@@ -258,6 +289,7 @@ def test_coord_values_mismatch(input_percentile_cubes, reference_percentile_cube
     """Test that an error is raised when dimension coordinates of input cubes don't
     match.
     """
+    reference_percentile_cube = _copy_cubes(reference_percentile_cube)
     reference_percentile_cube.coord("percentile").points = np.array(
         [50.0, 70.0], dtype=np.float32
     )
@@ -272,6 +304,7 @@ def test_coord_names_mismatch(input_percentile_cubes, reference_percentile_cube)
     """Test that an error is raised when input cubes have different dimension
     coordinate names.
     """
+    input_percentile_cubes = _copy_cubes(input_percentile_cubes)
     input_percentile_cubes[0].coord("percentile").rename("realizations")
 
     with pytest.raises(
@@ -2,120 +2,117 @@
 #
 # This file is part of IMPROVER and is released under a BSD 3-Clause license.
 # See LICENSE in the root of the repository for full licensing details.
-"""Unit tests for plugin wind_downscaling.FrictionVelocity"""
-
-import unittest
+"""Unit tests for plugin wind_downscaling.FrictionVelocity. Note that in the
+future, use of the Real Missing Data Indicator (RMDI) constant is due to be
+deprecated in favour of np.nan"""
 
 import numpy as np
-from iris.tests import IrisTest
+import pytest
+from numpy.testing import assert_array_almost_equal
 
 from improver.constants import RMDI
 from improver.wind_calculations.wind_downscaling import FrictionVelocity
 
-
-class Test_process(IrisTest):
-
-    """Test the creation of friction velocity 2D arrays. Note that in the
-    future, use of the Real Missing Data Indicator (RMDI) constant is due to be
-    deprecated in favour of np.nan"""
-
-    def setUp(self):
-        """Creates wind-speed, height, veg roughness and mask 2D arrays."""
-
-        n_x, n_y = 4, 4  # Set array dimensions.
-
-        # Wind speed=u_href=10m/s  Height=h_ref=20m
-        self.u_href = np.full([n_y, n_x], 10, dtype=float)
-        self.h_ref = np.full([n_y, n_x], 20, dtype=float)
-        # Vegetative roughness = 0.5m
-        self.z_0 = np.full([n_y, n_x], 0.5, dtype=float)
-
-        # Mask for land/sea - True for land-points, false for sea.
-        self.mask = np.full([n_y, n_x], False, dtype=bool)
-        # Mask has 'land' in centre bounded by sea points.
-        self.mask[1 : n_y - 1, 1 : n_x - 1] = True
-
-    def test_returns_expected_values(self):
-        """Test that the function returns correct 2D array of floats. """
-
-        # Equation is (K=0.4): ustar = K * (u_href / ln(h_ref / z_0))
-        expected_out = np.array(
-            [
-                [RMDI, RMDI, RMDI, RMDI],
-                [RMDI, 1.08434, 1.08434, RMDI],
-                [RMDI, 1.08434, 1.08434, RMDI],
-                [RMDI, RMDI, RMDI, RMDI],
-            ]
-        )
-
-        result = FrictionVelocity(
-            self.u_href, self.h_ref, self.z_0, self.mask
-        ).process()
-
-        self.assertIsInstance(result, np.ndarray)
-        self.assertArrayAlmostEqual(result, expected_out)
-
-    def test_handles_nan_values(self):
-        """Test that the function accepts NaN values correctly. """
-
-        self.u_href[1, 1] = np.nan  # Adds NaN value
-
-        expected_out = np.array(
-            [
-                [RMDI, RMDI, RMDI, RMDI],
-                [RMDI, np.nan, 1.08434, RMDI],
-                [RMDI, 1.08434, 1.08434, RMDI],
-                [RMDI, RMDI, RMDI, RMDI],
-            ]
-        )
-
-        result = FrictionVelocity(
-            self.u_href, self.h_ref, self.z_0, self.mask
-        ).process()
-
-        self.assertIsInstance(result, np.ndarray)
-        self.assertArrayAlmostEqual(result, expected_out)
-
-    def test_handles_zero_values(self):
-        """Function calculates log(href/z_0) - test that the function accepts
-           zero values in h_ref and z_0 and returns np.nan without crashing."""
-
-        h_ref_zeros = np.full_like(self.h_ref, 0)
-        z_0_zeros = np.full_like(self.z_0, 0)
-
-        expected_out = np.array(
-            [
-                [RMDI, RMDI, RMDI, RMDI],
-                [RMDI, np.nan, np.nan, RMDI],
-                [RMDI, np.nan, np.nan, RMDI],
-                [RMDI, RMDI, RMDI, RMDI],
-            ]
-        )
-
-        result = FrictionVelocity(
-            self.u_href, h_ref_zeros, z_0_zeros, self.mask
-        ).process()
-
-        self.assertIsInstance(result, np.ndarray)
-        self.assertArrayAlmostEqual(result, expected_out)
-
-    def test_handles_different_sized_arrays(self):
-        """Test when if different size arrays have been input"""
-        u_href = np.full([3, 3], 10, dtype=float)
-        msg = "Different size input arrays u_href, h_ref, z_0, mask"
-        with self.assertRaisesRegex(ValueError, msg):
-            FrictionVelocity(u_href, self.h_ref, self.z_0, self.mask).process()
-
-    def test_output_is_float32(self):
-        """Test that the plugin returns an array of float 32 type
-           even when the input arrays are double precision."""
-
-        result = FrictionVelocity(
-            self.u_href, self.h_ref, self.z_0, self.mask
-        ).process()
-
-        self.assertEqual(result.dtype, np.float32)
-
-
-if __name__ == "__main__":
-    unittest.main()
+# Equation is (K=0.4): ustar = K * (u_href / ln(h_ref / z_0))
+USTAR = 1.08434
+
+
+@pytest.fixture(name="inputs", scope="module")
+def inputs_fixture():
+    """Wind-speed, height, veg roughness and mask 2D arrays, which are shared
+    by the tests in this module so are read-only."""
+
+    n_x, n_y = 4, 4  # Set array dimensions.
+
+    # Wind speed=u_href=10m/s  Height=h_ref=20m
+    u_href = np.full([n_y, n_x], 10, dtype=np.float32)
+    h_ref = np.full([n_y, n_x], 20, dtype=np.float32)
+    # Vegetative roughness = 0.5m
+    z_0 = np.full([n_y, n_x], 0.5, dtype=np.float32)
+
+    # Mask for land/sea - True for land-points, false for sea.
+    mask = np.full([n_y, n_x], False, dtype=bool)
+    # Mask has 'land' in centre bounded by sea points.
+    mask[1 : n_y - 1, 1 : n_x - 1] = True
+
+    for array in (u_href, h_ref, z_0, mask):
+        array.flags.writeable = False
+    return u_href, h_ref, z_0, mask
+
+
+def _nan_wind_speed(u_href, h_ref, z_0):
+    """Add a NaN wind speed at one of the land points."""
+    u_href = u_href.copy()
+    u_href[1, 1] = np.nan
+    return u_href, h_ref, z_0
+
+
+def _zero_heights(u_href, h_ref, z_0):
+    """Set all of the heights and roughness lengths to zero."""
+    return u_href, np.zeros_like(h_ref), np.zeros_like(z_0)
+
+
+@pytest.mark.parametrize(
+    "mutate, expected_land",
+    (
+        (None, [[USTAR, USTAR], [USTAR, USTAR]]),
+        (_nan_wind_speed, [[np.nan, USTAR], [USTAR, USTAR]]),
+        (_zero_heights, [[np.nan, np.nan], [np.nan, np.nan]]),
+    ),
+)
+def test_returns_expected_values(inputs, mutate, expected_land):
+    """Test that the function returns correct 2D array of floats, including
+    that it accepts NaN wind speeds, and zero values in h_ref and z_0 for
+    which it returns np.nan without crashing."""
+    u_href, h_ref, z_0, mask = inputs
+    if mutate is not None:
+        u_href, h_ref, z_0 = mutate(u_href, h_ref, z_0)
+    expected_out = np.full(mask.shape, RMDI)
+    expected_out[1:3, 1:3] = expected_land
+
+    result = FrictionVelocity(u_href, h_ref, z_0, mask).process()
+
+    assert isinstance(result, np.ndarray)
+    assert_array_almost_equal(result, expected_out)
+
+
+def test_all_points_masked(inputs):
+    """Test that RMDI is returned everywhere if no points are to be
+    calculated."""
+    u_href, h_ref, z_0, mask = inputs
+    mask = np.full_like(mask, False)
+    result = FrictionVelocity(u_href, h_ref, z_0, mask).process()
+    assert result.dtype == np.float32
+    assert_array_almost_equal(result, np.full(mask.shape, RMDI))
+
+
+def test_no_points_masked(inputs):
+    """Test that friction velocities are returned everywhere if all
+    points are to be calculated."""
+    u_href, h_ref, z_0, mask = inputs
+    mask = np.full_like(mask, True)
+    result = FrictionVelocity(u_href, h_ref, z_0, mask).process()
+    assert result.dtype == np.float32
+    assert_array_almost_equal(result, np.full(mask.shape, USTAR), decimal=5)
+
+
+def test_handles_different_sized_arrays(inputs):
+    """Test when if different size arrays have been input"""
+    _, h_ref, z_0, mask = inputs
+    u_href = np.full([3, 3], 10, dtype=np.float32)
+    msg = "Different size input arrays u_href, h_ref, z_0, mask"
+    with pytest.raises(ValueError, match=msg):
+        FrictionVelocity(u_href, h_ref, z_0, mask).process()
+
+
+def test_output_is_float32(inputs):
+    """Test that the plugin returns an array of float 32 type
+    even when the input arrays are double precision."""
+    u_href, h_ref, z_0, mask = inputs
+    result = FrictionVelocity(
+        u_href.astype(np.float64),
+        h_ref.astype(np.float64),
+        z_0.astype(np.float64),
+        mask,
+    ).process()
+    assert result.dtype == np.float32